@@ -6,20 +6,31 @@ KoreaWorkingVisa API 모듈
 - JWT 토큰 기반 인증
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Header, UploadFile, File, Form, Request, Body
-from fastapi.responses import JSONResponse, RedirectResponse, FileResponse
-from typing import Optional, List
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Depends, Header, UploadFile, File, Form, Request, Body, BackgroundTasks, Query
+from fastapi import Response
+from fastapi.responses import JSONResponse, RedirectResponse, FileResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+import anyio.to_thread
+from typing import Optional, List, Literal
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from datetime import datetime, timedelta, date
+from decimal import Decimal
 import os
+import stat
 import json
 import hashlib
 import secrets
 import pymysql
 import pymysql.cursors
-import uuid
+from pymysql.constants import SERVER_STATUS
 import base64
 import httpx
+import time
+import threading
+import queue
+import collections
+import logging
+import weakref
 
 # JWT 관련 (python-jose)
 try:
@@ -37,6 +48,39 @@ except ImportError:
     BCRYPT_AVAILABLE = False
     print("⚠️ bcrypt not installed. Using simple hash fallback.")
 
+# 빠른 JSON 직렬화 (orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️ orjson not installed. Using standard json for responses.")
+
+# 비동기 파일 쓰기 (aiofiles)
+try:
+    import aiofiles
+    AIOFILES_AVAILABLE = True
+except ImportError:
+    AIOFILES_AVAILABLE = False
+    print("⚠️ aiofiles not installed. Upload writes will run in the threadpool.")
+
+# SIMD Base64 디코더 (pybase64)
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+    print("⚠️ pybase64 not installed. Using standard base64 decoder.")
+
+# Google ID 토큰 검증 (google-auth)
+try:
+    from google.oauth2 import id_token as google_id_token
+    from google.auth.transport import requests as google_requests
+    GOOGLE_AUTH_AVAILABLE = True
+except ImportError:
+    GOOGLE_AUTH_AVAILABLE = False
+    print("⚠️ google-auth not installed. Google ID token login disabled.")
+
 # ==================== 설정 ====================
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "kwv-secret-key-change-in-production-2026")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
@@ -49,26 +93,42 @@ GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
 LOCAL_UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "file_uploads")
 os.makedirs(LOCAL_UPLOAD_DIR, exist_ok=True)
 
+# 기본 업로드 카테고리 디렉터리 (시작 시 1회 생성)
+UPLOAD_CATEGORIES = ("temp", "general", "profile", "logos", "passport", "visa", "id_card", "insurance")
+for _category in UPLOAD_CATEGORIES:
+    os.makedirs(os.path.join(LOCAL_UPLOAD_DIR, _category), exist_ok=True)
+_upload_dirs_ready = set(UPLOAD_CATEGORIES)
+
+# 업로드 허용 MIME 타입
+ALLOWED_DOC_MIME = frozenset({'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'application/pdf'})
+ALLOWED_LOGO_MIME = frozenset({'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/svg+xml'})
+
 # 기본 비밀번호
 DEFAULT_PASSWORD = "kwv2026"
 
-# ==================== Router ====================
-router = APIRouter(prefix="/api/kwv", tags=["KoreaWorkingVisa"])
+logger = logging.getLogger("kwv-api")
 
 # ==================== Pydantic Models ====================
+# 공통 설정: 앞뒤 공백 제거 + 문자열 길이 상한 (대용량 필드는 Field로 개별 지정)
+_INPUT_MODEL_CONFIG = ConfigDict(str_strip_whitespace=True, str_max_length=256)
+
 class UserLogin(BaseModel):
+    model_config = _INPUT_MODEL_CONFIG
+
     email: str
     password: str
 
 class UserRegister(BaseModel):
-    email: str
+    model_config = _INPUT_MODEL_CONFIG
+
+    email: EmailStr
     name: str
     phone: Optional[str] = None
     address: Optional[str] = None
     language: Optional[str] = "en"
     user_type: Optional[str] = "applicant"  # applicant 또는 admin
     organization: Optional[str] = None  # 관리자: 소속 지역
-    profile_photo: Optional[str] = None  # Base64 또는 URL
+    profile_photo: Optional[str] = Field(default=None, max_length=10_000_000)  # Base64 또는 URL
     passport_copy_url: Optional[str] = None
     visa_copy_url: Optional[str] = None
     id_card_url: Optional[str] = None
@@ -76,12 +136,14 @@ class UserRegister(BaseModel):
     # Phase 2 추가
     nationality: Optional[str] = None  # 국적
     visa_type: Optional[str] = None  # 비자 유형 (E-8, E-9 등)
-    birth_date: Optional[str] = None  # 생년월일
+    birth_date: Optional[date] = None  # 생년월일
     gender: Optional[str] = None  # 성별
     target_local_government_id: Optional[int] = None  # 신청 대상 지자체
 
 class GoogleLoginRequest(BaseModel):
-    credential: Optional[str] = None  # Google ID token (legacy)
+    model_config = _INPUT_MODEL_CONFIG
+
+    credential: Optional[str] = Field(default=None, max_length=4096)  # Google ID token (legacy)
     email: Optional[str] = None
     name: Optional[str] = None
 
@@ -92,20 +154,152 @@ class TokenResponse(BaseModel):
     user: dict
 
 class ApplicantCreate(BaseModel):
+    model_config = _INPUT_MODEL_CONFIG
+
     nationality: str
     passport_number: str
-    birth_date: str
+    birth_date: date
     gender: str
     visa_type: str
     employer_name: Optional[str] = None
     job_category: Optional[str] = None
 
 class ApplicantStatusUpdate(BaseModel):
+    model_config = _INPUT_MODEL_CONFIG
+
     status: str  # pending, processing, approved, rejected
-    rejection_reason: Optional[str] = None
+    rejection_reason: Optional[str] = Field(default=None, max_length=2000)
 
 # ==================== 유틸리티 함수 ====================
 
+def _json_default(obj):
+    """orjson/json이 직접 처리하지 못하는 DB 값 변환 (Decimal, TIME 등)"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8', errors='replace')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def json_dumps_bytes(content) -> bytes:
+    """JSON 직렬화 (orjson 우선, 미설치 시 표준 json)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_json_default, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+def json_loads(data):
+    """JSON 파싱 (orjson 우선)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+class ORJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (datetime/date는 C 레벨에서 ISO 문자열로 직렬화)"""
+
+    def render(self, content) -> bytes:
+        return json_dumps_bytes(content)
+
+# ==================== Router ====================
+# dict/list 반환 핸들러도 기본으로 orjson 직렬화
+router = APIRouter(prefix="/api/kwv", tags=["KoreaWorkingVisa"], default_response_class=ORJSONResponse)
+
+# 외부 API 호출용 공유 HTTP 클라이언트 (Google OAuth, API 키 테스트) - TLS 연결 재사용
+_http_client = httpx.AsyncClient(timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20))
+
+@router.on_event("shutdown")
+async def _close_http_client():
+    await _http_client.aclose()
+
+def stream_json_rows(conn, cursor, row_to_item=None, batch_size: int = 200) -> StreamingResponse:
+    """실행된 (SS)커서 결과를 fetchmany로 읽어 JSON 배열로 스트리밍 - 전송 완료 후 연결 반환"""
+    def generate():
+        try:
+            yield b'['
+            first = True
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                if row_to_item:
+                    rows = [row_to_item(r) for r in rows]
+                body = b','.join(json_dumps_bytes(r) for r in rows)
+                yield body if first else b',' + body
+                first = False
+            yield b']'
+        finally:
+            cursor.close()
+            conn.close()
+    return StreamingResponse(generate(), media_type="application/json")
+
+def json_payload(content) -> tuple:
+    """JSON 본문 bytes + 약한 ETag (캐시에 그대로 저장해 재직렬화/재해시 방지)"""
+    body = json_dumps_bytes(content)
+    return body, 'W/"%s"' % hashlib.blake2s(body, digest_size=8).hexdigest()
+
+def json_payload_response(payload: tuple, if_none_match: Optional[str],
+                          cache_control: str = "private, no-cache") -> Response:
+    """json_payload 결과로 응답 생성 (If-None-Match 일치 시 본문 없이 304)"""
+    body, etag = payload
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (약한 비교, 목록/* 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    target = etag[2:] if etag.startswith('W/') else etag
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if (tag[2:] if tag.startswith('W/') else tag) == target:
+            return True
+    return False
+
+class _TTLCache:
+    """프로세스 내 TTL 캐시 (만료 시간 + 최대 개수 제한)"""
+
+    def __init__(self, maxsize: int = 128, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                # 만료된 항목 정리 후에도 가득 차면 가장 오래된 항목 제거
+                now = time.monotonic()
+                for k in [k for k, (_, exp) in self._data.items() if exp < now]:
+                    del self._data[k]
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)))
+            self._data[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+
+    def pop(self, key, default=None):
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
 def hash_password(password: str) -> str:
     """비밀번호 해시"""
     if BCRYPT_AVAILABLE:
@@ -118,7 +312,8 @@ def verify_password(password: str, hashed: str) -> bool:
     if BCRYPT_AVAILABLE:
         try:
             return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
-        except:
+        except (ValueError, TypeError):
+            # 잘못된 형식의 해시 (bcrypt가 아닌 값 등)
             return False
     else:
         return hashlib.sha256(password.encode()).hexdigest() == hashed
@@ -188,38 +383,231 @@ MOCK_MODE = os.getenv('KWV_MOCK_MODE', 'false').lower() == 'true'
 
 # Mock 데이터 (MOCK_MODE=true일 때만 사용)
 MOCK_USERS = {}
+_MOCK_USERS_BY_EMAIL = {}  # email → user (MOCK_USERS와 함께 갱신)
 MOCK_USER_ID_COUNTER = 1
 MOCK_APPLICATIONS = []
 
-def get_kwv_db_connection():
-    """KWV 데이터베이스 연결"""
-    if MOCK_MODE:
-        return None
+def _register_mock_user(user: dict):
+    """Mock 사용자 등록 (id/email 인덱스 동시 갱신)"""
+    MOCK_USERS[user["id"]] = user
+    _MOCK_USERS_BY_EMAIL[user["email"]] = user
+
+class _PooledConnection:
+    """풀에서 대여한 연결 - close() 호출 시 실제로 닫지 않고 풀에 반환"""
+
+    def __init__(self, pool, conn, created_at: float):
+        self._pool = pool
+        self._conn = conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool.release(conn, self._created_at)
+
+class _ConnectionPool:
+    """pymysql 연결 풀 (유휴 연결 최대 maxsize개 보관, 초과분은 닫음)"""
+
+    # 이 시간(초) 이상 유휴였던 연결은 대여 전에 ping으로 생존 확인
+    PING_AFTER_IDLE = 30
+    # 생성 후 이 시간(초)이 지난 연결은 반환 시 닫고 새로 연결 (wait_timeout보다 짧게)
+    RECYCLE_AFTER = 1800
+
+    def __init__(self, connect, maxsize: int):
+        self._connect = connect
+        self._idle = queue.LifoQueue(maxsize)
+
+    def acquire(self) -> _PooledConnection:
+        while True:
+            try:
+                conn, created_at, idle_since = self._idle.get_nowait()
+            except queue.Empty:
+                return _PooledConnection(self, self._connect(), time.monotonic())
+            if time.monotonic() - idle_since < self.PING_AFTER_IDLE:
+                return _PooledConnection(self, conn, created_at)
+            try:
+                conn.ping(reconnect=False)
+                return _PooledConnection(self, conn, created_at)
+            except pymysql.MySQLError:
+                # wait_timeout 등으로 끊긴 연결 → 버리고 다음 연결 시도
+                self._discard(conn)
+
+    def release(self, conn, created_at: float):
+        try:
+            if not conn.open:
+                return
+            now = time.monotonic()
+            if now - created_at >= self.RECYCLE_AFTER:
+                self._discard(conn)
+                return
+            # 커밋되지 않은 트랜잭션(읽기 스냅샷 포함)은 반환 전에 정리
+            if conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                conn.rollback()
+            self._idle.put_nowait((conn, created_at, now))
+        except (queue.Full, pymysql.MySQLError):
+            self._discard(conn)
+
+    def prefill(self, count: int):
+        """유휴 연결을 count개까지 미리 생성 (첫 요청들의 연결 지연 제거)"""
+        now = time.monotonic()
+        for _ in range(min(count, self._idle.maxsize) - self._idle.qsize()):
+            try:
+                self._idle.put_nowait((self._connect(), now, now))
+            except queue.Full:
+                return
+
+    def close_all(self):
+        while True:
+            try:
+                conn, _, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(conn)
+
+    @staticmethod
+    def _discard(conn):
+        try:
+            conn.close()
+        except pymysql.MySQLError:
+            pass
+
+_db_pool = None
+_db_autocommit_pool = None  # 기본 DB autocommit 연결 (autocommit=True 대여용)
+_db_read_pool = None  # readonly 대여용 (DB_REPLICA_HOST 설정 시 복제본, 아니면 _db_autocommit_pool과 동일)
+_db_pool_lock = threading.Lock()
+
+def _create_db_connection(autocommit: bool = False):
+    """새 DB 연결 생성 (풀 내부용)"""
+    return pymysql.connect(
+        host=os.getenv('DB_HOST', 'localhost'),
+        user=os.getenv('DB_USER', 'root'),
+        passwd=os.getenv('DB_PASSWORD', ''),
+        db=os.getenv('DB_NAME', 'koreaworkingvisa'),
+        charset='utf8mb4',
+        port=int(os.getenv('DB_PORT', '3306')),
+        autocommit=autocommit
+    )
 
-    import pymysql
-    from pathlib import Path
-    from dotenv import load_dotenv
+def _create_autocommit_connection():
+    """기본 DB autocommit 연결 - 조회 후 반환 시 ROLLBACK 왕복 없음"""
+    return _create_db_connection(autocommit=True)
+
+def _create_replica_connection():
+    """읽기 전용 복제본 연결 생성 (계정/DB/포트 미지정 시 기본 DB 설정 사용)"""
+    return pymysql.connect(
+        host=os.getenv('DB_REPLICA_HOST'),
+        user=os.getenv('DB_REPLICA_USER') or os.getenv('DB_USER', 'root'),
+        passwd=os.getenv('DB_REPLICA_PASSWORD') or os.getenv('DB_PASSWORD', ''),
+        db=os.getenv('DB_NAME', 'koreaworkingvisa'),
+        charset='utf8mb4',
+        port=int(os.getenv('DB_REPLICA_PORT') or os.getenv('DB_PORT', '3306')),
+        autocommit=True
+    )
 
-    env_path = Path(__file__).parent.parent / '.env'
-    load_dotenv(dotenv_path=env_path, override=True)
+def _get_db_pool() -> _ConnectionPool:
+    """연결 풀 (최초 호출 시 .env 로드 후 생성)"""
+    global _db_pool, _db_autocommit_pool, _db_read_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                from pathlib import Path
+                from dotenv import load_dotenv
+
+                env_path = Path(__file__).parent.parent / '.env'
+                load_dotenv(dotenv_path=env_path, override=True)
+                pool_size = int(os.getenv('KWV_DB_POOL_SIZE', '20'))
+                _db_autocommit_pool = _ConnectionPool(_create_autocommit_connection, pool_size)
+                if os.getenv('DB_REPLICA_HOST'):
+                    _db_read_pool = _ConnectionPool(_create_replica_connection, pool_size)
+                else:
+                    _db_read_pool = _db_autocommit_pool
+                _db_pool = _ConnectionPool(_create_db_connection, pool_size)
+    return _db_pool
+
+def get_kwv_db_connection(readonly: bool = False, autocommit: bool = False):
+    """KWV 데이터베이스 연결 (풀에서 대여, conn.close() 시 풀에 반환)
+    readonly=True: 읽기 전용 풀에서 대여 (복제본 설정 시 복제본, autocommit - 조회 전용 핸들러만)
+    autocommit=True: 기본 DB autocommit 연결 (복제 지연이 없어야 하는 조회 - 쓰기 직후 캐시 재적재 등)"""
+    if MOCK_MODE:
+        return None
 
     try:
-        return pymysql.connect(
-            host=os.getenv('DB_HOST', 'localhost'),
-            user=os.getenv('DB_USER', 'root'),
-            passwd=os.getenv('DB_PASSWORD', ''),
-            db=os.getenv('DB_NAME', 'koreaworkingvisa'),
-            charset='utf8mb4',
-            port=int(os.getenv('DB_PORT', '3306'))
-        )
+        pool = _get_db_pool()
+        if readonly:
+            pool = _db_read_pool
+        elif autocommit:
+            pool = _db_autocommit_pool
+        return pool.acquire()
     except Exception as e:
         print(f"⚠️ Database connection failed: {e}")
         return None
 
+@router.on_event("startup")
+async def _raise_threadpool_limit():
+    """def 핸들러(동기 DB 호출)용 스레드풀 크기 - 기본 40 → KWV_THREADPOOL_SIZE (기본 100)"""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(os.getenv('KWV_THREADPOOL_SIZE', '100'))
+
+@router.on_event("startup")
+def _warm_db_pool():
+    """앱 시작 시 풀 생성 + 최소 연결 확보 (KWV_DB_POOL_MIN, 기본 5)"""
+    if MOCK_MODE:
+        return
+    try:
+        min_size = int(os.getenv('KWV_DB_POOL_MIN', '5'))
+        _get_db_pool().prefill(min_size)
+        _db_read_pool.prefill(min_size)
+        if _db_autocommit_pool is not _db_read_pool:
+            _db_autocommit_pool.prefill(min_size)
+    except Exception as e:
+        print(f"⚠️ Database pool warm-up failed: {e}")
+
+@router.on_event("shutdown")
+def _close_db_pools():
+    for pool in (_db_pool, _db_autocommit_pool, _db_read_pool):
+        if pool is not None:
+            pool.close_all()
+
 # ==================== 인증 API ====================
 
-@router.post("/auth/register")
-async def register(user_data: UserRegister):
+# Google 인증서 조회용 transport (세션 재사용) 및 검증된 ID 토큰 캐시
+_GOOGLE_REQUEST = google_requests.Request() if GOOGLE_AUTH_AVAILABLE else None
+_google_idinfo_cache = _TTLCache(maxsize=1024, ttl=300)
+
+def verify_google_id_token(credential: str) -> dict:
+    """Google ID 토큰 검증 (동일 credential은 캐시된 결과 사용)"""
+    idinfo = _google_idinfo_cache.get(credential)
+    if idinfo and idinfo.get('exp', 0) > time.time():
+        return idinfo
+
+    idinfo = google_id_token.verify_oauth2_token(credential, _GOOGLE_REQUEST, GOOGLE_CLIENT_ID)
+    _google_idinfo_cache.set(credential, idinfo)
+    return idinfo
+
+def _record_last_login(user_id: int, oauth_provider: Optional[str] = None, oauth_id: Optional[str] = None):
+    """마지막 로그인 시각 기록 (응답 전송 후 백그라운드에서 실행)"""
+    conn = get_kwv_db_connection()
+    if not conn:
+        return
+    try:
+        cursor = conn.cursor()
+        if oauth_provider:
+            cursor.execute("""
+                UPDATE kwv_users SET last_login_at = NOW(), oauth_provider = %s, oauth_id = COALESCE(%s, oauth_id)
+                WHERE id = %s
+            """, (oauth_provider, oauth_id, user_id))
+        else:
+            cursor.execute("UPDATE kwv_users SET last_login_at = NOW() WHERE id = %s", (user_id,))
+        conn.commit()
+    except pymysql.MySQLError:
+        logger.exception("last_login_at update failed (user_id=%s)", user_id)
+    finally:
+        conn.close()
+
+@router.post("/auth/register", response_class=ORJSONResponse)
+def register(user_data: UserRegister):
     """
     회원가입
     - applicant (일반 사용자): 비자 신청자 (여권+비자 첨부)
@@ -240,9 +628,8 @@ async def register(user_data: UserRegister):
 
     # Mock mode 처리
     if MOCK_MODE:
-        for u in MOCK_USERS.values():
-            if u["email"] == user_data.email:
-                raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
+        if user_data.email in _MOCK_USERS_BY_EMAIL:
+            raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
 
         user_id = MOCK_USER_ID_COUNTER
         MOCK_USER_ID_COUNTER += 1
@@ -264,7 +651,7 @@ async def register(user_data: UserRegister):
             "profile_photo": profile_photo_url,
             "created_at": datetime.utcnow().isoformat()
         }
-        MOCK_USERS[user_id] = new_user
+        _register_mock_user(new_user)
 
         token_data = {
             "sub": str(user_id),
@@ -297,10 +684,6 @@ async def register(user_data: UserRegister):
     try:
         cursor = conn.cursor()
 
-        cursor.execute("SELECT id FROM kwv_users WHERE email = %s", (user_data.email,))
-        if cursor.fetchone():
-            raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
-
         # 기본 비밀번호 kwv2026 해시
         password_salt = secrets.token_hex(16)
         password_hash = hashlib.sha256((DEFAULT_PASSWORD + password_salt).encode()).hexdigest()
@@ -314,33 +697,40 @@ async def register(user_data: UserRegister):
             row = cursor.fetchone()
             if row:
                 approval_mode = row[0]
-        except:
-            pass
+        except pymysql.MySQLError:
+            logger.exception("approval_mode lookup failed - falling back to manual")
 
         # 모든 사용자는 미승인 상태로 생성 (관리자도 승인 필수)
         is_approved = False
 
-        cursor.execute("""
-            INSERT INTO kwv_users (email, password_hash, password_salt, name, phone, address,
-                user_type, admin_level, language, organization, region, profile_photo,
-                target_local_government_id, is_approved)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (
-            user_data.email,
-            password_hash,
-            password_salt,
-            user_data.name,
-            user_data.phone or '',
-            user_data.address or '',
-            user_type,
-            2 if user_type == 'admin' else 0,
-            user_data.language or 'en',
-            user_data.organization if user_type == 'admin' else None,
-            user_data.organization if user_type == 'admin' else None,
-            profile_photo_url,
-            user_data.target_local_government_id if user_type == 'applicant' else None,
-            is_approved
-        ))
+        # 이메일 중복은 kwv_users.email UNIQUE 제약으로 판별 (사전 SELECT 없음)
+        try:
+            cursor.execute("""
+                INSERT INTO kwv_users (email, password_hash, password_salt, name, phone, address,
+                    user_type, admin_level, language, organization, region, profile_photo,
+                    target_local_government_id, is_approved)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (
+                user_data.email,
+                password_hash,
+                password_salt,
+                user_data.name,
+                user_data.phone or '',
+                user_data.address or '',
+                user_type,
+                2 if user_type == 'admin' else 0,
+                user_data.language or 'en',
+                user_data.organization if user_type == 'admin' else None,
+                user_data.organization if user_type == 'admin' else None,
+                profile_photo_url,
+                user_data.target_local_government_id if user_type == 'applicant' else None,
+                is_approved
+            ))
+        except pymysql.err.IntegrityError as e:
+            if e.args and e.args[0] == 1062:
+                conn.rollback()
+                raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
+            raise
 
         user_id = cursor.lastrowid
 
@@ -376,6 +766,7 @@ async def register(user_data: UserRegister):
 
         # 자동 승인 모드일 때 필수 항목 검증
         auto_approved = False
+        check = None
         if approval_mode == 'auto' and user_type == 'applicant':
             check = check_auto_approval(user_id, conn)
             if check["passed"]:
@@ -388,6 +779,8 @@ async def register(user_data: UserRegister):
                 auto_approved = True
 
         conn.commit()
+        if user_type == 'admin':
+            _admin_list_cache.clear()
 
         token_data = {
             "sub": str(user_id),
@@ -414,7 +807,6 @@ async def register(user_data: UserRegister):
         }
         # 자동 승인 실패 시 누락 항목 알려주기
         if approval_mode == 'auto' and user_type == 'applicant' and not auto_approved:
-            check = check_auto_approval(user_id, conn)
             response["approval_status"] = "pending"
             response["missing_items"] = check.get("missing", [])
         elif auto_approved:
@@ -423,24 +815,27 @@ async def register(user_data: UserRegister):
         return response
     except HTTPException:
         raise
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        raise HTTPException(status_code=500, detail=f"회원가입 실패: {str(e)}")
+    except pymysql.err.IntegrityError:
+        conn.rollback()
+        logger.exception("register integrity error")
+        raise HTTPException(status_code=400, detail="회원가입 실패: 입력값을 확인해주세요")
+    except pymysql.err.OperationalError:
+        logger.exception("register database error")
+        raise HTTPException(status_code=503, detail="Database connection failed")
+    except Exception:
+        conn.rollback()
+        logger.exception("register failed")
+        raise HTTPException(status_code=500, detail="회원가입 실패")
     finally:
         if conn:
             conn.close()
 
-@router.post("/auth/login", response_model=TokenResponse)
-async def login(credentials: UserLogin):
+@router.post("/auth/login", response_model=TokenResponse, response_class=ORJSONResponse)
+def login(credentials: UserLogin, background_tasks: BackgroundTasks):
     """일반 로그인 (이메일 + 비밀번호)"""
 
     if MOCK_MODE:
-        user = None
-        for u in MOCK_USERS.values():
-            if u["email"] == credentials.email:
-                user = u
-                break
+        user = _MOCK_USERS_BY_EMAIL.get(credentials.email)
 
         if not user:
             raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다")
@@ -507,8 +902,7 @@ async def login(credentials: UserLogin):
         if check_hash != password_hash:
             raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다")
 
-        cursor.execute("UPDATE kwv_users SET last_login_at = NOW() WHERE id = %s", (user_id,))
-        conn.commit()
+        background_tasks.add_task(_record_last_login, user_id)
 
         token_data = {
             "sub": str(user_id),
@@ -534,28 +928,27 @@ async def login(credentials: UserLogin):
         }
     except HTTPException:
         raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"로그인 실패: {str(e)}")
+    except pymysql.err.OperationalError:
+        logger.exception("login database error")
+        raise HTTPException(status_code=503, detail="Database connection failed")
+    except Exception:
+        logger.exception("login failed")
+        raise HTTPException(status_code=500, detail="로그인 실패")
     finally:
         if conn:
             conn.close()
 
-@router.post("/auth/google")
-async def google_login(request: GoogleLoginRequest):
+@router.post("/auth/google", response_class=ORJSONResponse)
+def google_login(request: GoogleLoginRequest, background_tasks: BackgroundTasks):
     """Google OAuth 로그인/가입"""
 
     if not GOOGLE_CLIENT_ID:
         raise HTTPException(status_code=503, detail="Google OAuth가 설정되지 않았습니다")
+    if not GOOGLE_AUTH_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Google Auth 라이브러리가 설치되지 않았습니다")
 
     try:
-        from google.oauth2 import id_token
-        from google.auth.transport import requests
-
-        idinfo = id_token.verify_oauth2_token(
-            request.credential,
-            requests.Request(),
-            GOOGLE_CLIENT_ID
-        )
+        idinfo = verify_google_id_token(request.credential)
 
         email = idinfo.get('email')
         name = idinfo.get('name', email.split('@')[0])
@@ -573,8 +966,7 @@ async def google_login(request: GoogleLoginRequest):
 
             if existing:
                 user_id, name, user_type, admin_level, language = existing
-                cursor.execute("UPDATE kwv_users SET last_login_at = NOW(), oauth_provider = 'google', oauth_id = %s WHERE id = %s",
-                             (google_id, user_id))
+                background_tasks.add_task(_record_last_login, user_id, 'google', google_id)
             else:
                 cursor.execute("""
                     INSERT INTO kwv_users (email, name, user_type, oauth_provider, oauth_id, language, is_approved)
@@ -584,8 +976,7 @@ async def google_login(request: GoogleLoginRequest):
                 user_type = 'applicant'
                 admin_level = None
                 language = 'en'
-
-            conn.commit()
+                conn.commit()
 
             token_data = {
                 "sub": str(user_id),
@@ -612,10 +1003,14 @@ async def google_login(request: GoogleLoginRequest):
         finally:
             conn.close()
 
-    except ImportError:
-        raise HTTPException(status_code=503, detail="Google Auth 라이브러리가 설치되지 않았습니다")
-    except Exception as e:
-        raise HTTPException(status_code=401, detail=f"Google 인증 실패: {str(e)}")
+    except HTTPException:
+        raise
+    except pymysql.err.OperationalError:
+        logger.exception("google login database error")
+        raise HTTPException(status_code=503, detail="Database connection failed")
+    except Exception:
+        logger.exception("google login failed")
+        raise HTTPException(status_code=401, detail="Google 인증 실패")
 
 @router.get("/auth/me")
 async def get_me(user: dict = Depends(get_current_user)):
@@ -635,8 +1030,21 @@ async def logout():
 
 # ==================== 관리자 API ====================
 
-@router.get("/admin/applicants")
-async def get_applicants(
+# 신청자 목록 필터: (쿼리 파라미터, WHERE 조각, 바인딩 값 생성)
+_APPLICANT_FILTERS = (
+    ("status", "a.application_status = %s", lambda v: (v,)),
+    ("nationality", "a.nationality = %s", lambda v: (v,)),
+    ("visa_type", "a.visa_type = %s", lambda v: (v,)),
+    ("lg_id", "u.target_local_government_id = %s", lambda v: (v,)),
+    ("search", "(u.name LIKE %s OR u.email LIKE %s OR u.phone LIKE %s)", lambda v: (f"%{v}%",) * 3),
+)
+_APPROVAL_CONDITIONS = {
+    "true": "u.is_approved = TRUE",
+    "false": "u.is_approved = FALSE",
+}
+
+@router.get("/admin/applicants", response_class=ORJSONResponse)
+def get_applicants(
     status: Optional[str] = None,
     nationality: Optional[str] = None,
     visa_type: Optional[str] = None,
@@ -655,42 +1063,34 @@ async def get_applicants(
         return {"applicants": [], "total": 0, "page": page, "limit": limit}
 
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
 
-        where_clause = "WHERE u.user_type = 'applicant'"
+        filter_values = {
+            "status": status, "nationality": nationality, "visa_type": visa_type,
+            "lg_id": lg_id, "search": search
+        }
+        conditions = ["u.user_type = 'applicant'"]
         params = []
-
-        if status:
-            where_clause += " AND a.application_status = %s"
-            params.append(status)
-        if nationality:
-            where_clause += " AND a.nationality = %s"
-            params.append(nationality)
-        if visa_type:
-            where_clause += " AND a.visa_type = %s"
-            params.append(visa_type)
-        if lg_id:
-            where_clause += " AND u.target_local_government_id = %s"
-            params.append(lg_id)
-        if is_approved == 'true':
-            where_clause += " AND u.is_approved = TRUE"
-        elif is_approved == 'false':
-            where_clause += " AND u.is_approved = FALSE"
-        if search:
-            where_clause += " AND (u.name LIKE %s OR u.email LIKE %s OR u.phone LIKE %s)"
-            params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
+        for key, fragment, bind in _APPLICANT_FILTERS:
+            value = filter_values[key]
+            if value:
+                conditions.append(fragment)
+                params.extend(bind(value))
+        if is_approved in _APPROVAL_CONDITIONS:
+            conditions.append(_APPROVAL_CONDITIONS[is_approved])
+        where_clause = "WHERE " + " AND ".join(conditions)
 
         cursor.execute(f"""
-            SELECT COUNT(*) FROM kwv_users u
+            SELECT COUNT(*) AS total FROM kwv_users u
             LEFT JOIN kwv_visa_applicants a ON u.id = a.user_id
             {where_clause}
         """, params)
-        total = cursor.fetchone()[0]
+        total = cursor.fetchone()["total"]
 
         offset = (page - 1) * limit
         cursor.execute(f"""
             SELECT u.id, u.email, u.name, u.phone, u.created_at,
-                   a.visa_type, a.nationality, a.application_status,
+                   a.visa_type, a.nationality, COALESCE(a.application_status, 'pending') AS status,
                    u.is_approved, u.approved_at, u.target_local_government_id,
                    u.local_government_id, u.profile_photo, u.language,
                    lg.name as lg_name, tlg.name as target_lg_name,
@@ -704,36 +1104,17 @@ async def get_applicants(
             LIMIT %s OFFSET %s
         """, params + [limit, offset])
 
-        applicants = []
-        for row in cursor.fetchall():
-            applicants.append({
-                "id": row[0],
-                "email": row[1],
-                "name": row[2],
-                "phone": row[3],
-                "created_at": row[4].isoformat() if row[4] else None,
-                "visa_type": row[5],
-                "nationality": row[6],
-                "status": row[7] or "pending",
-                "is_approved": bool(row[8]),
-                "approved_at": row[9].isoformat() if row[9] else None,
-                "target_local_government_id": row[10],
-                "local_government_id": row[11],
-                "profile_photo": row[12],
-                "language": row[13],
-                "lg_name": row[14],
-                "target_lg_name": row[15],
-                "birth_date": row[16].isoformat() if row[16] else None,
-                "gender": row[17]
-            })
+        applicants = cursor.fetchall()
+        for a in applicants:
+            a["is_approved"] = bool(a["is_approved"])
 
         # 필터용 메타데이터
         cursor.execute("SELECT DISTINCT nationality FROM kwv_visa_applicants WHERE nationality IS NOT NULL ORDER BY nationality")
-        nationalities = [r[0] for r in cursor.fetchall()]
+        nationalities = [r["nationality"] for r in cursor.fetchall()]
         cursor.execute("SELECT DISTINCT visa_type FROM kwv_visa_applicants WHERE visa_type IS NOT NULL ORDER BY visa_type")
-        visa_types = [r[0] for r in cursor.fetchall()]
+        visa_types = [r["visa_type"] for r in cursor.fetchall()]
 
-        return {
+        return ORJSONResponse({
             "applicants": applicants,
             "total": total,
             "page": page,
@@ -742,12 +1123,12 @@ async def get_applicants(
                 "nationalities": nationalities,
                 "visa_types": visa_types
             }
-        }
+        })
     finally:
         conn.close()
 
-@router.get("/admin/statistics")
-async def get_statistics(user: dict = Depends(get_current_user)):
+@router.get("/admin/statistics", response_class=ORJSONResponse)
+def get_statistics(user: dict = Depends(get_current_user)):
     """대시보드 통계 (관리자용)"""
     require_admin(user)
 
@@ -782,7 +1163,7 @@ async def get_statistics(user: dict = Depends(get_current_user)):
         conn.close()
 
 @router.put("/admin/applicants/{applicant_id}/status")
-async def update_applicant_status(
+def update_applicant_status(
     applicant_id: int,
     status_update: ApplicantStatusUpdate,
     user: dict = Depends(get_current_user)
@@ -825,10 +1206,9 @@ async def update_applicant_status(
         conn.close()
 
 @router.put("/admin/applicants/{applicant_id}/assign-lg")
-async def assign_local_government(applicant_id: int, request: Request, user: dict = Depends(get_current_user)):
+def assign_local_government(applicant_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """근로자를 지자체에 배정"""
     require_admin_level(user, 2)
-    body = await request.json()
     lg_id = body.get("local_government_id")
     if not lg_id:
         raise HTTPException(status_code=400, detail="지자체 ID가 필요합니다")
@@ -854,6 +1234,8 @@ async def assign_local_government(applicant_id: int, request: Request, user: dic
         # used_quota 증가
         cursor.execute("UPDATE kwv_local_governments SET used_quota = used_quota + 1 WHERE id = %s", (lg_id,))
         conn.commit()
+        _lg_list_cache.clear()
+        _stats_cache.pop("by_region")
         return {"message": f"'{lg[2]}' 지자체에 배정되었습니다"}
     finally:
         conn.close()
@@ -863,31 +1245,34 @@ def check_auto_approval(user_id: int, conn) -> dict:
     cursor = conn.cursor()
     missing = []
 
-    # 1. 기본 정보 확인
+    # 기본 정보 + 비자 정보 + 필수 서류(여권/비자 사본)를 한 번에 조회
     cursor.execute("""
-        SELECT name, phone, profile_photo, target_local_government_id
-        FROM kwv_users WHERE id = %s
+        SELECT u.name, u.phone, u.profile_photo, u.target_local_government_id,
+               v.user_id, v.nationality, v.visa_type, v.passport_number, v.birth_date, v.gender,
+               (SELECT GROUP_CONCAT(DISTINCT f.file_category) FROM kwv_file_uploads f
+                WHERE f.user_id = u.id AND f.file_category IN ('passport_copy', 'visa_copy')) AS doc_categories
+        FROM kwv_users u
+        LEFT JOIN kwv_visa_applicants v ON v.user_id = u.id
+        WHERE u.id = %s
+        LIMIT 1
     """, (user_id,))
-    user_row = cursor.fetchone()
-    if not user_row:
+    row = cursor.fetchone()
+    if not row:
         return {"passed": False, "missing": ["사용자 정보 없음"]}
 
-    name, phone, profile_photo, target_lg = user_row
+    (name, phone, profile_photo, target_lg,
+     visa_user_id, nat, vtype, passport, bdate, gender, doc_categories) = row
+
+    # 1. 기본 정보 확인
     if not name: missing.append("이름")
     if not phone: missing.append("전화번호")
     if not profile_photo: missing.append("프로필 사진")
     if not target_lg: missing.append("신청 대상 지자체")
 
     # 2. 비자 정보 확인
-    cursor.execute("""
-        SELECT nationality, visa_type, passport_number, birth_date, gender
-        FROM kwv_visa_applicants WHERE user_id = %s
-    """, (user_id,))
-    visa_row = cursor.fetchone()
-    if not visa_row:
+    if visa_user_id is None:
         missing.extend(["국적", "비자유형", "여권번호", "생년월일", "성별"])
     else:
-        nat, vtype, passport, bdate, gender = visa_row
         if not nat: missing.append("국적")
         if not vtype: missing.append("비자유형")
         if not passport: missing.append("여권번호")
@@ -895,11 +1280,7 @@ def check_auto_approval(user_id: int, conn) -> dict:
         if not gender: missing.append("성별")
 
     # 3. 필수 서류 확인 (여권 사본, 비자 사본)
-    cursor.execute("""
-        SELECT file_category FROM kwv_file_uploads WHERE user_id = %s
-        AND file_category IN ('passport_copy', 'visa_copy')
-    """, (user_id,))
-    uploaded = {r[0] for r in cursor.fetchall()}
+    uploaded = set(doc_categories.split(',')) if doc_categories else set()
     if 'passport_copy' not in uploaded: missing.append("여권 사본")
     if 'visa_copy' not in uploaded: missing.append("비자 사본")
 
@@ -907,9 +1288,16 @@ def check_auto_approval(user_id: int, conn) -> dict:
 
 # ==================== 신청자 API ====================
 
+# 프로필 캐시 (user_id → 프로필 dict), 사용자 정보 수정 시 무효화
+_user_profile_cache = _TTLCache(maxsize=1024, ttl=300)
+
 @router.get("/my/profile")
-async def get_my_profile(user: dict = Depends(get_current_user)):
+def get_my_profile(user: dict = Depends(get_current_user)):
     """내 프로필 조회"""
+    cached = _user_profile_cache.get(user.get("sub"))
+    if cached is not None:
+        return cached
+
     conn = get_kwv_db_connection()
     if not conn:
         return {"id": user.get("sub"), "email": user.get("email"), "name": user.get("name")}
@@ -925,7 +1313,7 @@ async def get_my_profile(user: dict = Depends(get_current_user)):
         if not row:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
 
-        return {
+        profile = {
             "id": row[0],
             "email": row[1],
             "name": row[2],
@@ -934,11 +1322,13 @@ async def get_my_profile(user: dict = Depends(get_current_user)):
             "profile_photo": row[5],
             "created_at": row[6].isoformat() if row[6] else None
         }
+        _user_profile_cache.set(user.get("sub"), profile)
+        return profile
     finally:
         conn.close()
 
 @router.get("/my/application")
-async def get_my_application(user: dict = Depends(get_current_user)):
+def get_my_application(user: dict = Depends(get_current_user)):
     """내 비자 신청 현황"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -973,7 +1363,7 @@ async def get_my_application(user: dict = Depends(get_current_user)):
         conn.close()
 
 @router.post("/my/application")
-async def create_application(
+def create_application(
     application: ApplicantCreate,
     user: dict = Depends(get_current_user)
 ):
@@ -1011,52 +1401,138 @@ async def create_application(
 
 # ==================== 파일 업로드 API ====================
 
+def _upload_dir(category: str) -> str:
+    """카테고리 업로드 디렉터리 (미리 만들지 않은 카테고리만 생성)"""
+    cat_dir = os.path.join(LOCAL_UPLOAD_DIR, category)
+    if category not in _upload_dirs_ready:
+        os.makedirs(cat_dir, exist_ok=True)
+        _upload_dirs_ready.add(category)
+    return cat_dir
+
+def _gen_filename(ext: str) -> str:
+    """업로드 파일명 생성 (timestamp_랜덤8hex.ext, 추측 불가하도록 CSPRNG 사용)"""
+    return f"{time.time_ns() // 1_000_000_000}_{secrets.token_hex(4)}.{ext}"
+
 def upload_to_local(file_data: bytes, filename: str, category: str) -> str:
     """파일을 로컬에 저장하고 URL 반환"""
-    cat_dir = os.path.join(LOCAL_UPLOAD_DIR, category)
-    os.makedirs(cat_dir, exist_ok=True)
+    cat_dir = _upload_dir(category)
     file_path = os.path.join(cat_dir, filename)
     with open(file_path, 'wb') as f:
         f.write(file_data)
     return f"/api/kwv/uploads/{category}/{filename}"
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_MULTIPART_OVERHEAD = 64 * 1024  # multipart 경계/헤더 여유분
+
+# 파일 시그니처 (magic bytes) → MIME 타입
+_MAGIC_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF", "application/pdf"),
+)
+
+def sniff_mime(head: bytes) -> Optional[str]:
+    """파일 앞부분 바이트로 실제 MIME 타입 판별 (클라이언트 content_type 불신)"""
+    for signature, mime in _MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            return mime
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith(b"<svg") or text.startswith(b"<?xml"):
+        return "image/svg+xml"
+    return None
+
+def check_content_length(request: Request, max_size: int):
+    """Content-Length로 본문 저장 전에 크기 초과 요청 거부"""
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_size + UPLOAD_MULTIPART_OVERHEAD:
+        raise HTTPException(status_code=413, detail=f"파일 크기가 {max_size // (1024 * 1024)}MB를 초과합니다")
+
+async def _iter_upload_chunks(file: UploadFile, max_size: int, allowed_mime: Optional[frozenset] = None):
+    """업로드 파일을 청크 단위로 읽기 (첫 청크로 형식 검증, 누적 크기 초과 시 즉시 중단)"""
+    total = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            return
+        if total == 0 and allowed_mime is not None and sniff_mime(chunk[:64]) not in allowed_mime:
+            raise HTTPException(status_code=400, detail="허용되지 않는 파일 형식입니다")
+        total += len(chunk)
+        if total > max_size:
+            raise HTTPException(status_code=400, detail=f"파일 크기가 {max_size // (1024 * 1024)}MB를 초과합니다")
+        yield chunk
+
+async def stream_upload_to_local(file: UploadFile, filename: str, category: str, max_size: int,
+                                 allowed_mime: Optional[frozenset] = None) -> str:
+    """업로드 파일을 메모리에 모두 올리지 않고 디스크로 스트리밍 저장 후 URL 반환"""
+    cat_dir = _upload_dir(category)
+    file_path = os.path.join(cat_dir, filename)
+    try:
+        if AIOFILES_AVAILABLE:
+            async with aiofiles.open(file_path, 'wb') as f:
+                async for chunk in _iter_upload_chunks(file, max_size, allowed_mime):
+                    await f.write(chunk)
+        else:
+            with open(file_path, 'wb') as f:
+                async for chunk in _iter_upload_chunks(file, max_size, allowed_mime):
+                    await run_in_threadpool(f.write, chunk)
+    except BaseException:
+        # 크기 초과/연결 끊김 시 부분 저장 파일 제거
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        raise
+    return f"/api/kwv/uploads/{category}/{filename}"
+
 def save_base64_file(base64_data: str, category: str) -> str:
     """Base64 데이터를 파일로 저장"""
-    if ',' in base64_data:
-        base64_data = base64_data.split(',', 1)[1]
-    file_data = base64.b64decode(base64_data)
+    # data URL 접두어는 split 대신 슬라이스로 한 번만 잘라냄
+    comma = base64_data.find(',', 0, 256)
+    if comma != -1:
+        base64_data = base64_data[comma + 1:]
+    if PYBASE64_AVAILABLE:
+        file_data = pybase64.b64decode(base64_data, validate=False)
+    else:
+        file_data = base64.b64decode(base64_data)
     ext = 'jpg'
-    filename = f"{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}.{ext}"
+    filename = _gen_filename(ext)
     return upload_to_local(file_data, filename, category)
 
 @router.get("/uploads/{category}/{filename}")
-async def serve_upload(category: str, filename: str):
-    """업로드된 파일 서빙"""
+async def serve_upload(category: str, filename: str, if_none_match: Optional[str] = Header(None)):
+    """업로드된 파일 서빙 (파일명이 timestamp+랜덤 hex라 내용 불변 → 장기 캐시)"""
     file_path = os.path.join(LOCAL_UPLOAD_DIR, category, filename)
-    if os.path.exists(file_path):
-        return FileResponse(file_path)
-    raise HTTPException(status_code=404, detail="File not found")
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found")
+    if not stat.S_ISREG(st.st_mode):
+        raise HTTPException(status_code=404, detail="File not found")
+    etag = f'"{int(st.st_mtime)}-{st.st_size}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    # stat 결과를 넘겨 FileResponse가 다시 stat하지 않도록 함
+    return FileResponse(file_path, stat_result=st, headers=headers)
 
 @router.post("/auth/upload-temp")
-async def upload_temp_file(file: UploadFile = File(...), category: str = Form("temp")):
+async def upload_temp_file(request: Request, file: UploadFile = File(...), category: str = Form("temp")):
     """가입 전 임시 파일 업로드"""
-    allowed = {'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'application/pdf'}
-    if file.content_type not in allowed:
+    check_content_length(request, 10 * 1024 * 1024)
+    if file.content_type not in ALLOWED_DOC_MIME:
         raise HTTPException(status_code=400, detail="허용되지 않는 파일 형식입니다")
 
-    file_data = await file.read()
-    if len(file_data) > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(status_code=400, detail="파일 크기가 10MB를 초과합니다")
-
     ext = file.filename.rsplit('.', 1)[-1] if '.' in file.filename else 'bin'
-    filename = f"{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}.{ext}"
-    url = upload_to_local(file_data, filename, category)
+    filename = _gen_filename(ext)
+    url = await stream_upload_to_local(file, filename, category, 10 * 1024 * 1024, ALLOWED_DOC_MIME)
     return {"url": url, "filename": filename}
 
 # ==================== 서류 관리 API ====================
 
 @router.get("/my/docs")
-async def get_my_documents(user: dict = Depends(get_current_user)):
+def get_my_documents(user: dict = Depends(get_current_user)):
     """내 서류 목록 조회"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -1072,44 +1548,43 @@ async def get_my_documents(user: dict = Depends(get_current_user)):
     finally:
         conn.close()
 
+def _insert_document_record(user_id: int, category: str, file_name: str, url: str) -> int:
+    """업로드된 서류 정보 저장 (DB 미연결 시 0 반환)"""
+    conn = get_kwv_db_connection()
+    if not conn:
+        return 0
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO kwv_file_uploads (user_id, file_category, file_name, file_path)
+            VALUES (%s, %s, %s, %s)
+        """, (user_id, category, file_name, url))
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
 @router.post("/my/docs/upload")
 async def upload_my_document(
+    request: Request,
     file: UploadFile = File(...),
     category: str = Form("general"),
     user: dict = Depends(get_current_user)
 ):
     """서류 업로드 (인증 필요)"""
-    allowed = {'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'application/pdf'}
-    if file.content_type not in allowed:
+    check_content_length(request, 10 * 1024 * 1024)
+    if file.content_type not in ALLOWED_DOC_MIME:
         raise HTTPException(status_code=400, detail="허용되지 않는 파일 형식입니다 (JPG, PNG, PDF만 가능)")
 
-    file_data = await file.read()
-    if len(file_data) > 10 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="파일 크기가 10MB를 초과합니다")
-
     ext = file.filename.rsplit('.', 1)[-1] if '.' in file.filename else 'bin'
-    filename = f"{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}.{ext}"
-    url = upload_to_local(file_data, filename, category)
-
-    conn = get_kwv_db_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO kwv_file_uploads (user_id, file_category, file_name, file_path)
-                VALUES (%s, %s, %s, %s)
-            """, (int(user['sub']), category, file.filename, url))
-            conn.commit()
-            doc_id = cursor.lastrowid
-        finally:
-            conn.close()
-    else:
-        doc_id = 0
+    filename = _gen_filename(ext)
+    url = await stream_upload_to_local(file, filename, category, 10 * 1024 * 1024, ALLOWED_DOC_MIME)
+    doc_id = await run_in_threadpool(_insert_document_record, int(user['sub']), category, file.filename, url)
 
     return {"id": doc_id, "url": url, "filename": file.filename, "category": category}
 
 @router.delete("/my/docs/{doc_id}")
-async def delete_my_document(doc_id: int, user: dict = Depends(get_current_user)):
+def delete_my_document(doc_id: int, user: dict = Depends(get_current_user)):
     """내 서류 삭제"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -1160,50 +1635,45 @@ async def google_auth_exchange(request: Request, code: str = None):
     redirect_uri = f"{scheme}://{host}/kwv-google-callback.html"
 
     try:
-        async with httpx.AsyncClient() as client:
-            # code → access_token 교환
-            token_resp = await client.post("https://oauth2.googleapis.com/token", data={
-                "code": code,
-                "client_id": GOOGLE_CLIENT_ID,
-                "client_secret": GOOGLE_CLIENT_SECRET,
-                "redirect_uri": redirect_uri,
-                "grant_type": "authorization_code"
-            })
-            token_data = token_resp.json()
-
-            if "error" in token_data:
-                raise HTTPException(status_code=400, detail=token_data.get("error_description", "Token exchange failed"))
-
-            # access_token으로 사용자 정보 가져오기
-            userinfo_resp = await client.get(
-                "https://www.googleapis.com/oauth2/v3/userinfo",
-                headers={"Authorization": f"Bearer {token_data['access_token']}"}
-            )
-            userinfo = userinfo_resp.json()
+        # code → access_token 교환
+        token_resp = await _http_client.post("https://oauth2.googleapis.com/token", data={
+            "code": code,
+            "client_id": GOOGLE_CLIENT_ID,
+            "client_secret": GOOGLE_CLIENT_SECRET,
+            "redirect_uri": redirect_uri,
+            "grant_type": "authorization_code"
+        })
+        token_data = token_resp.json()
+
+        if "error" in token_data:
+            raise HTTPException(status_code=400, detail=token_data.get("error_description", "Token exchange failed"))
+
+        # access_token으로 사용자 정보 가져오기
+        userinfo_resp = await _http_client.get(
+            "https://www.googleapis.com/oauth2/v3/userinfo",
+            headers={"Authorization": f"Bearer {token_data['access_token']}"}
+        )
+        userinfo = userinfo_resp.json()
 
-            return {
-                "name": userinfo.get("name", ""),
-                "email": userinfo.get("email", ""),
-                "picture": userinfo.get("picture", "")
-            }
+        return {
+            "name": userinfo.get("name", ""),
+            "email": userinfo.get("email", ""),
+            "picture": userinfo.get("picture", "")
+        }
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Google 인증 처리 실패: {str(e)}")
 
 @router.post("/auth/google-login")
-async def google_login_by_email(request_data: GoogleLoginRequest):
+def google_login_by_email(request_data: GoogleLoginRequest, background_tasks: BackgroundTasks):
     """Google 이메일로 기존 사용자 찾아 로그인"""
     email = request_data.email
     if not email:
         raise HTTPException(status_code=400, detail="이메일이 필요합니다")
 
     if MOCK_MODE:
-        user = None
-        for u in MOCK_USERS.values():
-            if u["email"] == email:
-                user = u
-                break
+        user = _MOCK_USERS_BY_EMAIL.get(email)
         if not user:
             raise HTTPException(status_code=404, detail="등록되지 않은 사용자입니다. 먼저 회원가입을 해주세요.")
 
@@ -1248,8 +1718,7 @@ async def google_login_by_email(request_data: GoogleLoginRequest):
         user_type = user_type or 'applicant'
         admin_level = admin_level or 0
 
-        cursor.execute("UPDATE kwv_users SET last_login_at = NOW(), oauth_provider = 'google' WHERE id = %s", (user_id,))
-        conn.commit()
+        background_tasks.add_task(_record_last_login, user_id, 'google')
 
         token_data = {
             "sub": str(user_id),
@@ -1277,13 +1746,22 @@ async def google_login_by_email(request_data: GoogleLoginRequest):
 
 # ==================== 시스템 설정 API ====================
 
+# 공개 설정/테마 조회 캐시 (설정 저장 시 무효화)
+_settings_cache = _TTLCache(maxsize=2, ttl=300)
+
+@router.on_event("startup")
 def ensure_system_settings_table():
-    """시스템 설정 테이블 확인 및 생성"""
+    """시스템 설정 테이블 확인 및 생성 (앱 시작 시 1회)"""
     conn = get_kwv_db_connection()
     if not conn:
         return
     try:
         cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1 FROM kwv_system_settings LIMIT 0")
+            return
+        except pymysql.err.ProgrammingError:
+            pass  # 테이블 없음 → 생성
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS kwv_system_settings (
                 id INT AUTO_INCREMENT PRIMARY KEY,
@@ -1297,13 +1775,13 @@ def ensure_system_settings_table():
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
         """)
         conn.commit()
-    except:
-        pass
+    except pymysql.MySQLError:
+        logger.exception("kwv_system_settings table check failed")
     finally:
         conn.close()
 
 @router.get("/dashboard/stats")
-async def get_dashboard_stats_real():
+def get_dashboard_stats_real():
     """대시보드 통계 (실제 DB 조회)"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -1311,7 +1789,7 @@ async def get_dashboard_stats_real():
     try:
         cursor = conn.cursor()
         # 구인 통계
-        cursor.execute("SELECT COUNT(*), COALESCE(SUM(positions),0) FROM kwv_jobs WHERE status='active'")
+        cursor.execute("SELECT COUNT(*), COALESCE(SUM(positions),0) FROM kwv_jobs WHERE status='active' AND deleted_at IS NULL")
         jobs_row = cursor.fetchone()
         total_jobs = jobs_row[0] or 0
         total_positions = int(jobs_row[1] or 0)
@@ -1335,32 +1813,35 @@ async def get_dashboard_stats_real():
     finally:
         conn.close()
 
+def _save_logo_setting(url: str, user_id):
+    """로고 URL을 시스템 설정에 저장"""
+    conn = get_kwv_db_connection()
+    if not conn:
+        return
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            INSERT INTO kwv_system_settings (setting_key, setting_value, updated_by)
+            VALUES ('logo_url', %s, %s)
+            ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value), updated_by = VALUES(updated_by)
+        """, (url, user_id))
+        conn.commit()
+        _settings_cache.clear()
+    finally:
+        conn.close()
+
 @router.post("/admin/logo/upload")
-async def upload_logo(file: UploadFile = File(...), user: dict = Depends(get_current_user)):
+async def upload_logo(request: Request, file: UploadFile = File(...), user: dict = Depends(get_current_user)):
     """로고 이미지 업로드"""
     require_admin_level(user, 9)
-    allowed = {'image/jpeg', 'image/png', 'image/gif', 'image/webp', 'image/svg+xml'}
-    if file.content_type not in allowed:
+    check_content_length(request, 5 * 1024 * 1024)
+    if file.content_type not in ALLOWED_LOGO_MIME:
         raise HTTPException(status_code=400, detail="이미지 파일만 업로드 가능합니다")
-    file_data = await file.read()
-    if len(file_data) > 5 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="파일 크기가 5MB를 초과합니다")
     ext = file.filename.rsplit('.', 1)[-1] if '.' in file.filename else 'png'
     filename = f"logo_{int(datetime.utcnow().timestamp())}.{ext}"
-    url = upload_to_local(file_data, filename, "logos")
+    url = await stream_upload_to_local(file, filename, "logos", 5 * 1024 * 1024, ALLOWED_LOGO_MIME)
     # 시스템 설정에 로고 URL 저장
-    conn = get_kwv_db_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO kwv_system_settings (setting_key, setting_value, updated_by)
-                VALUES ('logo_url', %s, %s)
-                ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value), updated_by = VALUES(updated_by)
-            """, (url, user.get('sub')))
-            conn.commit()
-        finally:
-            conn.close()
+    await run_in_threadpool(_save_logo_setting, url, user.get('sub'))
     return {"url": url, "filename": filename}
 
 @router.post("/admin/test-api-key")
@@ -1373,15 +1854,14 @@ async def test_api_key(request: Request, user: dict = Depends(get_current_user))
 
     if key_type == "google_maps":
         try:
-            async with httpx.AsyncClient() as client:
-                res = await client.get(f"https://maps.googleapis.com/maps/api/geocode/json?address=Seoul&key={api_key}", timeout=5)
-                data = res.json()
-                if data.get("status") == "OK":
-                    return {"success": True, "message": "Google Maps API 키가 유효합니다"}
-                elif data.get("status") == "REQUEST_DENIED":
-                    return {"success": False, "message": f"API 키가 거부되었습니다: {data.get('error_message','')}"}
-                else:
-                    return {"success": False, "message": f"응답: {data.get('status','')}"}
+            res = await _http_client.get(f"https://maps.googleapis.com/maps/api/geocode/json?address=Seoul&key={api_key}", timeout=5)
+            data = res.json()
+            if data.get("status") == "OK":
+                return {"success": True, "message": "Google Maps API 키가 유효합니다"}
+            elif data.get("status") == "REQUEST_DENIED":
+                return {"success": False, "message": f"API 키가 거부되었습니다: {data.get('error_message','')}"}
+            else:
+                return {"success": False, "message": f"응답: {data.get('status','')}"}
         except Exception as e:
             return {"success": False, "message": f"연결 오류: {str(e)}"}
     elif key_type == "ai":
@@ -1389,31 +1869,33 @@ async def test_api_key(request: Request, user: dict = Depends(get_current_user))
             return {"success": False, "message": "API 키를 입력하세요"}
         # Groq API 테스트
         try:
-            async with httpx.AsyncClient() as client:
-                res = await client.get("https://api.groq.com/openai/v1/models",
-                    headers={"Authorization": f"Bearer {api_key}"}, timeout=5)
-                if res.status_code == 200:
-                    return {"success": True, "message": "AI API 키가 유효합니다 (Groq)"}
-                else:
-                    return {"success": False, "message": f"Groq 응답: {res.status_code}"}
+            res = await _http_client.get("https://api.groq.com/openai/v1/models",
+                headers={"Authorization": f"Bearer {api_key}"}, timeout=5)
+            if res.status_code == 200:
+                return {"success": True, "message": "AI API 키가 유효합니다 (Groq)"}
+            else:
+                return {"success": False, "message": f"Groq 응답: {res.status_code}"}
         except:
             pass
         # Gemini API 테스트
         try:
-            async with httpx.AsyncClient() as client:
-                res = await client.get(f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}", timeout=5)
-                if res.status_code == 200:
-                    return {"success": True, "message": "AI API 키가 유효합니다 (Gemini)"}
-                else:
-                    return {"success": False, "message": f"API 키를 확인해주세요"}
+            res = await _http_client.get(f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}", timeout=5)
+            if res.status_code == 200:
+                return {"success": True, "message": "AI API 키가 유효합니다 (Gemini)"}
+            else:
+                return {"success": False, "message": f"API 키를 확인해주세요"}
         except Exception as e:
             return {"success": False, "message": f"연결 오류: {str(e)}"}
     else:
         return {"success": False, "message": "알 수 없는 키 타입"}
 
-@router.get("/settings")
-async def get_system_settings():
-    """시스템 설정 조회 (공개)"""
+@router.get("/settings", response_class=ORJSONResponse)
+def get_system_settings(if_none_match: Optional[str] = Header(None)):
+    """시스템 설정 조회 (공개) - ETag로 변경 없으면 304"""
+    cached = _settings_cache.get("all")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, "no-cache")
+
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
@@ -1432,47 +1914,55 @@ async def get_system_settings():
                     settings[key] = float(value) if value else 0
             elif stype == 'json':
                 try:
-                    settings[key] = json.loads(value) if value else {}
+                    settings[key] = json_loads(value) if value else {}
                 except:
                     settings[key] = value
             else:
                 settings[key] = value or ''
-        return settings
+        payload = json_payload(settings)
+        _settings_cache.set("all", payload)
+        return json_payload_response(payload, if_none_match, "no-cache")
     finally:
         conn.close()
 
+def _setting_to_str(value) -> str:
+    """설정 값을 kwv_system_settings 저장용 문자열로 변환"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (dict, list)):
+        return json_dumps_bytes(value).decode("utf-8")
+    return str(value)
+
 @router.post("/settings")
-async def update_system_settings(request: Request, user: dict = Depends(get_current_user)):
+def update_system_settings(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """시스템 설정 수정 (super admin 전용)"""
     require_admin_level(user, 9)
-    body = await request.json()
 
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
     try:
         cursor = conn.cursor()
-        updated = 0
-        for key, value in body.items():
-            if isinstance(value, bool):
-                str_value = 'true' if value else 'false'
-            elif isinstance(value, (dict, list)):
-                str_value = json.dumps(value)
-            else:
-                str_value = str(value)
-            cursor.execute("""
+        params_list = [(key, _setting_to_str(value), user.get('sub')) for key, value in body.items()]
+        if params_list:
+            # 단일 multi-row INSERT로 전송 (키 개수와 무관하게 1회 왕복)
+            cursor.executemany("""
                 INSERT INTO kwv_system_settings (setting_key, setting_value, updated_by)
                 VALUES (%s, %s, %s)
                 ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value), updated_by = VALUES(updated_by)
-            """, (key, str_value, user.get('sub')))
-            updated += 1
+            """, params_list)
+        updated = len(params_list)
         conn.commit()
+        _settings_cache.clear()
         return {"message": f"{updated}개 설정이 저장되었습니다", "updated": updated}
     finally:
         conn.close()
 
 # ==================== 지자체 API ====================
 
+# 공개 지자체 목록 캐시 (region, active_only)별 - 지자체 수정 시 무효화
+_lg_list_cache = _TTLCache(maxsize=64, ttl=120)
+
 class LocalGovernmentCreate(BaseModel):
     name: str
     name_en: Optional[str] = None
@@ -1492,14 +1982,19 @@ class LocalGovernmentCreate(BaseModel):
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
-@router.get("/local-governments")
-async def list_local_governments(region: Optional[str] = None, active_only: bool = True):
+@router.get("/local-governments", response_class=ORJSONResponse)
+def list_local_governments(region: Optional[str] = None, active_only: bool = True):
     """지자체 목록 조회 (공개)"""
+    cache_key = (region, active_only)
+    cached = _lg_list_cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         query = """
             SELECT id, name, name_en, region, address, phone, email, website_url,
                    representative_name, representative_phone, representative_email,
@@ -1519,24 +2014,15 @@ async def list_local_governments(region: Optional[str] = None, active_only: bool
             query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY region, name"
         cursor.execute(query, params)
-        rows = cursor.fetchall()
-        columns = [desc[0] for desc in cursor.description]
-        result = []
-        for row in rows:
-            item = dict(zip(columns, row))
-            # datetime/decimal 변환
-            for k, v in item.items():
-                if isinstance(v, datetime):
-                    item[k] = v.isoformat()
-                elif hasattr(v, '__float__'):
-                    item[k] = float(v)
-            result.append(item)
-        return result
+        # DECIMAL 좌표/일시 컬럼은 ORJSONResponse에서 직접 직렬화
+        result = cursor.fetchall()
+        _lg_list_cache.set(cache_key, result)
+        return ORJSONResponse(result)
     finally:
         conn.close()
 
 @router.get("/local-governments/{lg_id}")
-async def get_local_government(lg_id: int):
+def get_local_government(lg_id: int):
     """지자체 상세 조회"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -1554,13 +2040,23 @@ async def get_local_government(lg_id: int):
         row = cursor.fetchone()
         if not row:
             raise HTTPException(status_code=404, detail="지자체를 찾을 수 없습니다")
-        columns = [desc[0] for desc in cursor.description]
-        item = dict(zip(columns, row))
-        for k, v in item.items():
-            if isinstance(v, datetime):
-                item[k] = v.isoformat()
-            elif hasattr(v, '__float__'):
-                item[k] = float(v)
+        (id_, name, name_en, region, address, phone, email, website_url,
+         rep_name, rep_phone, rep_email, allocated_quota, used_quota, quota_year,
+         logo_url, description, description_en, latitude, longitude,
+         is_active, created_at, updated_at) = row
+        item = {
+            "id": id_, "name": name, "name_en": name_en, "region": region,
+            "address": address, "phone": phone, "email": email, "website_url": website_url,
+            "representative_name": rep_name, "representative_phone": rep_phone,
+            "representative_email": rep_email,
+            "allocated_quota": allocated_quota, "used_quota": used_quota, "quota_year": quota_year,
+            "logo_url": logo_url, "description": description, "description_en": description_en,
+            "latitude": float(latitude) if latitude is not None else None,
+            "longitude": float(longitude) if longitude is not None else None,
+            "is_active": is_active,
+            "created_at": created_at.isoformat() if created_at else None,
+            "updated_at": updated_at.isoformat() if updated_at else None
+        }
         # 배정된 근로자 수 조회
         cursor.execute("SELECT COUNT(*) FROM kwv_users WHERE local_government_id = %s AND is_active = TRUE", (lg_id,))
         item['worker_count'] = cursor.fetchone()[0]
@@ -1569,7 +2065,7 @@ async def get_local_government(lg_id: int):
         conn.close()
 
 @router.post("/local-governments")
-async def create_local_government(data: LocalGovernmentCreate, user: dict = Depends(get_current_user)):
+def create_local_government(data: LocalGovernmentCreate, user: dict = Depends(get_current_user)):
     """지자체 등록 (admin)"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -1592,37 +2088,45 @@ async def create_local_government(data: LocalGovernmentCreate, user: dict = Depe
               data.logo_url, data.description, data.description_en,
               data.latitude, data.longitude))
         conn.commit()
+        _lg_list_cache.clear()
         return {"id": cursor.lastrowid, "message": f"지자체 '{data.name}' 등록 완료"}
     finally:
         conn.close()
 
+_LG_UPDATE_FIELDS = (
+    'name', 'name_en', 'region', 'address', 'phone', 'email', 'website_url',
+    'representative_name', 'representative_phone', 'representative_email',
+    'allocated_quota', 'used_quota', 'quota_year', 'logo_url',
+    'description', 'description_en', 'latitude', 'longitude', 'is_active'
+)
+
+# 수정 컬럼 조합 → UPDATE SQL (조합 수가 유한하므로 크기 제한 없음)
+_lg_update_sql_cache = {}
+
+def _lg_update_sql(fields: tuple) -> str:
+    sql = _lg_update_sql_cache.get(fields)
+    if sql is None:
+        sql = f"UPDATE kwv_local_governments SET {', '.join(f'{f} = %s' for f in fields)} WHERE id = %s"
+        _lg_update_sql_cache[fields] = sql
+    return sql
+
 @router.put("/local-governments/{lg_id}")
-async def update_local_government(lg_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_local_government(lg_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """지자체 수정"""
     require_admin(user)
-    body = await request.json()
+    fields = tuple(f for f in _LG_UPDATE_FIELDS if f in body)
+    if not fields:
+        raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
     try:
         cursor = conn.cursor()
-        allowed_fields = [
-            'name', 'name_en', 'region', 'address', 'phone', 'email', 'website_url',
-            'representative_name', 'representative_phone', 'representative_email',
-            'allocated_quota', 'used_quota', 'quota_year', 'logo_url',
-            'description', 'description_en', 'latitude', 'longitude', 'is_active'
-        ]
-        updates = []
-        params = []
-        for field in allowed_fields:
-            if field in body:
-                updates.append(f"{field} = %s")
-                params.append(body[field])
-        if not updates:
-            raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
+        params = [body[f] for f in fields]
         params.append(lg_id)
-        cursor.execute(f"UPDATE kwv_local_governments SET {', '.join(updates)} WHERE id = %s", params)
+        cursor.execute(_lg_update_sql(fields), params)
         conn.commit()
+        _lg_list_cache.clear()
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="지자체를 찾을 수 없습니다")
         return {"message": "지자체 정보가 수정되었습니다"}
@@ -1630,7 +2134,7 @@ async def update_local_government(lg_id: int, request: Request, user: dict = Dep
         conn.close()
 
 @router.delete("/local-governments/{lg_id}")
-async def delete_local_government(lg_id: int, user: dict = Depends(get_current_user)):
+def delete_local_government(lg_id: int, user: dict = Depends(get_current_user)):
     """지자체 삭제 (super admin)"""
     require_admin_level(user, 9)
     conn = get_kwv_db_connection()
@@ -1640,6 +2144,7 @@ async def delete_local_government(lg_id: int, user: dict = Depends(get_current_u
         cursor = conn.cursor()
         cursor.execute("UPDATE kwv_local_governments SET is_active = FALSE WHERE id = %s", (lg_id,))
         conn.commit()
+        _lg_list_cache.clear()
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="지자체를 찾을 수 없습니다")
         return {"message": "지자체가 비활성화되었습니다"}
@@ -1647,10 +2152,9 @@ async def delete_local_government(lg_id: int, user: dict = Depends(get_current_u
         conn.close()
 
 @router.put("/local-governments/{lg_id}/quota")
-async def update_quota(lg_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_quota(lg_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """지자체 TO 배정 관리 (super admin)"""
     require_admin_level(user, 9)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
@@ -1665,6 +2169,7 @@ async def update_quota(lg_id: int, request: Request, user: dict = Depends(get_cu
                 WHERE id = %s
             """, (allocated, year, lg_id))
         conn.commit()
+        _lg_list_cache.clear()
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="지자체를 찾을 수 없습니다")
         return {"message": "TO 배정이 업데이트되었습니다"}
@@ -1699,8 +2204,40 @@ class MouCreate(BaseModel):
     is_public: Optional[bool] = False
     display_order: Optional[int] = 0
 
+class MouUpdate(BaseModel):
+    """MOU 수정 (전달된 필드만 반영)"""
+    title: Optional[str] = None
+    title_en: Optional[str] = None
+    partner_country: Optional[str] = None
+    partner_country_name: Optional[str] = None
+    partner_type: Optional[str] = None
+    partner_organization: Optional[str] = None
+    partner_organization_en: Optional[str] = None
+    partner_representative: Optional[str] = None
+    partner_contact: Optional[str] = None
+    korean_organization: Optional[str] = None
+    korean_representative: Optional[str] = None
+    description: Optional[str] = None
+    description_en: Optional[str] = None
+    signed_date: Optional[str] = None
+    effective_date: Optional[str] = None
+    expiry_date: Optional[str] = None
+    worker_quota: Optional[int] = None
+    document_url: Optional[str] = None
+    photo_url: Optional[str] = None
+    photo_url_2: Optional[str] = None
+    photo_url_3: Optional[str] = None
+    status: Optional[str] = None
+    is_public: Optional[bool] = None
+    display_order: Optional[int] = None
+
+def _mou_list_item(row: dict) -> dict:
+    """MOU 목록 행 변환 (is_public → bool)"""
+    row["is_public"] = bool(row["is_public"])
+    return row
+
 @router.get("/mou")
-async def list_mou(
+def list_mou(
     country: Optional[str] = None,
     status: Optional[str] = None,
     user: dict = Depends(get_current_user)
@@ -1711,7 +2248,7 @@ async def list_mou(
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.SSDictCursor)
         where = "WHERE 1=1"
         params = []
         if country:
@@ -1726,31 +2263,19 @@ async def list_mou(
                    photo_url, status, is_public, display_order, created_at
             FROM kwv_mou_agreements {where} ORDER BY display_order ASC, signed_date DESC
         """, params)
-        mous = []
-        for r in cursor.fetchall():
-            mous.append({
-                "id": r[0], "title": r[1], "title_en": r[2],
-                "partner_country": r[3], "partner_country_name": r[4],
-                "partner_type": r[5], "partner_organization": r[6],
-                "signed_date": r[7].isoformat() if r[7] else None,
-                "expiry_date": r[8].isoformat() if r[8] else None,
-                "worker_quota": r[9], "photo_url": r[10],
-                "status": r[11], "is_public": bool(r[12]),
-                "display_order": r[13],
-                "created_at": r[14].isoformat() if r[14] else None
-            })
-        return mous
-    finally:
+    except Exception:
         conn.close()
+        raise
+    return stream_json_rows(conn, cursor, _mou_list_item)
 
 @router.get("/mou/public")
-async def list_public_mou():
+def list_public_mou():
     """공개 MOU 목록 (로그인 불요)"""
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.SSDictCursor)
         cursor.execute("""
             SELECT id, title, title_en, partner_country, partner_country_name, partner_type,
                    partner_organization, partner_organization_en, partner_representative,
@@ -1760,53 +2285,42 @@ async def list_public_mou():
             FROM kwv_mou_agreements WHERE is_public = TRUE AND status IN ('active','draft')
             ORDER BY display_order ASC, signed_date DESC
         """)
-        mous = []
-        for r in cursor.fetchall():
-            mous.append({
-                "id": r[0], "title": r[1], "title_en": r[2],
-                "partner_country": r[3], "partner_country_name": r[4],
-                "partner_type": r[5], "partner_organization": r[6],
-                "partner_organization_en": r[7], "partner_representative": r[8],
-                "korean_organization": r[9], "korean_representative": r[10],
-                "description": r[11], "description_en": r[12],
-                "signed_date": r[13].isoformat() if r[13] else None,
-                "expiry_date": r[14].isoformat() if r[14] else None,
-                "worker_quota": r[15], "photo_url": r[16],
-                "photo_url_2": r[17], "photo_url_3": r[18],
-                "status": r[19], "display_order": r[20]
-            })
-        return mous
-    finally:
+    except Exception:
         conn.close()
+        raise
+    return stream_json_rows(conn, cursor)
 
 @router.get("/mou/{mou_id}")
-async def get_mou(mou_id: int, user: dict = Depends(get_current_user)):
+def get_mou(mou_id: int, user: dict = Depends(get_current_user)):
     """MOU 상세"""
     require_admin(user)
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM kwv_mou_agreements WHERE id = %s", (mou_id,))
-        r = cursor.fetchone()
-        if not r:
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        cursor.execute("""
+            SELECT id, title, title_en, partner_country, partner_country_name, partner_type,
+                   partner_organization, partner_organization_en, partner_representative, partner_contact,
+                   korean_organization, korean_representative, description, description_en,
+                   signed_date, effective_date, expiry_date, worker_quota,
+                   document_url, photo_url, photo_url_2, photo_url_3,
+                   status, is_public, display_order, created_by, created_at, updated_at
+            FROM kwv_mou_agreements WHERE id = %s
+        """, (mou_id,))
+        mou = cursor.fetchone()
+        if not mou:
             raise HTTPException(status_code=404, detail="MOU를 찾을 수 없습니다")
-        cols = [d[0] for d in cursor.description]
-        mou = {}
-        for i, col in enumerate(cols):
-            val = r[i]
-            if hasattr(val, 'isoformat'):
-                val = val.isoformat()
-            if col == 'is_public':
-                val = bool(val)
-            mou[col] = val
+        for col in ('signed_date', 'effective_date', 'expiry_date', 'created_at', 'updated_at'):
+            if mou[col]:
+                mou[col] = mou[col].isoformat()
+        mou['is_public'] = bool(mou['is_public'])
         return mou
     finally:
         conn.close()
 
 @router.post("/mou")
-async def create_mou(mou_data: MouCreate, user: dict = Depends(get_current_user)):
+def create_mou(mou_data: MouCreate, user: dict = Depends(get_current_user)):
     """MOU 등록"""
     require_admin_level(user, 2)
     conn = get_kwv_db_connection()
@@ -1840,31 +2354,20 @@ async def create_mou(mou_data: MouCreate, user: dict = Depends(get_current_user)
         conn.close()
 
 @router.put("/mou/{mou_id}")
-async def update_mou(mou_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_mou(mou_id: int, data: MouUpdate, user: dict = Depends(get_current_user)):
     """MOU 수정"""
     require_admin_level(user, 2)
-    body = await request.json()
+    body = data.model_dump(exclude_unset=True)
+    if not body:
+        raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="Database connection failed")
     try:
         cursor = conn.cursor()
-        allowed = ['title','title_en','partner_country','partner_country_name','partner_type',
-                    'partner_organization','partner_organization_en','partner_representative','partner_contact',
-                    'korean_organization','korean_representative','description','description_en',
-                    'signed_date','effective_date','expiry_date','worker_quota',
-                    'document_url','photo_url','photo_url_2','photo_url_3',
-                    'status','is_public','display_order']
-        sets = []
-        params = []
-        for k, v in body.items():
-            if k in allowed:
-                sets.append(f"{k} = %s")
-                params.append(v)
-        if not sets:
-            raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
+        params = list(body.values())
         params.append(mou_id)
-        cursor.execute(f"UPDATE kwv_mou_agreements SET {', '.join(sets)} WHERE id = %s", params)
+        cursor.execute(f"UPDATE kwv_mou_agreements SET {', '.join(f'{k} = %s' for k in body)} WHERE id = %s", params)
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="MOU를 찾을 수 없습니다")
         conn.commit()
@@ -1873,7 +2376,7 @@ async def update_mou(mou_id: int, request: Request, user: dict = Depends(get_cur
         conn.close()
 
 @router.delete("/mou/{mou_id}")
-async def delete_mou(mou_id: int, user: dict = Depends(get_current_user)):
+def delete_mou(mou_id: int, user: dict = Depends(get_current_user)):
     """MOU 삭제"""
     require_admin_level(user, 9)
     conn = get_kwv_db_connection()
@@ -1891,10 +2394,17 @@ async def delete_mou(mou_id: int, user: dict = Depends(get_current_user)):
 
 # ==================== 통계 API 강화 ====================
 
+# 집계 통계 캐시 (분 단위로만 변하므로 짧은 TTL로 충분)
+_stats_cache = _TTLCache(maxsize=64, ttl=60)
+_STATS_CACHE_CONTROL = "private, max-age=30"
+
 @router.get("/admin/statistics/by-nationality")
-async def stats_by_nationality(user: dict = Depends(get_current_user)):
+def stats_by_nationality(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """국적별 근로자 통계"""
     require_admin(user)
+    cached = _stats_cache.get("by_nationality")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return []
@@ -1907,35 +2417,44 @@ async def stats_by_nationality(user: dict = Depends(get_current_user)):
             WHERE u.user_type = 'applicant' AND a.nationality IS NOT NULL
             GROUP BY a.nationality ORDER BY cnt DESC
         """)
-        return [{"nationality": r[0], "count": r[1]} for r in cursor.fetchall()]
+        payload = json_payload([{"nationality": r[0], "count": r[1]} for r in cursor.fetchall()])
+        _stats_cache.set("by_nationality", payload)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
 @router.get("/admin/statistics/by-region")
-async def stats_by_region(user: dict = Depends(get_current_user)):
+def stats_by_region(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """지역별 근로자 분포"""
     require_admin(user)
+    cached = _stats_cache.get("by_region")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT lg.region, lg.name, COUNT(u.id) as worker_count, lg.allocated_quota, lg.used_quota
+            SELECT lg.region, lg.name AS lg_name, COUNT(u.id) as worker_count, lg.allocated_quota, lg.used_quota
             FROM kwv_local_governments lg
             LEFT JOIN kwv_users u ON u.local_government_id = lg.id AND u.user_type = 'applicant'
             WHERE lg.is_active = TRUE
             GROUP BY lg.id ORDER BY worker_count DESC
         """)
-        return [{"region": r[0], "lg_name": r[1], "worker_count": r[2],
-                 "allocated_quota": r[3], "used_quota": r[4]} for r in cursor.fetchall()]
+        payload = json_payload(cursor.fetchall())
+        _stats_cache.set("by_region", payload)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
 @router.get("/admin/statistics/by-visa")
-async def stats_by_visa(user: dict = Depends(get_current_user)):
+def stats_by_visa(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """비자유형별 통계"""
     require_admin(user)
+    cached = _stats_cache.get("by_visa")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return []
@@ -1948,25 +2467,34 @@ async def stats_by_visa(user: dict = Depends(get_current_user)):
             WHERE u.user_type = 'applicant' AND a.visa_type IS NOT NULL
             GROUP BY a.visa_type ORDER BY cnt DESC
         """)
-        return [{"visa_type": r[0], "count": r[1]} for r in cursor.fetchall()]
+        payload = json_payload([{"visa_type": r[0], "count": r[1]} for r in cursor.fetchall()])
+        _stats_cache.set("by_visa", payload)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
 @router.get("/admin/statistics/monthly")
-async def stats_monthly(user: dict = Depends(get_current_user)):
+def stats_monthly(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """월별 가입 추이"""
     require_admin(user)
+    cached = _stats_cache.get("monthly")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
         cursor = conn.cursor()
         cursor.execute("""
-            SELECT DATE_FORMAT(created_at, '%%Y-%%m') as month, COUNT(*) as cnt
-            FROM kwv_users WHERE user_type = 'applicant'
+            SELECT DATE_FORMAT(created_at, '%Y-%m') as month, COUNT(*) as cnt
+            FROM kwv_users
+            WHERE user_type = 'applicant'
+              AND created_at >= DATE_FORMAT(CURDATE() - INTERVAL 11 MONTH, '%Y-%m-01')
             GROUP BY month ORDER BY month DESC LIMIT 12
         """)
-        return [{"month": r[0], "count": r[1]} for r in cursor.fetchall()]
+        payload = json_payload([{"month": r[0], "count": r[1]} for r in cursor.fetchall()])
+        _stats_cache.set("monthly", payload)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
@@ -1984,40 +2512,71 @@ class WorkplaceCreate(BaseModel):
     manager_phone: Optional[str] = None
     worker_capacity: int = 0
 
-class AttendanceCheck(BaseModel):
-    workplace_id: Optional[int] = None
-    qr_code: Optional[str] = None
-    check_type: str  # check_in / check_out
+class WorkplaceUpdate(BaseModel):
+    """사업장 수정 (전달된 필드만 반영)"""
+    name: Optional[str] = None
+    name_en: Optional[str] = None
+    address: Optional[str] = None
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    photo_url: Optional[str] = None
-    note: Optional[str] = None
+    geofence_radius: Optional[int] = None
+    manager_name: Optional[str] = None
+    manager_phone: Optional[str] = None
+    worker_capacity: Optional[int] = None
+    is_active: Optional[bool] = None
+    local_government_id: Optional[int] = None
+
+class AttendanceCheck(BaseModel):
+    workplace_id: Optional[int] = None
+    qr_code: Optional[str] = Field(default=None, max_length=256)
+    check_type: Literal['check_in', 'check_out']
+    # 컬럼 범위(DECIMAL(10,7) / VARCHAR(500))를 넘는 값은 그룹 커밋 배치 전체를 실패시키므로 큐에 넣기 전에 거름
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
+    photo_url: Optional[str] = Field(default=None, max_length=500)
+    note: Optional[str] = Field(default=None, max_length=2000)
 
 import math
 
+_EARTH_DIAMETER_M = 2 * 6371000
+_DEG_TO_RAD = math.pi / 180
+
 def haversine(lat1, lon1, lat2, lon2):
     """두 좌표 간 거리(미터) 계산"""
-    R = 6371000
-    phi1, phi2 = math.radians(lat1), math.radians(lat2)
-    dphi = math.radians(lat2 - lat1)
-    dlambda = math.radians(lon2 - lon1)
-    a = math.sin(dphi/2)**2 + math.cos(phi1)*math.cos(phi2)*math.sin(dlambda/2)**2
-    return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    phi1, phi2 = lat1 * _DEG_TO_RAD, lat2 * _DEG_TO_RAD
+    sin_dphi = math.sin((phi2 - phi1) * 0.5)
+    sin_dlambda = math.sin((lon2 - lon1) * _DEG_TO_RAD * 0.5)
+    a = sin_dphi * sin_dphi + math.cos(phi1) * math.cos(phi2) * sin_dlambda * sin_dlambda
+    return _EARTH_DIAMETER_M * math.asin(math.sqrt(a))
 
 # --- 사업장 CRUD ---
 
+def _workplace_item(row: dict) -> dict:
+    """사업장 목록 행 변환 (좌표 Decimal → float, is_active → bool)"""
+    row["latitude"] = float(row["latitude"]) if row["latitude"] else None
+    row["longitude"] = float(row["longitude"]) if row["longitude"] else None
+    row["is_active"] = bool(row["is_active"])
+    return row
+
+# 사업장 목록/상세/체크인 조회 캐시 (사업장 수정·배정 변경 시 전체 무효화)
+_workplace_cache = _TTLCache(maxsize=1024, ttl=600)
+
 @router.get("/workplaces")
-async def list_workplaces(
+def list_workplaces(
     lg_id: Optional[int] = None,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None)
 ):
     """사업장 목록"""
     require_admin(user)
+    cached = _workplace_cache.get(("list", lg_id))
+    if cached is not None:
+        return json_payload_response(cached, if_none_match)
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE 1=1"
         params = []
         if lg_id:
@@ -2027,30 +2586,29 @@ async def list_workplaces(
             SELECT w.id, w.name, w.name_en, w.address, w.latitude, w.longitude,
                    w.geofence_radius, w.qr_code, w.manager_name, w.manager_phone,
                    w.worker_capacity, w.is_active, w.local_government_id,
-                   lg.name as lg_name,
-                   (SELECT COUNT(*) FROM kwv_worker_assignments wa WHERE wa.workplace_id = w.id AND wa.status = 'active') as worker_count
+                   lg.name as lg_name, COALESCE(wac.cnt, 0) as worker_count
             FROM kwv_workplaces w
             LEFT JOIN kwv_local_governments lg ON w.local_government_id = lg.id
+            LEFT JOIN (
+                SELECT workplace_id, COUNT(*) AS cnt FROM kwv_worker_assignments
+                WHERE status = 'active' GROUP BY workplace_id
+            ) wac ON wac.workplace_id = w.id
             {where} ORDER BY w.name
         """, params)
-        result = []
-        for r in cursor.fetchall():
-            result.append({
-                "id": r[0], "name": r[1], "name_en": r[2], "address": r[3],
-                "latitude": float(r[4]) if r[4] else None,
-                "longitude": float(r[5]) if r[5] else None,
-                "geofence_radius": r[6], "qr_code": r[7],
-                "manager_name": r[8], "manager_phone": r[9],
-                "worker_capacity": r[10], "is_active": bool(r[11]),
-                "local_government_id": r[12], "lg_name": r[13],
-                "worker_count": r[14]
-            })
-        return result
+        payload = json_payload([_workplace_item(r) for r in cursor.fetchall()])
+        _workplace_cache.set(("list", lg_id), payload)
+        return json_payload_response(payload, if_none_match)
     finally:
         conn.close()
 
+_QR_CODE_ATTEMPTS = 3
+
+def _gen_qr_code() -> str:
+    """사업장 QR 코드 생성 (WP- + base32 8자 = 40비트 난수)"""
+    return "WP-" + base64.b32encode(secrets.token_bytes(5)).decode()
+
 @router.post("/workplaces")
-async def create_workplace(data: WorkplaceCreate, user: dict = Depends(get_current_user)):
+def create_workplace(data: WorkplaceCreate, user: dict = Depends(get_current_user)):
     """사업장 등록"""
     require_admin_level(user, 2)
     conn = get_kwv_db_connection()
@@ -2058,77 +2616,75 @@ async def create_workplace(data: WorkplaceCreate, user: dict = Depends(get_curre
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        qr_code = f"WP-{uuid.uuid4().hex[:8].upper()}"
-        cursor.execute("""
-            INSERT INTO kwv_workplaces (local_government_id, name, name_en, address,
-                latitude, longitude, geofence_radius, qr_code, manager_name, manager_phone, worker_capacity)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """, (data.local_government_id, data.name, data.name_en, data.address,
-              data.latitude, data.longitude, data.geofence_radius, qr_code,
-              data.manager_name, data.manager_phone, data.worker_capacity))
+        # qr_code UNIQUE 충돌 시 새 코드로 재시도
+        for attempt in range(_QR_CODE_ATTEMPTS):
+            qr_code = _gen_qr_code()
+            try:
+                cursor.execute("""
+                    INSERT INTO kwv_workplaces (local_government_id, name, name_en, address,
+                        latitude, longitude, geofence_radius, qr_code, manager_name, manager_phone, worker_capacity)
+                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                """, (data.local_government_id, data.name, data.name_en, data.address,
+                      data.latitude, data.longitude, data.geofence_radius, qr_code,
+                      data.manager_name, data.manager_phone, data.worker_capacity))
+                break
+            except pymysql.err.IntegrityError as e:
+                if not (e.args and e.args[0] == 1062) or attempt == _QR_CODE_ATTEMPTS - 1:
+                    raise
         conn.commit()
+        _workplace_cache.clear()
         return {"id": cursor.lastrowid, "qr_code": qr_code, "message": f"사업장 '{data.name}' 등록 완료"}
     finally:
         conn.close()
 
 @router.get("/workplaces/{wp_id}")
-async def get_workplace(wp_id: int, user: dict = Depends(get_current_user)):
+def get_workplace(wp_id: int, user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """사업장 상세"""
     require_admin(user)
+    cached = _workplace_cache.get(("detail", wp_id))
+    if cached is not None:
+        return json_payload_response(cached, if_none_match)
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("SELECT * FROM kwv_workplaces WHERE id = %s", (wp_id,))
-        r = cursor.fetchone()
-        if not r:
+        wp = cursor.fetchone()
+        if not wp:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
-        cols = [d[0] for d in cursor.description]
-        wp = {}
-        for i, col in enumerate(cols):
-            val = r[i]
-            if hasattr(val, 'isoformat'):
-                val = val.isoformat()
-            if isinstance(val, bytes):
-                val = bool(val[0]) if len(val) == 1 else val.decode()
-            if col in ('latitude', 'longitude') and val is not None:
-                val = float(val)
-            wp[col] = val
-        return wp
+        # datetime/Decimal 좌표는 json_payload 직렬화 단계에서 ISO 문자열/float로 변환
+        payload = json_payload(wp)
+        _workplace_cache.set(("detail", wp_id), payload)
+        return json_payload_response(payload, if_none_match)
     finally:
         conn.close()
 
 @router.put("/workplaces/{wp_id}")
-async def update_workplace(wp_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_workplace(wp_id: int, data: WorkplaceUpdate, user: dict = Depends(get_current_user)):
     """사업장 수정"""
     require_admin_level(user, 2)
-    body = await request.json()
+    body = data.model_dump(exclude_unset=True)
+    if not body:
+        raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        allowed = ['name','name_en','address','latitude','longitude','geofence_radius',
-                    'manager_name','manager_phone','worker_capacity','is_active','local_government_id']
-        sets, params = [], []
-        for k, v in body.items():
-            if k in allowed:
-                sets.append(f"{k} = %s")
-                params.append(v)
-        if not sets:
-            raise HTTPException(status_code=400, detail="수정할 항목이 없습니다")
+        params = list(body.values())
         params.append(wp_id)
-        cursor.execute(f"UPDATE kwv_workplaces SET {', '.join(sets)} WHERE id = %s", params)
+        cursor.execute(f"UPDATE kwv_workplaces SET {', '.join(f'{k} = %s' for k in body)} WHERE id = %s", params)
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
         conn.commit()
+        _workplace_cache.clear()
         return {"message": "사업장이 수정되었습니다"}
     finally:
         conn.close()
 
 @router.delete("/workplaces/{wp_id}")
-async def delete_workplace(wp_id: int, user: dict = Depends(get_current_user)):
+def delete_workplace(wp_id: int, user: dict = Depends(get_current_user)):
     """사업장 삭제"""
     require_admin_level(user, 9)
     conn = get_kwv_db_connection()
@@ -2140,12 +2696,13 @@ async def delete_workplace(wp_id: int, user: dict = Depends(get_current_user)):
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
         conn.commit()
+        _workplace_cache.clear()
         return {"message": "사업장이 삭제되었습니다"}
     finally:
         conn.close()
 
 @router.post("/workplaces/{wp_id}/regenerate-qr")
-async def regenerate_qr(wp_id: int, user: dict = Depends(get_current_user)):
+def regenerate_qr(wp_id: int, user: dict = Depends(get_current_user)):
     """QR 코드 재생성"""
     require_admin_level(user, 2)
     conn = get_kwv_db_connection()
@@ -2153,11 +2710,18 @@ async def regenerate_qr(wp_id: int, user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        new_qr = f"WP-{uuid.uuid4().hex[:8].upper()}"
-        cursor.execute("UPDATE kwv_workplaces SET qr_code = %s WHERE id = %s", (new_qr, wp_id))
+        for attempt in range(_QR_CODE_ATTEMPTS):
+            new_qr = _gen_qr_code()
+            try:
+                cursor.execute("UPDATE kwv_workplaces SET qr_code = %s WHERE id = %s", (new_qr, wp_id))
+                break
+            except pymysql.err.IntegrityError as e:
+                if not (e.args and e.args[0] == 1062) or attempt == _QR_CODE_ATTEMPTS - 1:
+                    raise
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
         conn.commit()
+        _workplace_cache.clear()
         return {"qr_code": new_qr, "message": "QR 코드가 재생성되었습니다"}
     finally:
         conn.close()
@@ -2165,10 +2729,9 @@ async def regenerate_qr(wp_id: int, user: dict = Depends(get_current_user)):
 # --- 근로자-사업장 배정 ---
 
 @router.post("/workplaces/{wp_id}/assign")
-async def assign_worker(wp_id: int, request: Request, user: dict = Depends(get_current_user)):
+def assign_worker(wp_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """근로자를 사업장에 배정"""
     require_admin_level(user, 2)
-    body = await request.json()
     user_id = body.get("user_id")
     if not user_id:
         raise HTTPException(status_code=400, detail="user_id가 필요합니다")
@@ -2177,36 +2740,39 @@ async def assign_worker(wp_id: int, request: Request, user: dict = Depends(get_c
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        cursor.execute("SELECT id FROM kwv_workplaces WHERE id = %s", (wp_id,))
-        if not cursor.fetchone():
-            raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
-        cursor.execute("""
-            SELECT id FROM kwv_worker_assignments
-            WHERE user_id = %s AND workplace_id = %s AND status = 'active'
-        """, (user_id, wp_id))
-        if cursor.fetchone():
-            raise HTTPException(status_code=409, detail="이미 배정된 근로자입니다")
-        from datetime import date
-        cursor.execute("""
-            INSERT INTO kwv_worker_assignments (user_id, workplace_id, assigned_date)
-            VALUES (%s, %s, %s)
-        """, (user_id, wp_id, date.today()))
+        # 사업장 존재(FK)와 활성 배정 중복(uk_active_assignment)은 DB 제약으로 검사
+        try:
+            cursor.execute("""
+                INSERT INTO kwv_worker_assignments (user_id, workplace_id, assigned_date)
+                VALUES (%s, %s, %s)
+            """, (user_id, wp_id, date.today()))
+        except pymysql.err.IntegrityError as e:
+            conn.rollback()
+            code = e.args[0] if e.args else None
+            if code == 1062:
+                raise HTTPException(status_code=409, detail="이미 배정된 근로자입니다")
+            if code == 1452:
+                if "workplace_id" in str(e):
+                    raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
+                raise HTTPException(status_code=404, detail="근로자를 찾을 수 없습니다")
+            raise
         conn.commit()
+        _workplace_cache.clear()
         return {"message": "근로자가 사업장에 배정되었습니다"}
     finally:
         conn.close()
 
 @router.get("/workplaces/{wp_id}/workers")
-async def workplace_workers(wp_id: int, user: dict = Depends(get_current_user)):
+def workplace_workers(wp_id: int, user: dict = Depends(get_current_user)):
     """사업장 소속 근로자 목록"""
     require_admin(user)
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT wa.id, wa.user_id, u.name, u.email, u.phone, u.profile_photo,
+            SELECT wa.id AS assignment_id, wa.user_id, u.name, u.email, u.phone, u.profile_photo,
                    va.nationality, va.visa_type, wa.assigned_date, wa.status
             FROM kwv_worker_assignments wa
             JOIN kwv_users u ON wa.user_id = u.id
@@ -2214,17 +2780,15 @@ async def workplace_workers(wp_id: int, user: dict = Depends(get_current_user)):
             WHERE wa.workplace_id = %s AND wa.status = 'active'
             ORDER BY u.name
         """, (wp_id,))
-        return [{
-            "assignment_id": r[0], "user_id": r[1], "name": r[2], "email": r[3],
-            "phone": r[4], "profile_photo": r[5], "nationality": r[6],
-            "visa_type": r[7], "assigned_date": r[8].isoformat() if r[8] else None,
-            "status": r[9]
-        } for r in cursor.fetchall()]
+        rows = cursor.fetchall()
+        for r in rows:
+            r["assigned_date"] = r["assigned_date"].isoformat() if r["assigned_date"] else None
+        return rows
     finally:
         conn.close()
 
 @router.delete("/worker-assignments/{assignment_id}")
-async def remove_assignment(assignment_id: int, user: dict = Depends(get_current_user)):
+def remove_assignment(assignment_id: int, user: dict = Depends(get_current_user)):
     """근로자 사업장 배정 해제"""
     require_admin_level(user, 2)
     conn = get_kwv_db_connection()
@@ -2236,89 +2800,221 @@ async def remove_assignment(assignment_id: int, user: dict = Depends(get_current
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="배정을 찾을 수 없습니다")
         conn.commit()
+        _workplace_cache.clear()
         return {"message": "배정이 해제되었습니다"}
     finally:
         conn.close()
 
 # --- 출퇴근 체크인/체크아웃 ---
 
-@router.post("/attendance/check")
-async def attendance_check(data: AttendanceCheck, request: Request, user: dict = Depends(get_current_user)):
-    """출퇴근 체크 (QR / GPS)"""
+_ATTENDANCE_INSERT_SQL = """
+    INSERT INTO kwv_attendance (user_id, workplace_id, check_type, check_method,
+        latitude, longitude, distance_from_workplace, is_valid, invalid_reason,
+        photo_url, ip_address, note)
+    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+"""
+
+class _AttendanceWriter:
+    """출퇴근 INSERT 그룹 커밋 - 동시에 들어온 기록을 모아 한 번의 INSERT/COMMIT으로 저장
+
+    요청 스레드는 자기 기록이 커밋될 때까지 기다리므로 응답 시점의 내구성은 그대로이고,
+    출퇴근 시간대처럼 요청이 몰릴 때만 여러 건이 하나의 fsync를 공유함
+    """
+
+    MAX_BATCH = 500
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        # 연결별 다중 행 INSERT id 간격 (작성 스레드 하나에서만 접근)
+        self._id_steps = weakref.WeakKeyDictionary()
+
+    def insert(self, row: tuple) -> int:
+        """기록 저장 후 id 반환 (실패 시 해당 예외를 그대로 전달)"""
+        item = {"row": row, "done": threading.Event(), "id": None, "error": None}
+        self._ensure_started()
+        self._queue.put(item)
+        item["done"].wait()
+        if item["error"] is not None:
+            raise item["error"]
+        return item["id"]
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="kwv-attendance-writer", daemon=True)
+                    self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush(batch)
+            except Exception as e:
+                for item in batch:
+                    if item["id"] is None and item["error"] is None:
+                        item["error"] = e
+            finally:
+                for item in batch:
+                    item["done"].set()
+
+    def _id_step(self, conn, cursor) -> int:
+        """다중 행 INSERT의 id 간격 (@@auto_increment_increment) - 연결당 1회 조회
+        innodb_autoinc_lock_mode=2(Galera 필수 설정)는 한 문장 안에서도 연속 할당을 보장하지 않으므로 0"""
+        raw = conn._conn
+        step = self._id_steps.get(raw)
+        if step is None:
+            cursor.execute("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+            increment, lock_mode = cursor.fetchone()
+            step = 0 if int(lock_mode) == 2 else int(increment)
+            self._id_steps[raw] = step
+        return step
+
+    @staticmethod
+    def _fits_one_statement(cursor, batch: list) -> bool:
+        """executemany가 max_stmt_length를 넘으면 여러 문장으로 나뉘어 lastrowid가 마지막 문장 기준이 됨
+        → 이스케이프 후 최대 길이(문자열 2배)로 보수적으로 추정해 한 문장에 들어가는지 확인"""
+        size = len(_ATTENDANCE_INSERT_SQL)
+        for item in batch:
+            for v in item["row"]:
+                size += 2 * len(v.encode()) + 3 if isinstance(v, str) else 24
+        return size <= cursor.max_stmt_length
+
+    def _flush(self, batch: list):
+        conn = get_kwv_db_connection()
+        if not conn:
+            raise HTTPException(status_code=503, detail="DB connection failed")
+        try:
+            cursor = conn.cursor()
+            try:
+                step = self._id_step(conn, cursor)
+                if step and self._fits_one_statement(cursor, batch):
+                    # 다중 행 INSERT 한 문장 → AUTO_INCREMENT id가 step 간격으로 연속 할당됨
+                    cursor.executemany(_ATTENDANCE_INSERT_SQL, [item["row"] for item in batch])
+                    conn.commit()
+                    for i, item in enumerate(batch):
+                        item["id"] = cursor.lastrowid + i * step
+                else:
+                    # 연속 할당 보장 없음 또는 한 문장 초과 → 한 건씩 INSERT해 id를 받고 커밋만 한 번
+                    ids = []
+                    for item in batch:
+                        cursor.execute(_ATTENDANCE_INSERT_SQL, item["row"])
+                        ids.append(cursor.lastrowid)
+                    conn.commit()
+                    for item, row_id in zip(batch, ids):
+                        item["id"] = row_id
+                return
+            except (pymysql.IntegrityError, pymysql.DataError):
+                conn.rollback()
+            # 제약 위반/범위 초과 행이 섞인 경우 한 건씩 저장해 실패를 해당 요청에만 돌려줌
+            for item in batch:
+                try:
+                    cursor.execute(_ATTENDANCE_INSERT_SQL, item["row"])
+                    conn.commit()
+                    item["id"] = cursor.lastrowid
+                except (pymysql.IntegrityError, pymysql.DataError) as e:
+                    conn.rollback()
+                    item["error"] = e
+        finally:
+            conn.close()
+
+_attendance_writer = _AttendanceWriter()
+
+def _checkin_workplace(workplace_id: Optional[int], qr_code: Optional[str]) -> tuple:
+    """체크인 대상 사업장 (id, 위도, 경도, 허용 반경, 이름) - ID 또는 QR 코드로 조회, 캐시 우선"""
+    key = ("checkin", "id", workplace_id) if workplace_id else ("checkin", "qr", qr_code)
+    cached = _workplace_cache.get(key)
+    if cached is not None:
+        return cached
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        # QR 코드로 사업장 찾기
-        workplace_id = data.workplace_id
-        if data.qr_code and not workplace_id:
-            cursor.execute("SELECT id FROM kwv_workplaces WHERE qr_code = %s AND is_active = 1", (data.qr_code,))
-            wp = cursor.fetchone()
-            if not wp:
+        if workplace_id:
+            cursor.execute("SELECT id, latitude, longitude, geofence_radius, name FROM kwv_workplaces WHERE id = %s",
+                           (workplace_id,))
+            row = cursor.fetchone()
+            if not row:
+                raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
+        else:
+            cursor.execute("SELECT id, latitude, longitude, geofence_radius, name FROM kwv_workplaces WHERE qr_code = %s AND is_active = 1",
+                           (qr_code,))
+            row = cursor.fetchone()
+            if not row:
                 raise HTTPException(status_code=404, detail="유효하지 않은 QR 코드입니다")
-            workplace_id = wp[0]
+    finally:
+        conn.close()
+    wp_id, lat, lon, radius, name = row
+    wp = (wp_id, float(lat) if lat else None, float(lon) if lon else None, radius or 200, name)
+    _workplace_cache.set(key, wp)
+    return wp
 
-        if not workplace_id:
-            raise HTTPException(status_code=400, detail="사업장 ID 또는 QR 코드가 필요합니다")
+@router.post("/attendance/check")
+def attendance_check(data: AttendanceCheck, request: Request, user: dict = Depends(get_current_user)):
+    """출퇴근 체크 (QR / GPS)"""
+    if not data.workplace_id and not data.qr_code:
+        raise HTTPException(status_code=400, detail="사업장 ID 또는 QR 코드가 필요합니다")
+    workplace_id, wp_lat, wp_lon, wp_radius, wp_name = _checkin_workplace(data.workplace_id, data.qr_code)
+
+    # GPS 거리 검증
+    distance = None
+    is_valid = True
+    invalid_reason = None
+    check_method = 'qr' if data.qr_code else 'gps'
+
+    if data.latitude and data.longitude and wp_lat and wp_lon:
+        distance = int(haversine(float(data.latitude), float(data.longitude), wp_lat, wp_lon))
+        if distance > wp_radius:
+            is_valid = False
+            invalid_reason = f"사업장에서 {distance}m 떨어져 있습니다 (허용: {wp_radius}m)"
 
-        # 사업장 정보
-        cursor.execute("SELECT latitude, longitude, geofence_radius, name FROM kwv_workplaces WHERE id = %s", (workplace_id,))
-        wp_info = cursor.fetchone()
-        if not wp_info:
-            raise HTTPException(status_code=404, detail="사업장을 찾을 수 없습니다")
-        wp_lat, wp_lon, wp_radius, wp_name = wp_info
-        wp_radius = wp_radius or 200
-
-        # GPS 거리 검증
-        distance = None
-        is_valid = True
-        invalid_reason = None
-        check_method = 'qr' if data.qr_code else 'gps'
-
-        if data.latitude and data.longitude and wp_lat and wp_lon:
-            distance = int(haversine(float(data.latitude), float(data.longitude), float(wp_lat), float(wp_lon)))
-            if distance > wp_radius:
-                is_valid = False
-                invalid_reason = f"사업장에서 {distance}m 떨어져 있습니다 (허용: {wp_radius}m)"
-
-        # 중복 체크 (같은 날 같은 타입 5분 이내 중복 방지)
-        user_id = user.get("user_id") or user.get("sub")
-        cursor.execute("""
-            SELECT id FROM kwv_attendance
-            WHERE user_id = %s AND workplace_id = %s AND check_type = %s
-            AND check_time > DATE_SUB(NOW(), INTERVAL 5 MINUTE)
-        """, (user_id, workplace_id, data.check_type))
-        if cursor.fetchone():
-            raise HTTPException(status_code=429, detail="5분 이내 중복 체크입니다")
+    user_id = user.get("user_id") or user.get("sub")
 
-        # IP 주소
-        ip = request.client.host if request.client else None
+    # IP 주소
+    ip = request.client.host if request.client else None
 
-        cursor.execute("""
-            INSERT INTO kwv_attendance (user_id, workplace_id, check_type, check_method,
-                latitude, longitude, distance_from_workplace, is_valid, invalid_reason,
-                photo_url, ip_address, note)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
-        """, (user_id, workplace_id, data.check_type, check_method,
-              data.latitude, data.longitude, distance, is_valid, invalid_reason,
-              data.photo_url, ip, data.note))
-        conn.commit()
+    # 5분 단위 중복 체크는 uk_attendance_dedup(time_bucket) 제약으로 INSERT 시 원자적으로 검사
+    try:
+        attendance_id = _attendance_writer.insert((
+            user_id, workplace_id, data.check_type, check_method,
+            data.latitude, data.longitude, distance, is_valid, invalid_reason,
+            data.photo_url, ip, data.note))
+    except pymysql.err.IntegrityError as e:
+        if e.args and e.args[0] == 1062:
+            raise HTTPException(status_code=429, detail="5분 이내 중복 체크입니다")
+        raise
+    except pymysql.err.DataError:
+        raise HTTPException(status_code=400, detail="출퇴근 기록 값이 올바르지 않습니다")
 
-        status_text = "출근" if data.check_type == "check_in" else "퇴근"
-        return {
-            "id": cursor.lastrowid,
-            "message": f"{wp_name} {status_text} 완료",
-            "is_valid": is_valid,
-            "distance": distance,
-            "check_time": datetime.utcnow().isoformat(),
-            "invalid_reason": invalid_reason
-        }
-    finally:
-        conn.close()
+    status_text = "출근" if data.check_type == "check_in" else "퇴근"
+    return {
+        "id": attendance_id,
+        "message": f"{wp_name} {status_text} 완료",
+        "is_valid": is_valid,
+        "distance": distance,
+        "check_time": datetime.utcnow().isoformat(),
+        "invalid_reason": invalid_reason
+    }
+
+def _attendance_item(row: dict) -> dict:
+    """출퇴근 기록 행 변환 (check_time → ISO, is_valid → bool, 좌표 → float)"""
+    row["check_time"] = row["check_time"].isoformat() if row["check_time"] else None
+    row["is_valid"] = bool(row["is_valid"])
+    if "latitude" in row:
+        row["latitude"] = float(row["latitude"]) if row["latitude"] else None
+        row["longitude"] = float(row["longitude"]) if row["longitude"] else None
+    return row
 
 @router.get("/attendance/my")
-async def my_attendance(
+def my_attendance(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     user: dict = Depends(get_current_user)
@@ -2329,67 +3025,54 @@ async def my_attendance(
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE a.user_id = %s"
         params = [user_id]
         if date_from:
-            where += " AND DATE(a.check_time) >= %s"
+            where += " AND a.check_time >= %s"
             params.append(date_from)
         if date_to:
-            where += " AND DATE(a.check_time) <= %s"
+            where += " AND a.check_time < DATE_ADD(%s, INTERVAL 1 DAY)"
             params.append(date_to)
         cursor.execute(f"""
             SELECT a.id, a.check_type, a.check_method, a.check_time, a.is_valid,
-                   a.distance_from_workplace, a.invalid_reason, w.name as workplace_name
+                   a.distance_from_workplace AS distance, a.invalid_reason, w.name as workplace_name
             FROM kwv_attendance a
             JOIN kwv_workplaces w ON a.workplace_id = w.id
             {where} ORDER BY a.check_time DESC LIMIT 100
         """, params)
-        return [{
-            "id": r[0], "check_type": r[1], "check_method": r[2],
-            "check_time": r[3].isoformat() if r[3] else None,
-            "is_valid": bool(r[4]), "distance": r[5], "invalid_reason": r[6],
-            "workplace_name": r[7]
-        } for r in cursor.fetchall()]
+        return [_attendance_item(r) for r in cursor.fetchall()]
     finally:
         conn.close()
 
 @router.get("/attendance/today")
-async def my_today(user: dict = Depends(get_current_user)):
+def my_today(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """오늘의 출퇴근 상태"""
     user_id = user.get("user_id") or user.get("sub")
     conn = get_kwv_db_connection()
     if not conn:
         return {"checked_in": False, "records": []}
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT a.id, a.check_type, a.check_time, a.is_valid, w.name
+            SELECT a.id, a.check_type, a.check_time, a.is_valid, w.name AS workplace_name
             FROM kwv_attendance a
             JOIN kwv_workplaces w ON a.workplace_id = w.id
-            WHERE a.user_id = %s AND DATE(a.check_time) = CURDATE()
+            WHERE a.user_id = %s AND a.check_time >= CURDATE() AND a.check_time < CURDATE() + INTERVAL 1 DAY
             ORDER BY a.check_time ASC
         """, (user_id,))
-        records = []
-        last_type = None
-        for r in cursor.fetchall():
-            records.append({
-                "id": r[0], "check_type": r[1],
-                "check_time": r[2].isoformat() if r[2] else None,
-                "is_valid": bool(r[3]), "workplace_name": r[4]
-            })
-            last_type = r[1]
-        return {
-            "checked_in": last_type == "check_in",
+        records = [_attendance_item(r) for r in cursor.fetchall()]
+        return json_payload_response(json_payload({
+            "checked_in": bool(records) and records[-1]["check_type"] == "check_in",
             "records": records
-        }
+        }), if_none_match)
     finally:
         conn.close()
 
 # --- 관리자 출퇴근 조회 ---
 
 @router.get("/attendance/admin")
-async def admin_attendance(
+def admin_attendance(
     workplace_id: Optional[int] = None,
     user_id: Optional[int] = None,
     date_from: Optional[str] = None,
@@ -2397,15 +3080,23 @@ async def admin_attendance(
     is_valid: Optional[str] = None,
     page: int = 1,
     per_page: int = 50,
+    after: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
-    """관리자 출퇴근 조회"""
+    """관리자 출퇴근 조회 (after=next_cursor 전달 시 OFFSET 없이 다음 페이지 조회)"""
     require_admin(user)
+    after_time = after_id = None
+    if after:
+        try:
+            t, i = after.rsplit('|', 1)
+            after_time, after_id = datetime.fromisoformat(t), int(i)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다")
     conn = get_kwv_db_connection()
     if not conn:
         return {"items": [], "total": 0}
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE 1=1"
         params = []
         if workplace_id:
@@ -2415,99 +3106,85 @@ async def admin_attendance(
             where += " AND a.user_id = %s"
             params.append(user_id)
         if date_from:
-            where += " AND DATE(a.check_time) >= %s"
+            where += " AND a.check_time >= %s"
             params.append(date_from)
         if date_to:
-            where += " AND DATE(a.check_time) <= %s"
+            where += " AND a.check_time < DATE_ADD(%s, INTERVAL 1 DAY)"
             params.append(date_to)
         if is_valid == 'true':
             where += " AND a.is_valid = 1"
         elif is_valid == 'false':
             where += " AND a.is_valid = 0"
 
-        cursor.execute(f"SELECT COUNT(*) FROM kwv_attendance a {where}", params)
-        total = cursor.fetchone()[0]
-
-        offset = (page - 1) * per_page
+        # 전체 건수는 필터 조합별로 잠시 캐시 (페이지 이동마다 COUNT 재실행 방지)
+        count_key = ("attendance_count", where, tuple(params))
+        total = _stats_cache.get(count_key)
+        if total is None:
+            cursor.execute(f"SELECT COUNT(*) AS cnt FROM kwv_attendance a {where}", params)
+            total = cursor.fetchone()["cnt"]
+            _stats_cache.set(count_key, total, ttl=30)
+
+        if after_time is not None:
+            where += " AND (a.check_time < %s OR (a.check_time = %s AND a.id < %s))"
+            params += [after_time, after_time, after_id]
+            offset = 0
+        else:
+            offset = (page - 1) * per_page
         cursor.execute(f"""
             SELECT a.id, a.user_id, u.name as user_name, u.profile_photo,
                    va.nationality, a.workplace_id, w.name as workplace_name,
                    a.check_type, a.check_method, a.check_time, a.is_valid,
-                   a.distance_from_workplace, a.invalid_reason, a.latitude, a.longitude
+                   a.distance_from_workplace AS distance, a.invalid_reason, a.latitude, a.longitude
             FROM kwv_attendance a
             JOIN kwv_users u ON a.user_id = u.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
             JOIN kwv_workplaces w ON a.workplace_id = w.id
-            {where} ORDER BY a.check_time DESC LIMIT %s OFFSET %s
+            {where} ORDER BY a.check_time DESC, a.id DESC LIMIT %s OFFSET %s
         """, params + [per_page, offset])
-        items = [{
-            "id": r[0], "user_id": r[1], "user_name": r[2], "profile_photo": r[3],
-            "nationality": r[4], "workplace_id": r[5], "workplace_name": r[6],
-            "check_type": r[7], "check_method": r[8],
-            "check_time": r[9].isoformat() if r[9] else None,
-            "is_valid": bool(r[10]), "distance": r[11], "invalid_reason": r[12],
-            "latitude": float(r[13]) if r[13] else None,
-            "longitude": float(r[14]) if r[14] else None
-        } for r in cursor.fetchall()]
-        return {"items": items, "total": total, "page": page, "per_page": per_page}
+        items = [_attendance_item(r) for r in cursor.fetchall()]
+        next_cursor = None
+        if len(items) == per_page and items[-1]["check_time"]:
+            next_cursor = f"{items[-1]['check_time']}|{items[-1]['id']}"
+        return {"items": items, "total": total, "page": page, "per_page": per_page, "next_cursor": next_cursor}
     finally:
         conn.close()
 
 @router.get("/attendance/admin/summary")
-async def attendance_summary(
+def attendance_summary(
     date: Optional[str] = None,
     workplace_id: Optional[int] = None,
     user: dict = Depends(get_current_user)
 ):
     """출퇴근 요약 (일별)"""
     require_admin(user)
+    target_date = date or datetime.utcnow().strftime('%Y-%m-%d')
+    cache_key = ("attendance_summary", target_date, workplace_id)
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return cached
     conn = get_kwv_db_connection()
     if not conn:
         return {}
     try:
         cursor = conn.cursor()
-        target_date = date or datetime.utcnow().strftime('%Y-%m-%d')
         wp_filter = "AND a.workplace_id = %s" if workplace_id else ""
-        params_base = [target_date] + ([workplace_id] if workplace_id else [])
-
-        # 총 출근자 수
-        cursor.execute(f"""
-            SELECT COUNT(DISTINCT a.user_id)
-            FROM kwv_attendance a
-            WHERE DATE(a.check_time) = %s AND a.check_type = 'check_in' {wp_filter}
-        """, params_base)
-        total_checkins = cursor.fetchone()[0]
-
-        # 유효/무효
-        cursor.execute(f"""
-            SELECT a.is_valid, COUNT(*)
-            FROM kwv_attendance a
-            WHERE DATE(a.check_time) = %s {wp_filter}
-            GROUP BY a.is_valid
-        """, params_base)
-        valid_count, invalid_count = 0, 0
-        for r in cursor.fetchall():
-            if r[0]:
-                valid_count = r[1]
-            else:
-                invalid_count = r[1]
+        wa_filter = "AND workplace_id = %s" if workplace_id else ""
+        wp_params = [workplace_id] if workplace_id else []
 
-        # 퇴근자 수
+        # 출근자/퇴근자 수, 유효/무효 건수, 총 등록 근로자(활성 배정)를 한 번에 집계
         cursor.execute(f"""
-            SELECT COUNT(DISTINCT a.user_id)
+            SELECT COUNT(DISTINCT CASE WHEN a.check_type = 'check_in' THEN a.user_id END),
+                   COUNT(DISTINCT CASE WHEN a.check_type = 'check_out' THEN a.user_id END),
+                   COALESCE(SUM(CASE WHEN a.is_valid THEN 1 ELSE 0 END), 0),
+                   COALESCE(SUM(CASE WHEN a.is_valid THEN 0 ELSE 1 END), 0),
+                   (SELECT COUNT(*) FROM kwv_worker_assignments WHERE status = 'active' {wa_filter})
             FROM kwv_attendance a
-            WHERE DATE(a.check_time) = %s AND a.check_type = 'check_out' {wp_filter}
-        """, params_base)
-        total_checkouts = cursor.fetchone()[0]
+            WHERE a.check_time >= %s AND a.check_time < DATE_ADD(%s, INTERVAL 1 DAY) {wp_filter}
+        """, wp_params + [target_date, target_date] + wp_params)
+        total_checkins, total_checkouts, valid_count, invalid_count, total_workers = cursor.fetchone()
+        valid_count, invalid_count = int(valid_count), int(invalid_count)
 
-        # 총 등록 근로자 (활성 배정)
-        if workplace_id:
-            cursor.execute("SELECT COUNT(*) FROM kwv_worker_assignments WHERE workplace_id = %s AND status = 'active'", (workplace_id,))
-        else:
-            cursor.execute("SELECT COUNT(*) FROM kwv_worker_assignments WHERE status = 'active'")
-        total_workers = cursor.fetchone()[0]
-
-        return {
+        summary = {
             "date": target_date,
             "total_workers": total_workers,
             "total_checkins": total_checkins,
@@ -2516,14 +3193,15 @@ async def attendance_summary(
             "invalid_records": invalid_count,
             "attendance_rate": round(total_checkins / total_workers * 100, 1) if total_workers > 0 else 0
         }
+        _stats_cache.set(cache_key, summary, ttl=30)
+        return summary
     finally:
         conn.close()
 
 @router.post("/attendance/admin/manual")
-async def admin_manual_check(request: Request, user: dict = Depends(get_current_user)):
+def admin_manual_check(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """관리자 수동 출퇴근 등록"""
     require_admin_level(user, 2)
-    body = await request.json()
     target_user_id = body.get("user_id")
     workplace_id = body.get("workplace_id")
     check_type = body.get("check_type", "check_in")
@@ -2535,10 +3213,15 @@ async def admin_manual_check(request: Request, user: dict = Depends(get_current_
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
         cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO kwv_attendance (user_id, workplace_id, check_type, check_method, is_valid, note)
-            VALUES (%s, %s, %s, 'admin', 1, %s)
-        """, (target_user_id, workplace_id, check_type, note))
+        try:
+            cursor.execute("""
+                INSERT INTO kwv_attendance (user_id, workplace_id, check_type, check_method, is_valid, note)
+                VALUES (%s, %s, %s, 'admin', 1, %s)
+            """, (target_user_id, workplace_id, check_type, note))
+        except pymysql.err.IntegrityError as e:
+            if e.args and e.args[0] == 1062:
+                raise HTTPException(status_code=429, detail="5분 이내 중복 체크입니다")
+            raise
         conn.commit()
         return {"id": cursor.lastrowid, "message": "수동 출퇴근 등록 완료"}
     finally:
@@ -2560,7 +3243,7 @@ class ActivityCreate(BaseModel):
 # --- 활동일지 ---
 
 @router.post("/activities")
-async def create_activity(data: ActivityCreate, user: dict = Depends(get_current_user)):
+def create_activity(data: ActivityCreate, user: dict = Depends(get_current_user)):
     """활동일지 작성"""
     user_id = user.get("user_id") or user.get("sub")
     conn = get_kwv_db_connection()
@@ -2582,8 +3265,8 @@ async def create_activity(data: ActivityCreate, user: dict = Depends(get_current
     finally:
         conn.close()
 
-@router.get("/activities/my")
-async def my_activities(
+@router.get("/activities/my", response_class=ORJSONResponse)
+def my_activities(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     status: Optional[str] = None,
@@ -2595,7 +3278,7 @@ async def my_activities(
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE a.user_id = %s"
         params = [user_id]
         if date_from:
@@ -2608,24 +3291,66 @@ async def my_activities(
             where += " AND a.status = %s"
             params.append(status)
         cursor.execute(f"""
-            SELECT a.id, a.activity_date, a.activity_type, a.title, a.content, a.hours,
-                   a.photo_url, a.status, a.created_at, w.name as workplace_name
+            SELECT a.id, a.activity_date, a.activity_type, a.title, a.content,
+                   COALESCE(a.hours, 0) AS hours,
+                   a.photo_url, a.status, a.created_at, w.name AS workplace_name
             FROM kwv_activity_logs a
             LEFT JOIN kwv_workplaces w ON a.workplace_id = w.id
             {where} ORDER BY a.activity_date DESC LIMIT 100
         """, params)
-        return [{
-            "id": r[0], "activity_date": r[1].isoformat() if r[1] else None,
-            "activity_type": r[2], "title": r[3], "content": r[4], "hours": float(r[5]) if r[5] else 0,
-            "photo_url": r[6], "status": r[7],
-            "created_at": r[8].isoformat() if r[8] else None,
-            "workplace_name": r[9]
-        } for r in cursor.fetchall()]
+        return cursor.fetchall()
     finally:
         conn.close()
 
-@router.get("/activities/admin")
-async def admin_activities(
+def _window_total(cursor, rows, offset: int, count_sql: str, params, keyset: bool = False) -> int:
+    """DictCursor 행의 total(COUNT(*) OVER())을 떼어 전체 건수 반환
+    범위를 벗어난 페이지와 keyset 페이지(total 미계산)는 별도 COUNT (30초 캐시)"""
+    total = rows[0]["total"] if rows else None
+    for r in rows:
+        del r["total"]
+    if total is not None and not keyset:
+        return total
+    if not keyset and not offset:
+        return 0
+    count_key = ("list_count", count_sql, tuple(params))
+    total = _stats_cache.get(count_key)
+    if total is None:
+        cursor.execute(count_sql, params)
+        total = cursor.fetchone()["total"]
+        _stats_cache.set(count_key, total, ttl=30)
+    return total
+
+def _parse_cursor(after: Optional[str], parsers: tuple) -> Optional[tuple]:
+    """cursor("값|값|...")를 parsers 순서대로 변환 - 형식 오류 시 400"""
+    if not after:
+        return None
+    parts = after.split('|')
+    try:
+        if len(parts) != len(parsers):
+            raise ValueError(after)
+        return tuple(parse(v) for parse, v in zip(parsers, parts))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다")
+
+def _parse_list_cursor(after: Optional[str]) -> Optional[tuple]:
+    """목록 cursor("날짜|작성시각|id") 파싱"""
+    return _parse_cursor(after, (date.fromisoformat, datetime.fromisoformat, int))
+
+def _keyset_after(date_col: str, created_col: str, id_col: str, key: tuple) -> tuple:
+    """(날짜/점수, 작성시각, id) 내림차순 정렬에서 key 다음 행들 조건 + 파라미터"""
+    d, c, i = key
+    return (f" AND ({date_col} < %s OR ({date_col} = %s AND ({created_col} < %s"
+            f" OR ({created_col} = %s AND {id_col} < %s))))", [d, d, c, c, i])
+
+def _next_list_cursor(items: list, per_page: int, date_key: str) -> Optional[str]:
+    """마지막 행 기준 다음 페이지 cursor (마지막 페이지면 None)"""
+    if len(items) < per_page or not items[-1][date_key] or not items[-1]["created_at"]:
+        return None
+    last = items[-1]
+    return f"{last[date_key].isoformat()}|{last['created_at'].isoformat()}|{last['id']}"
+
+@router.get("/activities/admin", response_class=ORJSONResponse)
+def admin_activities(
     user_id: Optional[int] = None,
     workplace_id: Optional[int] = None,
     status: Optional[str] = None,
@@ -2633,15 +3358,17 @@ async def admin_activities(
     date_to: Optional[str] = None,
     page: int = 1,
     per_page: int = 30,
+    after: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
-    """관리자 활동일지 조회"""
+    """관리자 활동일지 조회 (after=next_cursor 전달 시 OFFSET 없이 다음 페이지 조회)"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    after_key = _parse_list_cursor(after)
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return {"items": [], "total": 0}
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE 1=1"
         params = []
         if user_id:
@@ -2660,34 +3387,42 @@ async def admin_activities(
             where += " AND a.activity_date <= %s"
             params.append(date_to)
 
-        cursor.execute(f"SELECT COUNT(*) FROM kwv_activity_logs a {where}", params)
-        total = cursor.fetchone()[0]
+        count_sql = f"SELECT COUNT(*) AS total FROM kwv_activity_logs a {where}"
+        count_params = list(params)
         offset = (page - 1) * per_page
+        total_expr = "COUNT(*) OVER()"
+        if after_key:
+            clause, key_params = _keyset_after("a.activity_date", "a.created_at", "a.id", after_key)
+            where += clause
+            params += key_params
+            offset = 0
+            total_expr = "NULL"
+        # 지연 조인: 현재 페이지 id만 먼저 고른 뒤 그 행들에만 JOIN
         cursor.execute(f"""
-            SELECT a.id, a.user_id, u.name as user_name, u.profile_photo,
-                   va.nationality, a.workplace_id, w.name as workplace_name,
-                   a.activity_date, a.activity_type, a.title, a.content, a.hours,
-                   a.photo_url, a.status, a.created_at
-            FROM kwv_activity_logs a
+            SELECT a.id, a.user_id, u.name AS user_name, u.profile_photo,
+                   va.nationality, a.workplace_id, w.name AS workplace_name,
+                   a.activity_date, a.activity_type, a.title, a.content,
+                   COALESCE(a.hours, 0) AS hours,
+                   a.photo_url, a.status, a.created_at, pg.total
+            FROM (
+                SELECT a.id, {total_expr} AS total FROM kwv_activity_logs a
+                {where} ORDER BY a.activity_date DESC, a.created_at DESC, a.id DESC LIMIT %s OFFSET %s
+            ) pg
+            JOIN kwv_activity_logs a ON a.id = pg.id
             JOIN kwv_users u ON a.user_id = u.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
             LEFT JOIN kwv_workplaces w ON a.workplace_id = w.id
-            {where} ORDER BY a.activity_date DESC, a.created_at DESC LIMIT %s OFFSET %s
+            ORDER BY a.activity_date DESC, a.created_at DESC, a.id DESC
         """, params + [per_page, offset])
-        items = [{
-            "id": r[0], "user_id": r[1], "user_name": r[2], "profile_photo": r[3],
-            "nationality": r[4], "workplace_id": r[5], "workplace_name": r[6],
-            "activity_date": r[7].isoformat() if r[7] else None,
-            "activity_type": r[8], "title": r[9], "content": r[10],
-            "hours": float(r[11]) if r[11] else 0, "photo_url": r[12],
-            "status": r[13], "created_at": r[14].isoformat() if r[14] else None
-        } for r in cursor.fetchall()]
-        return {"items": items, "total": total, "page": page, "per_page": per_page}
+        items = cursor.fetchall()
+        total = _window_total(cursor, items, offset, count_sql, count_params, keyset=after_key is not None)
+        return {"items": items, "total": total, "page": page, "per_page": per_page,
+                "next_cursor": _next_list_cursor(items, per_page, "activity_date")}
     finally:
         conn.close()
 
 @router.put("/activities/{activity_id}/approve")
-async def approve_activity(activity_id: int, user: dict = Depends(get_current_user)):
+def approve_activity(activity_id: int, user: dict = Depends(get_current_user)):
     """활동일지 승인"""
     require_admin_level(user, 2)
     admin_id = user.get("user_id") or user.get("sub")
@@ -2702,21 +3437,28 @@ async def approve_activity(activity_id: int, user: dict = Depends(get_current_us
         """, (admin_id, activity_id))
         if cursor.rowcount == 0:
             raise HTTPException(status_code=404, detail="활동일지를 찾을 수 없거나 이미 처리되었습니다")
-        # 활동일지 작성자에게 승인 포인트
-        cursor.execute("SELECT user_id FROM kwv_activity_logs WHERE id = %s", (activity_id,))
-        row = cursor.fetchone()
-        if row:
-            add_points(cursor, row[0], 'activity', 'activity_log', activity_id, 'activity_approved')
+        # 활동일지 작성자에게 승인 포인트 (작성자 조회 없이 INSERT ... SELECT)
+        pts = _active_point_rules(cursor).get('activity_approved')
+        if pts:
+            cursor.execute("""
+                INSERT INTO kwv_points (user_id, points, point_type, reference_type, reference_id, description)
+                SELECT user_id, %s, 'activity', 'activity_log', id, 'activity_approved'
+                FROM kwv_activity_logs WHERE id = %s
+            """, (pts, activity_id))
+            cursor.execute("""
+                INSERT INTO kwv_user_points_total (user_id, total_points)
+                SELECT user_id, %s FROM kwv_activity_logs WHERE id = %s
+                ON DUPLICATE KEY UPDATE total_points = total_points + VALUES(total_points)
+            """, (pts, activity_id))
         conn.commit()
         return {"message": "활동일지가 승인되었습니다"}
     finally:
         conn.close()
 
 @router.put("/activities/{activity_id}/reject")
-async def reject_activity(activity_id: int, request: Request, user: dict = Depends(get_current_user)):
+def reject_activity(activity_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """활동일지 반려"""
     require_admin_level(user, 2)
-    body = await request.json()
     reason = body.get("reason", "")
     conn = get_kwv_db_connection()
     if not conn:
@@ -2736,75 +3478,93 @@ async def reject_activity(activity_id: int, request: Request, user: dict = Depen
 
 # --- 포인트 시스템 ---
 
+# 포인트 규칙 캐시: "active" rule_key → points, "list" 규칙 목록 응답 (규칙 수정 시 무효화)
+_point_rules_cache = _TTLCache(maxsize=2, ttl=300)
+
+def _active_point_rules(cursor) -> dict:
+    """활성 포인트 규칙 조회 (캐시 미스 시 전체를 한 번에 로드)"""
+    rules = _point_rules_cache.get("active")
+    if rules is None:
+        cursor.execute("SELECT rule_key, points FROM kwv_point_rules WHERE is_active = 1")
+        rules = dict(cursor.fetchall())
+        _point_rules_cache.set("active", rules)
+    return rules
+
+_POINTS_TOTAL_UPSERT_SQL = """
+    INSERT INTO kwv_user_points_total (user_id, total_points) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE total_points = total_points + VALUES(total_points)
+"""
+
 def add_points(cursor, user_id: int, point_type: str, ref_type: str, ref_id: int, rule_key: str, created_by: int = None):
     """포인트 자동 적립 헬퍼"""
-    cursor.execute("SELECT points FROM kwv_point_rules WHERE rule_key = %s AND is_active = 1", (rule_key,))
-    row = cursor.fetchone()
-    if not row or row[0] == 0:
+    pts = _active_point_rules(cursor).get(rule_key)
+    if not pts:
         return 0
-    pts = row[0]
     cursor.execute("""
         INSERT INTO kwv_points (user_id, points, point_type, reference_type, reference_id, description, created_by)
         VALUES (%s, %s, %s, %s, %s, %s, %s)
     """, (user_id, pts, point_type, ref_type, ref_id, rule_key, created_by))
+    cursor.execute(_POINTS_TOTAL_UPSERT_SQL, (user_id, pts))
     return pts
 
-@router.get("/points/my")
-async def my_points(user: dict = Depends(get_current_user)):
+@router.get("/points/my", response_class=ORJSONResponse)
+def my_points(user: dict = Depends(get_current_user)):
     """내 포인트 현황"""
     user_id = user.get("user_id") or user.get("sub")
     conn = get_kwv_db_connection()
     if not conn:
         return {"total": 0, "history": []}
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT COALESCE(SUM(points),0) FROM kwv_points WHERE user_id = %s", (user_id,))
-        total = cursor.fetchone()[0]
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        # 합계는 LIMIT 적용 전 전체 행 기준 SUM() OVER()로 함께 조회
         cursor.execute("""
-            SELECT id, points, point_type, description, created_at
+            SELECT id, points, point_type, description, created_at,
+                   CAST(SUM(points) OVER() AS SIGNED) AS total
             FROM kwv_points WHERE user_id = %s ORDER BY created_at DESC LIMIT 50
         """, (user_id,))
-        history = [{
-            "id": r[0], "points": r[1], "point_type": r[2],
-            "description": r[3], "created_at": r[4].isoformat() if r[4] else None
-        } for r in cursor.fetchall()]
+        history = cursor.fetchall()
+        total = history[0]["total"] if history else 0
+        for r in history:
+            del r["total"]
         return {"total": total, "history": history}
     finally:
         conn.close()
 
 @router.get("/points/ranking")
-async def points_ranking(
+def points_ranking(
     limit: int = 20,
-    user: dict = Depends(get_current_user)
+    user: dict = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None)
 ):
     """포인트 랭킹"""
-    conn = get_kwv_db_connection()
+    cache_key = ("points_ranking", limit)
+    cached = _stats_cache.get(cache_key)
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
-        cursor.execute(f"""
-            SELECT p.user_id, u.name, u.profile_photo, va.nationality,
-                   SUM(p.points) as total_points
-            FROM kwv_points p
-            JOIN kwv_users u ON p.user_id = u.id
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        # 합계 요약 테이블을 인덱스 순으로 읽음 (kwv_points 전체 집계 없음)
+        cursor.execute("""
+            SELECT t.user_id, u.name, u.profile_photo, va.nationality, t.total_points
+            FROM kwv_user_points_total t
+            JOIN kwv_users u ON t.user_id = u.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
-            GROUP BY p.user_id ORDER BY total_points DESC LIMIT %s
+            ORDER BY t.total_points DESC LIMIT %s
         """, (limit,))
-        rank = 1
-        result = []
-        for r in cursor.fetchall():
-            result.append({
-                "rank": rank, "user_id": r[0], "name": r[1], "profile_photo": r[2],
-                "nationality": r[3], "total_points": int(r[4])
-            })
-            rank += 1
-        return result
+        result = cursor.fetchall()
+        for rank, r in enumerate(result, 1):
+            r["rank"] = rank
+        payload = json_payload(result)
+        _stats_cache.set(cache_key, payload, ttl=30)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
-@router.get("/points/admin")
-async def admin_points(
+@router.get("/points/admin", response_class=ORJSONResponse)
+def admin_points(
     user_id: Optional[int] = None,
     point_type: Optional[str] = None,
     page: int = 1,
@@ -2813,11 +3573,11 @@ async def admin_points(
 ):
     """관리자 포인트 조회"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return {"items": [], "total": 0}
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE 1=1"
         params = []
         if user_id:
@@ -2826,30 +3586,32 @@ async def admin_points(
         if point_type:
             where += " AND p.point_type = %s"
             params.append(point_type)
-        cursor.execute(f"SELECT COUNT(*) FROM kwv_points p {where}", params)
-        total = cursor.fetchone()[0]
         offset = (page - 1) * per_page
         cursor.execute(f"""
-            SELECT p.id, p.user_id, u.name as user_name, p.points, p.point_type,
-                   p.description, p.created_at
+            SELECT p.id, p.user_id, u.name AS user_name, p.points, p.point_type,
+                   p.description, p.created_at, COUNT(*) OVER() AS total
             FROM kwv_points p
             JOIN kwv_users u ON p.user_id = u.id
             {where} ORDER BY p.created_at DESC LIMIT %s OFFSET %s
         """, params + [per_page, offset])
-        items = [{
-            "id": r[0], "user_id": r[1], "user_name": r[2], "points": r[3],
-            "point_type": r[4], "description": r[5],
-            "created_at": r[6].isoformat() if r[6] else None
-        } for r in cursor.fetchall()]
+        items = cursor.fetchall()
+        total = _window_total(cursor, items, offset, f"SELECT COUNT(*) AS total FROM kwv_points p {where}", params)
         return {"items": items, "total": total, "page": page, "per_page": per_page}
     finally:
         conn.close()
 
+class PointAdjustItem(BaseModel):
+    user_id: int
+    points: int
+    description: str = "관리자 수동 조정"
+
+class PointAdjustBatch(BaseModel):
+    items: List[PointAdjustItem] = Field(..., min_length=1, max_length=1000)
+
 @router.post("/points/admin/adjust")
-async def admin_adjust_points(request: Request, user: dict = Depends(get_current_user)):
+def admin_adjust_points(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """관리자 포인트 수동 조정"""
     require_admin_level(user, 2)
-    body = await request.json()
     target_user_id = body.get("user_id")
     points = body.get("points", 0)
     description = body.get("description", "관리자 수동 조정")
@@ -2865,33 +3627,68 @@ async def admin_adjust_points(request: Request, user: dict = Depends(get_current
             INSERT INTO kwv_points (user_id, points, point_type, description, created_by)
             VALUES (%s, %s, 'admin', %s, %s)
         """, (target_user_id, points, description, admin_id))
+        cursor.execute(_POINTS_TOTAL_UPSERT_SQL, (target_user_id, points))
         conn.commit()
         return {"message": f"{points}포인트가 조정되었습니다"}
     finally:
         conn.close()
 
+@router.post("/points/admin/adjust/batch")
+def admin_adjust_points_batch(data: PointAdjustBatch, user: dict = Depends(get_current_user)):
+    """관리자 포인트 일괄 조정 (한 번의 executemany로 적립)"""
+    require_admin_level(user, 2)
+    if any(item.points == 0 for item in data.items):
+        raise HTTPException(status_code=400, detail="points는 0이 아니어야 합니다")
+    conn = get_kwv_db_connection()
+    if not conn:
+        raise HTTPException(status_code=503, detail="DB connection failed")
+    try:
+        cursor = conn.cursor()
+        admin_id = user.get("user_id") or user.get("sub")
+        try:
+            cursor.executemany("""
+                INSERT INTO kwv_points (user_id, points, point_type, description, created_by)
+                VALUES (%s, %s, 'admin', %s, %s)
+            """, [(item.user_id, item.points, item.description, admin_id) for item in data.items])
+            totals = {}
+            for item in data.items:
+                totals[item.user_id] = totals.get(item.user_id, 0) + item.points
+            cursor.executemany(_POINTS_TOTAL_UPSERT_SQL, list(totals.items()))
+        except pymysql.err.IntegrityError as e:
+            if e.args and e.args[0] == 1452:
+                raise HTTPException(status_code=404, detail="근로자를 찾을 수 없습니다")
+            raise
+        conn.commit()
+        return {"message": f"{len(data.items)}건의 포인트가 조정되었습니다", "count": len(data.items)}
+    finally:
+        conn.close()
+
 @router.get("/point-rules")
-async def get_point_rules(user: dict = Depends(get_current_user)):
+def get_point_rules(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """포인트 규칙 조회"""
     require_admin(user)
+    cached = _point_rules_cache.get("list")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match)
     conn = get_kwv_db_connection()
     if not conn:
         return []
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("SELECT id, rule_key, rule_name, points, description, is_active FROM kwv_point_rules ORDER BY id")
-        return [{
-            "id": r[0], "rule_key": r[1], "rule_name": r[2], "points": r[3],
-            "description": r[4], "is_active": bool(r[5])
-        } for r in cursor.fetchall()]
+        rules = cursor.fetchall()
+        for r in rules:
+            r["is_active"] = bool(r["is_active"])
+        payload = json_payload(rules)
+        _point_rules_cache.set("list", payload)
+        return json_payload_response(payload, if_none_match)
     finally:
         conn.close()
 
 @router.put("/point-rules/{rule_id}")
-async def update_point_rule(rule_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_point_rule(rule_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """포인트 규칙 수정"""
     require_admin_level(user, 9)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
@@ -2908,6 +3705,7 @@ async def update_point_rule(rule_id: int, request: Request, user: dict = Depends
         params.append(rule_id)
         cursor.execute(f"UPDATE kwv_point_rules SET {', '.join(sets)} WHERE id = %s", params)
         conn.commit()
+        _point_rules_cache.clear()
         return {"message": "포인트 규칙이 수정되었습니다"}
     finally:
         conn.close()
@@ -2927,8 +3725,8 @@ class CounselingCreate(BaseModel):
     severity: str = "low"
     is_confidential: bool = False
 
-@router.get("/counseling")
-async def list_counseling(
+@router.get("/counseling", response_class=ORJSONResponse)
+def list_counseling(
     user_id: Optional[int] = None,
     category: Optional[str] = None,
     severity: Optional[str] = None,
@@ -2937,15 +3735,17 @@ async def list_counseling(
     date_to: Optional[str] = None,
     page: int = 1,
     per_page: int = 30,
+    after: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
-    """상담일지 목록"""
+    """상담일지 목록 (after=next_cursor 전달 시 OFFSET 없이 다음 페이지 조회)"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    after_key = _parse_list_cursor(after)
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return {"items": [], "total": 0}
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         where = "WHERE 1=1"
         params = []
         if user_id:
@@ -2966,53 +3766,67 @@ async def list_counseling(
         if date_to:
             where += " AND c.counseling_date <= %s"
             params.append(date_to)
-        cursor.execute(f"SELECT COUNT(*) FROM kwv_counseling c {where}", params)
-        total = cursor.fetchone()[0]
+        count_sql = f"SELECT COUNT(*) AS total FROM kwv_counseling c {where}"
+        count_params = list(params)
         offset = (page - 1) * per_page
+        total_expr = "COUNT(*) OVER()"
+        if after_key:
+            clause, key_params = _keyset_after("c.counseling_date", "c.created_at", "c.id", after_key)
+            where += clause
+            params += key_params
+            offset = 0
+            total_expr = "NULL"
+        # 지연 조인: 현재 페이지 id만 먼저 고른 뒤 그 행들에만 JOIN
         cursor.execute(f"""
-            SELECT c.id, c.user_id, u.name as user_name, va.nationality,
-                   c.counselor_id, co.name as counselor_name,
+            SELECT c.id, c.user_id, u.name AS user_name, va.nationality,
+                   c.counselor_id, co.name AS counselor_name,
                    c.counseling_date, c.counseling_type, c.category, c.title,
-                   c.severity, c.status, c.follow_up_date, c.is_confidential, c.created_at
-            FROM kwv_counseling c
+                   c.severity, c.status, c.follow_up_date, c.is_confidential, c.created_at,
+                   pg.total
+            FROM (
+                SELECT c.id, {total_expr} AS total FROM kwv_counseling c
+                {where} ORDER BY c.counseling_date DESC, c.created_at DESC, c.id DESC LIMIT %s OFFSET %s
+            ) pg
+            JOIN kwv_counseling c ON c.id = pg.id
             JOIN kwv_users u ON c.user_id = u.id
             JOIN kwv_users co ON c.counselor_id = co.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
-            {where} ORDER BY c.counseling_date DESC, c.created_at DESC LIMIT %s OFFSET %s
+            ORDER BY c.counseling_date DESC, c.created_at DESC, c.id DESC
         """, params + [per_page, offset])
-        items = [{
-            "id": r[0], "user_id": r[1], "user_name": r[2], "nationality": r[3],
-            "counselor_id": r[4], "counselor_name": r[5],
-            "counseling_date": r[6].isoformat() if r[6] else None,
-            "counseling_type": r[7], "category": r[8], "title": r[9],
-            "severity": r[10], "status": r[11],
-            "follow_up_date": r[12].isoformat() if r[12] else None,
-            "is_confidential": bool(r[13]),
-            "created_at": r[14].isoformat() if r[14] else None
-        } for r in cursor.fetchall()]
-        return {"items": items, "total": total, "page": page, "per_page": per_page}
+        items = cursor.fetchall()
+        total = _window_total(cursor, items, offset, count_sql, count_params, keyset=after_key is not None)
+        for r in items:
+            r["is_confidential"] = bool(r["is_confidential"])
+        return {"items": items, "total": total, "page": page, "per_page": per_page,
+                "next_cursor": _next_list_cursor(items, per_page, "counseling_date")}
     finally:
         conn.close()
 
 @router.get("/counseling/summary")
-async def counseling_summary(user: dict = Depends(get_current_user)):
+def counseling_summary(user: dict = Depends(get_current_user)):
     """상담 통계"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return {}
     try:
         cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM kwv_counseling")
-        total = cursor.fetchone()[0]
-        cursor.execute("SELECT status, COUNT(*) FROM kwv_counseling GROUP BY status")
-        by_status = {r[0]: r[1] for r in cursor.fetchall()}
-        cursor.execute("SELECT category, COUNT(*) FROM kwv_counseling GROUP BY category ORDER BY COUNT(*) DESC")
-        by_category = {r[0]: r[1] for r in cursor.fetchall()}
-        cursor.execute("SELECT severity, COUNT(*) FROM kwv_counseling GROUP BY severity")
-        by_severity = {r[0]: r[1] for r in cursor.fetchall()}
-        cursor.execute("SELECT COUNT(*) FROM kwv_counseling WHERE follow_up_date IS NOT NULL AND follow_up_date <= CURDATE() AND status IN ('open','in_progress')")
-        overdue = cursor.fetchone()[0]
+        # 한 번의 스캔으로 (상태, 분류, 심각도) 조합별 건수를 구한 뒤 축별로 합산
+        cursor.execute("""
+            SELECT status, category, severity, COUNT(*),
+                   SUM(follow_up_date <= CURDATE() AND status IN ('open','in_progress'))
+            FROM kwv_counseling
+            GROUP BY status, category, severity
+        """)
+        total = overdue = 0
+        by_status, by_category, by_severity = {}, {}, {}
+        for st, cat, sev, cnt, od in cursor.fetchall():
+            total += cnt
+            overdue += int(od or 0)
+            by_status[st] = by_status.get(st, 0) + cnt
+            by_category[cat] = by_category.get(cat, 0) + cnt
+            by_severity[sev] = by_severity.get(sev, 0) + cnt
+        by_category = dict(sorted(by_category.items(), key=lambda kv: kv[1], reverse=True))
         return {
             "total": total, "by_status": by_status, "by_category": by_category,
             "by_severity": by_severity, "overdue_followups": overdue
@@ -3020,41 +3834,36 @@ async def counseling_summary(user: dict = Depends(get_current_user)):
     finally:
         conn.close()
 
-@router.get("/counseling/{counsel_id}")
-async def get_counseling(counsel_id: int, user: dict = Depends(get_current_user)):
+@router.get("/counseling/{counsel_id}", response_class=ORJSONResponse)
+def get_counseling(counsel_id: int, user: dict = Depends(get_current_user)):
     """상담일지 상세"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT c.*, u.name as user_name, co.name as counselor_name, va.nationality
+            SELECT c.id, c.user_id, c.counselor_id, c.counseling_date, c.counseling_type,
+                   c.category, c.title, c.content, c.action_taken, c.follow_up_date,
+                   c.follow_up_note, c.severity, c.status, c.is_confidential,
+                   c.created_at, c.updated_at,
+                   u.name AS user_name, co.name AS counselor_name, va.nationality
             FROM kwv_counseling c
             JOIN kwv_users u ON c.user_id = u.id
             JOIN kwv_users co ON c.counselor_id = co.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
             WHERE c.id = %s
         """, (counsel_id,))
-        r = cursor.fetchone()
-        if not r:
+        row = cursor.fetchone()
+        if not row:
             raise HTTPException(status_code=404, detail="상담일지를 찾을 수 없습니다")
-        cols = [d[0] for d in cursor.description]
-        result = {}
-        for i, col in enumerate(cols):
-            val = r[i]
-            if hasattr(val, 'isoformat'):
-                val = val.isoformat()
-            if isinstance(val, bytes):
-                val = bool(val[0]) if len(val) == 1 else val.decode()
-            result[col] = val
-        return result
+        return row
     finally:
         conn.close()
 
 @router.post("/counseling")
-async def create_counseling(data: CounselingCreate, user: dict = Depends(get_current_user)):
+def create_counseling(data: CounselingCreate, user: dict = Depends(get_current_user)):
     """상담일지 등록"""
     require_admin_level(user, 2)
     counselor_id = user.get("user_id") or user.get("sub")
@@ -3078,10 +3887,9 @@ async def create_counseling(data: CounselingCreate, user: dict = Depends(get_cur
         conn.close()
 
 @router.put("/counseling/{counsel_id}")
-async def update_counseling(counsel_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_counseling(counsel_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """상담일지 수정"""
     require_admin_level(user, 2)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
@@ -3106,7 +3914,7 @@ async def update_counseling(counsel_id: int, request: Request, user: dict = Depe
         conn.close()
 
 @router.delete("/counseling/{counsel_id}")
-async def delete_counseling(counsel_id: int, user: dict = Depends(get_current_user)):
+def delete_counseling(counsel_id: int, user: dict = Depends(get_current_user)):
     """상담일지 삭제"""
     require_admin_level(user, 9)
     conn = get_kwv_db_connection()
@@ -3124,19 +3932,162 @@ async def delete_counseling(counsel_id: int, user: dict = Depends(get_current_us
 
 # ==================== Phase 7: 리포트 + Excel/PDF ====================
 
-from fastapi.responses import StreamingResponse
 import csv
 import io
+import tempfile
 
 try:
     import openpyxl
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.utils import get_column_letter
     OPENPYXL_AVAILABLE = True
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# xlsxwriter 우선 (constant_memory 모드로 더 빠르게 기록), 없으면 openpyxl
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+_XLSX_AVAILABLE = XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE
+
+if OPENPYXL_AVAILABLE:
+    # 내보내기 공통 스타일 (요청마다 새로 만들지 않음)
+    _XLSX_HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+    _XLSX_HEADER_FONT = Font(color="FFFFFF", bold=True, size=11)
+    _XLSX_HEADER_ALIGN = Alignment(horizontal='center')
+    _XLSX_THIN_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
+    _XLSX_COL_LETTERS = [get_column_letter(i) for i in range(1, 27)]
+
+_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# 내보내기 셀의 날짜/일시 표시 형식
+_EXPORT_DATE_FMT = '%Y-%m-%d'
+_EXPORT_DATETIME_FMT = '%Y-%m-%d %H:%M'
+# 이 크기를 넘는 xlsx는 메모리 대신 임시 파일에 기록
+_EXPORT_SPOOL_MAX = 16_000_000
+
+def _iter_file(f, chunk_size: int = 64 * 1024):
+    """파일 객체를 chunk 단위로 읽어 전송 (완료 후 닫음)"""
+    try:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
+
+def _write_xlsx(output, title: str, headers: list, rows, width: int = 15):
+    """write-only 워크북에 행을 한 줄씩 기록해 output(파일 객체)에 저장 (행 수와 무관하게 메모리 일정)"""
+    if XLSXWRITER_AVAILABLE:
+        # constant_memory: 각 행을 쓰는 즉시 임시 파일로 내보냄
+        # 문자열 값이 수식/하이퍼링크로 해석되지 않도록 변환 옵션 끔
+        wb = xlsxwriter.Workbook(output, {'constant_memory': True,
+                                          'strings_to_formulas': False,
+                                          'strings_to_urls': False})
+        ws = wb.add_worksheet(title)
+        ws.set_column(0, len(headers) - 1, width)
+        header_fmt = wb.add_format({'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#4472C4',
+                                    'align': 'center', 'border': 1})
+        ws.write_row(0, 0, headers, header_fmt)
+        # 데이터 셀은 서식 없이 값만 기록 (셀 단위 스타일 비용 제거)
+        for i, vals in enumerate(rows, 1):
+            ws.write_row(i, 0, vals)
+        wb.close()
+        return
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    for letter in _XLSX_COL_LETTERS[:len(headers)]:
+        ws.column_dimensions[letter].width = width
+
+    def header_cell(value):
+        c = WriteOnlyCell(ws, value=value)
+        c.border = _XLSX_THIN_BORDER
+        c.fill = _XLSX_HEADER_FILL
+        c.font = _XLSX_HEADER_FONT
+        c.alignment = _XLSX_HEADER_ALIGN
+        return c
+
+    ws.append([header_cell(h) for h in headers])
+    # 데이터 행은 값 그대로 append (셀마다 WriteOnlyCell/테두리 스타일을 만들지 않음)
+    for vals in rows:
+        ws.append(vals)
+    wb.save(output)
+
+def _xlsx_response(title: str, headers: list, rows, filename: str, width: int = 15) -> StreamingResponse:
+    """xlsx를 임시 파일에 만든 뒤 chunk 단위로 스트리밍"""
+    output = tempfile.SpooledTemporaryFile(max_size=_EXPORT_SPOOL_MAX)
+    _write_xlsx(output, title, headers, rows, width)
+    output.seek(0)
+    return StreamingResponse(_iter_file(output), media_type=_XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f"attachment; filename={filename}"})
+
+def _csv_stream_response(conn, cursor, headers: list, filename: str,
+                         row_to_vals=None, batch_size: int = 500) -> StreamingResponse:
+    """실행된 SS커서 결과를 CSV(UTF-8 BOM)로 스트리밍 - 전송 완료 후 연결 반환"""
+    def generate():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        try:
+            writer.writerow(headers)
+            yield b'\xef\xbb\xbf' + buf.getvalue().encode('utf-8')
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                buf.seek(0)
+                buf.truncate()
+                writer.writerows(map(row_to_vals, rows) if row_to_vals else rows)
+                yield buf.getvalue().encode('utf-8')
+        finally:
+            cursor.close()
+            conn.close()
+    return StreamingResponse(generate(), media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename={filename}"})
+
+_ATTENDANCE_XLSX_HEADERS = ['이름','이메일','국적','비자','사업장','유형','방법','시간','유효','거리(m)','비고']
+
+def _attendance_export_query(date_from: Optional[str], date_to: Optional[str], workplace_id: Optional[int]) -> tuple:
+    """출퇴근 내보내기 SQL + 파라미터"""
+    where = "WHERE 1=1"
+    params = []
+    if date_from:
+        where += " AND a.check_time >= %s"
+        params.append(date_from)
+    if date_to:
+        where += " AND a.check_time < DATE_ADD(%s, INTERVAL 1 DAY)"
+        params.append(date_to)
+    if workplace_id:
+        where += " AND a.workplace_id = %s"
+        params.append(workplace_id)
+    return f"""
+        SELECT u.name, u.email, va.nationality, va.visa_type,
+               w.name as workplace, a.check_type, a.check_method,
+               a.check_time, a.is_valid, a.distance_from_workplace, a.invalid_reason
+        FROM kwv_attendance a
+        JOIN kwv_users u ON a.user_id = u.id
+        LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
+        JOIN kwv_workplaces w ON a.workplace_id = w.id
+        {where} ORDER BY a.check_time DESC
+    """, params
+
+def _attendance_xlsx_rows(cursor):
+    """출퇴근 내보내기 행 → Excel 셀 값"""
+    # 행 루프 밖에서 조회 메서드를 바인딩
+    type_get = {'check_in':'출근','check_out':'퇴근'}.get
+    method_get = {'qr':'QR','gps':'GPS','manual':'수동','admin':'관리자'}.get
+    for r in cursor:
+        yield [r[0], r[1], r[2], r[3], r[4],
+               type_get(r[5], r[5]), method_get(r[6], r[6]),
+               r[7].strftime(_EXPORT_DATETIME_FMT) if r[7] else '',
+               '유효' if r[8] else '이탈', r[9] or '', r[10] or '']
+
 @router.get("/reports/attendance/excel")
-async def export_attendance_excel(
+def export_attendance_excel(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     workplace_id: Optional[int] = None,
@@ -3144,97 +4095,131 @@ async def export_attendance_excel(
 ):
     """출퇴근 기록 Excel 다운로드"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
-        where = "WHERE 1=1"
-        params = []
-        if date_from:
-            where += " AND DATE(a.check_time) >= %s"
-            params.append(date_from)
-        if date_to:
-            where += " AND DATE(a.check_time) <= %s"
-            params.append(date_to)
-        if workplace_id:
-            where += " AND a.workplace_id = %s"
-            params.append(workplace_id)
-        cursor.execute(f"""
-            SELECT u.name, u.email, va.nationality, va.visa_type,
-                   w.name as workplace, a.check_type, a.check_method,
-                   a.check_time, a.is_valid, a.distance_from_workplace, a.invalid_reason
-            FROM kwv_attendance a
-            JOIN kwv_users u ON a.user_id = u.id
-            LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
-            JOIN kwv_workplaces w ON a.workplace_id = w.id
-            {where} ORDER BY a.check_time DESC
-        """, params)
-        rows = cursor.fetchall()
+        # 서버 측 커서: 결과 전체를 메모리에 올리지 않고 한 행씩 읽음
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        cursor.execute(*_attendance_export_query(date_from, date_to, workplace_id))
+    except Exception:
+        conn.close()
+        raise
 
-        if OPENPYXL_AVAILABLE:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "출퇴근기록"
-            headers = ['이름','이메일','국적','비자','사업장','유형','방법','시간','유효','거리(m)','비고']
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True, size=11)
-            thin_border = Border(
-                left=Side(style='thin'), right=Side(style='thin'),
-                top=Side(style='thin'), bottom=Side(style='thin')
-            )
-            for col, h in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=h)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = thin_border
-            type_map = {'check_in':'출근','check_out':'퇴근'}
-            method_map = {'qr':'QR','gps':'GPS','manual':'수동','admin':'관리자'}
-            for i, r in enumerate(rows, 2):
-                vals = [r[0], r[1], r[2], r[3], r[4],
-                        type_map.get(r[5], r[5]), method_map.get(r[6], r[6]),
-                        r[7].strftime('%Y-%m-%d %H:%M') if r[7] else '',
-                        '유효' if r[8] else '이탈', r[9] or '', r[10] or '']
-                for col, v in enumerate(vals, 1):
-                    cell = ws.cell(row=i, column=col, value=v)
-                    cell.border = thin_border
-            for col in range(1, len(headers)+1):
-                ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            filename = f"attendance_{date_from or 'all'}_{date_to or 'all'}.xlsx"
-            return StreamingResponse(output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": f"attachment; filename={filename}"})
-        else:
-            # CSV fallback
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['이름','이메일','국적','비자','사업장','유형','방법','시간','유효','거리','비고'])
-            for r in rows:
-                writer.writerow([r[0], r[1], r[2], r[3], r[4], r[5], r[6],
-                    r[7].strftime('%Y-%m-%d %H:%M') if r[7] else '', '유효' if r[8] else '이탈', r[9] or '', r[10] or ''])
-            return StreamingResponse(io.BytesIO(output.getvalue().encode('utf-8-sig')),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=attendance.csv"})
+    if not _XLSX_AVAILABLE:
+        # CSV fallback
+        return _csv_stream_response(conn, cursor,
+            ['이름','이메일','국적','비자','사업장','유형','방법','시간','유효','거리','비고'],
+            "attendance.csv",
+            lambda r: [r[0], r[1], r[2], r[3], r[4], r[5], r[6],
+                       r[7].strftime(_EXPORT_DATETIME_FMT) if r[7] else '', '유효' if r[8] else '이탈', r[9] or '', r[10] or ''])
+    try:
+        filename = f"attendance_{date_from or 'all'}_{date_to or 'all'}.xlsx"
+        return _xlsx_response("출퇴근기록", _ATTENDANCE_XLSX_HEADERS, _attendance_xlsx_rows(cursor), filename)
     finally:
         conn.close()
 
+# 백그라운드 내보내기 작업 (job_id → 상태), 완성 파일은 임시 디렉터리에 1시간 보관
+_EXPORT_JOB_TTL = 3600
+_export_jobs = _TTLCache(maxsize=256, ttl=_EXPORT_JOB_TTL)
+_EXPORT_JOB_DIR = os.path.join(tempfile.gettempdir(), "kwv_exports")
+
+def _purge_export_files():
+    """보관 시간이 지난 내보내기 파일 삭제"""
+    cutoff = time.time() - _EXPORT_JOB_TTL
+    try:
+        with os.scandir(_EXPORT_JOB_DIR) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                except OSError:
+                    pass
+    except FileNotFoundError:
+        pass
+
+def _run_attendance_export_job(job: dict, date_from: Optional[str], date_to: Optional[str], workplace_id: Optional[int]):
+    """출퇴근 Excel 생성 작업 (응답 후 BackgroundTasks 스레드에서 실행)"""
+    job["status"] = "running"
+    conn = get_kwv_db_connection(readonly=True)
+    if not conn:
+        job["status"] = "failed"
+        return
+    path = os.path.join(_EXPORT_JOB_DIR, f"{job['id']}.xlsx")
+    try:
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        cursor.execute(*_attendance_export_query(date_from, date_to, workplace_id))
+        with open(path, 'wb') as f:
+            _write_xlsx(f, "출퇴근기록", _ATTENDANCE_XLSX_HEADERS, _attendance_xlsx_rows(cursor))
+        job["path"] = path
+        job["status"] = "done"
+    except Exception:
+        logger.exception("attendance export job failed (job_id=%s)", job["id"])
+        job["status"] = "failed"
+    finally:
+        conn.close()
+
+@router.post("/reports/attendance/excel/jobs")
+def create_attendance_export_job(
+    background_tasks: BackgroundTasks,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    workplace_id: Optional[int] = None,
+    user: dict = Depends(get_current_user)
+):
+    """출퇴근 기록 Excel 생성 작업 등록 (대용량 기간용 - 완료 후 /exports/{job_id}에서 다운로드)"""
+    require_admin(user)
+    if not _XLSX_AVAILABLE:
+        raise HTTPException(status_code=503, detail="Excel 생성 모듈이 설치되지 않았습니다")
+    os.makedirs(_EXPORT_JOB_DIR, exist_ok=True)
+    _purge_export_files()
+    job_id = secrets.token_urlsafe(16)
+    job = {
+        "id": job_id, "status": "queued",
+        "owner": str(user.get("user_id") or user.get("sub")),
+        "filename": f"attendance_{date_from or 'all'}_{date_to or 'all'}.xlsx",
+    }
+    _export_jobs.set(job_id, job)
+    background_tasks.add_task(_run_attendance_export_job, job, date_from, date_to, workplace_id)
+    return {"job_id": job_id, "status": job["status"]}
+
+def _get_export_job(job_id: str, user: dict) -> dict:
+    """본인이 등록한 내보내기 작업 조회 (없거나 만료되면 404)"""
+    job = _export_jobs.get(job_id)
+    if job is None or job["owner"] != str(user.get("user_id") or user.get("sub")):
+        raise HTTPException(status_code=404, detail="내보내기 작업을 찾을 수 없습니다")
+    return job
+
+@router.get("/exports/{job_id}")
+def get_export_job(job_id: str, user: dict = Depends(get_current_user)):
+    """내보내기 작업 상태 (done이면 다운로드 URL 포함)"""
+    require_admin(user)
+    job = _get_export_job(job_id, user)
+    url = f"{router.prefix}/exports/{job_id}/download" if job["status"] == "done" else None
+    return {"job_id": job_id, "status": job["status"], "url": url}
+
+@router.get("/exports/{job_id}/download")
+def download_export_job(job_id: str, user: dict = Depends(get_current_user)):
+    """완료된 내보내기 파일 다운로드"""
+    require_admin(user)
+    job = _get_export_job(job_id, user)
+    if job["status"] != "done" or not os.path.exists(job["path"]):
+        raise HTTPException(status_code=404, detail="파일이 아직 준비되지 않았습니다")
+    return FileResponse(job["path"], media_type=_XLSX_MEDIA_TYPE, filename=job["filename"])
+
 @router.get("/reports/applicants/excel")
-async def export_applicants_excel(
+def export_applicants_excel(
     is_approved: Optional[str] = None,
     nationality: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
     """지원자 목록 Excel 다운로드"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
         where = "WHERE u.user_type = 'applicant'"
         params = []
         if is_approved == 'true':
@@ -3253,218 +4238,173 @@ async def export_applicants_excel(
             LEFT JOIN kwv_local_governments lg ON u.local_government_id = lg.id
             {where} ORDER BY u.created_at DESC
         """, params)
-        rows = cursor.fetchall()
+    except Exception:
+        conn.close()
+        raise
 
-        if OPENPYXL_AVAILABLE:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "지원자목록"
-            headers = ['ID','이름','이메일','전화번호','국적','비자','여권번호','생년월일','성별','승인','배정지자체','가입일']
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True, size=11)
-            thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-            for col, h in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=h)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center')
-                cell.border = thin_border
-            gender_map = {'male':'남','female':'여'}
-            for i, r in enumerate(rows, 2):
-                vals = [r[0], r[1], r[2], r[3], r[4], r[5], r[6],
-                        r[7].strftime('%Y-%m-%d') if r[7] else '',
-                        gender_map.get(r[8], r[8] or ''),
-                        '승인' if r[9] else '대기', r[10] or '',
-                        r[11].strftime('%Y-%m-%d') if r[11] else '']
-                for col, v in enumerate(vals, 1):
-                    cell = ws.cell(row=i, column=col, value=v)
-                    cell.border = thin_border
-            for col in range(1, len(headers)+1):
-                ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            return StreamingResponse(output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": "attachment; filename=applicants.xlsx"})
-        else:
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(headers)
-            for r in rows:
-                writer.writerow(r)
-            return StreamingResponse(io.BytesIO(output.getvalue().encode('utf-8-sig')),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=applicants.csv"})
+    headers = ['ID','이름','이메일','전화번호','국적','비자','여권번호','생년월일','성별','승인','배정지자체','가입일']
+    if not _XLSX_AVAILABLE:
+        return _csv_stream_response(conn, cursor, headers, "applicants.csv")
+    try:
+        gender_get = {'male':'남','female':'여'}.get
+        rows = ([r[0], r[1], r[2], r[3], r[4], r[5], r[6],
+                 r[7].strftime(_EXPORT_DATE_FMT) if r[7] else '',
+                 gender_get(r[8], r[8] or ''),
+                 '승인' if r[9] else '대기', r[10] or '',
+                 r[11].strftime(_EXPORT_DATE_FMT) if r[11] else ''] for r in cursor)
+        return _xlsx_response("지원자목록", headers, rows, "applicants.xlsx")
     finally:
         conn.close()
 
 @router.get("/reports/points/excel")
-async def export_points_excel(user: dict = Depends(get_current_user)):
+def export_points_excel(user: dict = Depends(get_current_user)):
     """포인트 내역 Excel 다운로드"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
         cursor.execute("""
-            SELECT u.name, u.email, va.nationality, p.points, p.point_type,
-                   p.description, p.created_at
+            SELECT u.name, u.email, va.nationality, p.points,
+                   CASE p.point_type
+                       WHEN 'attendance' THEN '출퇴근' WHEN 'activity' THEN '활동'
+                       WHEN 'training' THEN '교육' WHEN 'community' THEN '봉사'
+                       WHEN 'bonus' THEN '보너스' WHEN 'penalty' THEN '패널티'
+                       WHEN 'admin' THEN '관리자' ELSE p.point_type END,
+                   p.description,
+                   COALESCE(DATE_FORMAT(p.created_at, '%Y-%m-%d %H:%i'), '')
             FROM kwv_points p
             JOIN kwv_users u ON p.user_id = u.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
             ORDER BY p.created_at DESC
         """)
-        rows = cursor.fetchall()
-        if OPENPYXL_AVAILABLE:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "포인트내역"
-            headers = ['이름','이메일','국적','포인트','유형','설명','일시']
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True, size=11)
-            thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-            for col, h in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=h)
-                cell.fill = header_fill; cell.font = header_font
-                cell.alignment = Alignment(horizontal='center'); cell.border = thin_border
-            type_map = {'attendance':'출퇴근','activity':'활동','training':'교육','community':'봉사','bonus':'보너스','penalty':'패널티','admin':'관리자'}
-            for i, r in enumerate(rows, 2):
-                vals = [r[0], r[1], r[2], r[3], type_map.get(r[4],r[4]), r[5],
-                        r[6].strftime('%Y-%m-%d %H:%M') if r[6] else '']
-                for col, v in enumerate(vals, 1):
-                    cell = ws.cell(row=i, column=col, value=v); cell.border = thin_border
-            for col in range(1, len(headers)+1):
-                ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 15
-            output = io.BytesIO()
-            wb.save(output); output.seek(0)
-            return StreamingResponse(output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": "attachment; filename=points.xlsx"})
-        else:
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(['이름','이메일','국적','포인트','유형','설명','일시'])
-            for r in rows: writer.writerow(r)
-            return StreamingResponse(io.BytesIO(output.getvalue().encode('utf-8-sig')),
-                media_type="text/csv", headers={"Content-Disposition": "attachment; filename=points.csv"})
+    except Exception:
+        conn.close()
+        raise
+
+    # 라벨/날짜 포맷은 SQL에서 처리 - 행을 그대로 전달
+    headers = ['이름','이메일','국적','포인트','유형','설명','일시']
+    if not _XLSX_AVAILABLE:
+        return _csv_stream_response(conn, cursor, headers, "points.csv")
+    try:
+        return _xlsx_response("포인트내역", headers, cursor, "points.xlsx")
     finally:
         conn.close()
 
 @router.get("/reports/counseling/excel")
-async def export_counseling_excel(user: dict = Depends(get_current_user)):
+def export_counseling_excel(user: dict = Depends(get_current_user)):
     """상담일지 Excel 다운로드"""
     require_admin(user)
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=503, detail="DB connection failed")
     try:
-        cursor = conn.cursor()
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
         cursor.execute("""
             SELECT u.name, va.nationality, co.name as counselor,
-                   c.counseling_date, c.counseling_type, c.category,
-                   c.title, c.content, c.action_taken, c.severity, c.status,
-                   c.follow_up_date, c.is_confidential
+                   COALESCE(DATE_FORMAT(c.counseling_date, '%Y-%m-%d'), ''),
+                   CASE c.counseling_type
+                       WHEN 'in_person' THEN '대면' WHEN 'phone' THEN '전화'
+                       WHEN 'video' THEN '화상' WHEN 'text' THEN '문자'
+                       ELSE c.counseling_type END,
+                   CASE c.category
+                       WHEN 'work' THEN '근무' WHEN 'health' THEN '건강'
+                       WHEN 'legal' THEN '법률' WHEN 'housing' THEN '숙소'
+                       WHEN 'salary' THEN '급여' WHEN 'homesick' THEN '향수병'
+                       WHEN 'conflict' THEN '갈등' WHEN 'other' THEN '기타'
+                       ELSE c.category END,
+                   c.title, c.content, c.action_taken,
+                   CASE c.severity
+                       WHEN 'low' THEN '낮음' WHEN 'medium' THEN '보통'
+                       WHEN 'high' THEN '높음' WHEN 'urgent' THEN '긴급'
+                       ELSE c.severity END,
+                   CASE c.status
+                       WHEN 'open' THEN '진행중' WHEN 'in_progress' THEN '처리중'
+                       WHEN 'resolved' THEN '해결' WHEN 'closed' THEN '종료'
+                       ELSE c.status END,
+                   COALESCE(DATE_FORMAT(c.follow_up_date, '%Y-%m-%d'), ''),
+                   IF(c.is_confidential, 'Y', 'N')
             FROM kwv_counseling c
             JOIN kwv_users u ON c.user_id = u.id
             JOIN kwv_users co ON c.counselor_id = co.id
             LEFT JOIN kwv_visa_applicants va ON va.user_id = u.id
             ORDER BY c.counseling_date DESC
         """)
-        rows = cursor.fetchall()
-        if OPENPYXL_AVAILABLE:
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "상담일지"
-            headers = ['근로자','국적','상담사','날짜','방식','분류','제목','내용','조치','심각도','상태','후속상담일','기밀']
-            header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-            header_font = Font(color="FFFFFF", bold=True, size=11)
-            thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-            for col, h in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=h)
-                cell.fill = header_fill; cell.font = header_font
-                cell.alignment = Alignment(horizontal='center'); cell.border = thin_border
-            cat_map = {'work':'근무','health':'건강','legal':'법률','housing':'숙소','salary':'급여','homesick':'향수병','conflict':'갈등','other':'기타'}
-            sev_map = {'low':'낮음','medium':'보통','high':'높음','urgent':'긴급'}
-            st_map = {'open':'진행중','in_progress':'처리중','resolved':'해결','closed':'종료'}
-            type_map = {'in_person':'대면','phone':'전화','video':'화상','text':'문자'}
-            for i, r in enumerate(rows, 2):
-                vals = [r[0], r[1], r[2],
-                        r[3].strftime('%Y-%m-%d') if r[3] else '',
-                        type_map.get(r[4],r[4]), cat_map.get(r[5],r[5]),
-                        r[6], r[7], r[8], sev_map.get(r[9],r[9]), st_map.get(r[10],r[10]),
-                        r[11].strftime('%Y-%m-%d') if r[11] else '',
-                        'Y' if r[12] else 'N']
-                for col, v in enumerate(vals, 1):
-                    cell = ws.cell(row=i, column=col, value=v); cell.border = thin_border
-            for col in range(1, len(headers)+1):
-                ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 16
-            output = io.BytesIO()
-            wb.save(output); output.seek(0)
-            return StreamingResponse(output,
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                headers={"Content-Disposition": "attachment; filename=counseling.xlsx"})
-        else:
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(headers)
-            for r in rows: writer.writerow(r)
-            return StreamingResponse(io.BytesIO(output.getvalue().encode('utf-8-sig')),
-                media_type="text/csv", headers={"Content-Disposition": "attachment; filename=counseling.csv"})
+    except Exception:
+        conn.close()
+        raise
+
+    # 라벨/날짜 포맷은 SQL에서 처리 - 행을 그대로 전달
+    headers = ['근로자','국적','상담사','날짜','방식','분류','제목','내용','조치','심각도','상태','후속상담일','기밀']
+    if not _XLSX_AVAILABLE:
+        return _csv_stream_response(conn, cursor, headers, "counseling.csv")
+    try:
+        return _xlsx_response("상담일지", headers, cursor, "counseling.xlsx", width=16)
     finally:
         conn.close()
 
 @router.get("/reports/dashboard")
-async def dashboard_report(user: dict = Depends(get_current_user)):
+def dashboard_report(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """종합 대시보드 리포트 데이터"""
     require_admin(user)
+    cached = _stats_cache.get("dashboard")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return {}
     try:
-        cursor = conn.cursor()
-        # 총 근로자
-        cursor.execute("SELECT COUNT(*) FROM kwv_users WHERE user_type='applicant'")
-        total_workers = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM kwv_users WHERE user_type='applicant' AND is_approved=1")
-        approved_workers = cursor.fetchone()[0]
-        # 총 사업장
-        cursor.execute("SELECT COUNT(*) FROM kwv_workplaces WHERE is_active=1")
-        total_workplaces = cursor.fetchone()[0]
-        # 총 지자체
-        cursor.execute("SELECT COUNT(*) FROM kwv_local_governments WHERE is_active=1")
-        total_lgs = cursor.fetchone()[0]
-        # MOU
-        cursor.execute("SELECT COUNT(*) FROM kwv_mou_agreements WHERE status='active'")
-        active_mous = cursor.fetchone()[0]
-        # 오늘 출근
-        cursor.execute("SELECT COUNT(DISTINCT user_id) FROM kwv_attendance WHERE check_type='check_in' AND DATE(check_time)=CURDATE()")
-        today_checkins = cursor.fetchone()[0]
-        # 포인트 총합
-        cursor.execute("SELECT COALESCE(SUM(points),0) FROM kwv_points")
-        total_points = cursor.fetchone()[0]
-        # 상담
-        cursor.execute("SELECT COUNT(*) FROM kwv_counseling WHERE status IN ('open','in_progress')")
-        open_counseling = cursor.fetchone()[0]
-        return {
-            "total_workers": total_workers,
-            "approved_workers": approved_workers,
-            "total_workplaces": total_workplaces,
-            "total_lgs": total_lgs,
-            "active_mous": active_mous,
-            "today_checkins": today_checkins,
-            "total_points_issued": int(total_points),
-            "open_counseling": open_counseling
-        }
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        # 대시보드 카운터 - 한 번의 왕복으로 조회
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM kwv_users WHERE user_type='applicant') AS total_workers,
+                (SELECT COUNT(*) FROM kwv_users WHERE user_type='applicant' AND is_approved=1) AS approved_workers,
+                (SELECT COUNT(*) FROM kwv_workplaces WHERE is_active=1) AS total_workplaces,
+                (SELECT COUNT(*) FROM kwv_local_governments WHERE is_active=1) AS total_lgs,
+                (SELECT COUNT(*) FROM kwv_mou_agreements WHERE status='active') AS active_mous,
+                (SELECT COUNT(DISTINCT user_id) FROM kwv_attendance
+                 WHERE check_type='check_in'
+                   AND check_time >= CURDATE() AND check_time < CURDATE() + INTERVAL 1 DAY) AS today_checkins,
+                (SELECT CAST(COALESCE(SUM(total_points),0) AS SIGNED) FROM kwv_user_points_total) AS total_points_issued,
+                (SELECT COUNT(*) FROM kwv_counseling WHERE status IN ('open','in_progress')) AS open_counseling
+        """)
+        payload = json_payload(cursor.fetchone())
+        _stats_cache.set("dashboard", payload, ttl=30)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
     finally:
         conn.close()
 
 # ==================== Phase 8: 이상감지 + 알림 ====================
 
+# 알림 전송 대상 → kwv_users 조건
+_NOTIFY_TARGET_WHERE = {
+    "all": "is_active=1",
+    "admins": "admin_level >= 5",
+    "workers": "user_type='applicant' AND is_active=1",
+}
+
+def _notify_group(cursor, target: str, title: str, message: str,
+                  ntype: str = "info", reference_type: Optional[str] = None) -> int:
+    """대상 그룹 전체에 알림 삽입 (사용자 ID를 가져오지 않고 INSERT ... SELECT 한 번) - 삽입 건수 반환"""
+    cursor.execute(f"""
+        INSERT INTO kwv_notifications (user_id, title, message, notification_type, reference_type)
+        SELECT id, %s, %s, %s, %s FROM kwv_users WHERE {_NOTIFY_TARGET_WHERE[target]}
+    """, (title, message, ntype, reference_type))
+    return cursor.rowcount
+
+def _open_anomaly_users(cursor, anomaly_type: str, since_sql: str) -> set:
+    """처리되지 않은 동일 유형 이상감지가 있는 사용자 ID 집합 (중복 감지 방지)"""
+    cursor.execute(f"""
+        SELECT DISTINCT user_id FROM kwv_anomalies
+        WHERE anomaly_type=%s AND status IN ('detected','reviewing') AND {since_sql}
+    """, (anomaly_type,))
+    return {r['user_id'] for r in cursor.fetchall()}
+
 # --- 이상감지 스캔 ---
 @router.post("/admin/anomalies/scan")
-async def scan_anomalies(user: dict = Depends(get_current_user)):
+def scan_anomalies(user: dict = Depends(get_current_user)):
     """이상감지 규칙 기반 스캔"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3477,6 +4417,7 @@ async def scan_anomalies(user: dict = Depends(get_current_user)):
         rules = {r['rule_key']: r for r in cursor.fetchall()}
 
         detected = []
+        to_insert = []
         today = datetime.now().date()
 
         # 규칙1: 3일 연속 결근
@@ -3485,28 +4426,21 @@ async def scan_anomalies(user: dict = Depends(get_current_user)):
             threshold = rule['threshold'] or 3
             cursor.execute("""
                 SELECT u.id, u.name, u.email,
-                    (SELECT MAX(DATE(check_time)) FROM kwv_attendance WHERE user_id=u.id AND check_type='check_in') as last_checkin
+                    (SELECT DATE(MAX(check_time)) FROM kwv_attendance WHERE user_id=u.id AND check_type='check_in') as last_checkin
                 FROM kwv_users u
                 WHERE u.user_type='applicant' AND u.is_active=1 AND u.is_approved=1
             """)
             workers = cursor.fetchall()
+            # 중복 체크 (오늘 이미 감지된 사용자)
+            existing = _open_anomaly_users(cursor, 'absent_streak', "created_at >= CURDATE()")
             for w in workers:
                 last = w['last_checkin']
-                if last and (today - last).days >= threshold:
+                if last and (today - last).days >= threshold and w['id'] not in existing:
                     days_absent = (today - last).days
-                    # 중복 체크
-                    cursor.execute("""
-                        SELECT id FROM kwv_anomalies WHERE user_id=%s AND anomaly_type='absent_streak'
-                        AND status IN ('detected','reviewing') AND DATE(created_at)=CURDATE()
-                    """, (w['id'],))
-                    if not cursor.fetchone():
-                        cursor.execute("""
-                            INSERT INTO kwv_anomalies (user_id, anomaly_type, score, description, details)
-                            VALUES (%s, 'absent_streak', %s, %s, %s)
-                        """, (w['id'], rule['score'],
-                              f"{w['name']} - {days_absent}일 연속 결근",
-                              json.dumps({"days_absent": days_absent, "last_checkin": str(last)})))
-                        detected.append({"user": w['name'], "type": "absent_streak", "days": days_absent})
+                    to_insert.append((w['id'], 'absent_streak', rule['score'],
+                                      f"{w['name']} - {days_absent}일 연속 결근",
+                                      json.dumps({"days_absent": days_absent, "last_checkin": str(last)})))
+                    detected.append({"user": w['name'], "type": "absent_streak", "days": days_absent})
 
         # 규칙2: GPS 이탈 (최근 7일)
         rule = rules.get('gps_violation')
@@ -3519,76 +4453,77 @@ async def scan_anomalies(user: dict = Depends(get_current_user)):
                 GROUP BY a.user_id
                 HAVING cnt >= 2
             """)
-            for row in cursor.fetchall():
-                cursor.execute("""
-                    SELECT id FROM kwv_anomalies WHERE user_id=%s AND anomaly_type='gps_violation'
-                    AND status IN ('detected','reviewing') AND created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-                """, (row['user_id'],))
-                if not cursor.fetchone():
-                    cursor.execute("""
-                        INSERT INTO kwv_anomalies (user_id, anomaly_type, score, description, details)
-                        VALUES (%s, 'gps_violation', %s, %s, %s)
-                    """, (row['user_id'], rule['score'],
-                          f"{row['name']} - 최근 7일 GPS 이탈 {row['cnt']}회",
-                          json.dumps({"violation_count": row['cnt']})))
-                    detected.append({"user": row['name'], "type": "gps_violation", "count": row['cnt']})
+            rows = cursor.fetchall()
+            existing = _open_anomaly_users(cursor, 'gps_violation', "created_at >= DATE_SUB(NOW(), INTERVAL 7 DAY)")
+            for row in rows:
+                if row['user_id'] in existing:
+                    continue
+                to_insert.append((row['user_id'], 'gps_violation', rule['score'],
+                                  f"{row['name']} - 최근 7일 GPS 이탈 {row['cnt']}회",
+                                  json.dumps({"violation_count": row['cnt']})))
+                detected.append({"user": row['name'], "type": "gps_violation", "count": row['cnt']})
 
         # 규칙3: 미퇴근 3회 이상 (최근 14일)
         rule = rules.get('no_checkout_3')
         if rule:
             threshold = rule['threshold'] or 3
             cursor.execute("""
-                SELECT ci.user_id, u.name, COUNT(*) as cnt
-                FROM kwv_attendance ci
-                JOIN kwv_users u ON u.id=ci.user_id
-                LEFT JOIN kwv_attendance co ON co.user_id=ci.user_id
-                    AND co.check_type='check_out' AND DATE(co.check_time)=DATE(ci.check_time)
-                WHERE ci.check_type='check_in' AND ci.check_time >= DATE_SUB(NOW(), INTERVAL 14 DAY)
-                    AND co.id IS NULL
-                GROUP BY ci.user_id
+                SELECT t.user_id, u.name, COUNT(*) as cnt
+                FROM (
+                    -- 사용자·일자별 출근/퇴근 여부 (셀프 조인 없이 한 번에 집계)
+                    SELECT user_id, DATE(check_time) as d,
+                           MAX(check_type='check_in') as has_in,
+                           MAX(check_type='check_out') as has_out
+                    FROM kwv_attendance
+                    WHERE check_time >= DATE_SUB(NOW(), INTERVAL 14 DAY)
+                    GROUP BY user_id, DATE(check_time)
+                ) t
+                JOIN kwv_users u ON u.id=t.user_id
+                WHERE t.has_in=1 AND t.has_out=0
+                GROUP BY t.user_id, u.name
                 HAVING cnt >= %s
             """, (threshold,))
-            for row in cursor.fetchall():
-                cursor.execute("""
-                    SELECT id FROM kwv_anomalies WHERE user_id=%s AND anomaly_type='no_checkout'
-                    AND status IN ('detected','reviewing') AND created_at >= DATE_SUB(NOW(), INTERVAL 14 DAY)
-                """, (row['user_id'],))
-                if not cursor.fetchone():
-                    cursor.execute("""
-                        INSERT INTO kwv_anomalies (user_id, anomaly_type, score, description, details)
-                        VALUES (%s, 'no_checkout', %s, %s, %s)
-                    """, (row['user_id'], rule['score'],
-                          f"{row['name']} - 최근 14일 미퇴근 {row['cnt']}회",
-                          json.dumps({"no_checkout_count": row['cnt']})))
-                    detected.append({"user": row['name'], "type": "no_checkout", "count": row['cnt']})
-
-        conn.commit()
+            rows = cursor.fetchall()
+            existing = _open_anomaly_users(cursor, 'no_checkout', "created_at >= DATE_SUB(NOW(), INTERVAL 14 DAY)")
+            for row in rows:
+                if row['user_id'] in existing:
+                    continue
+                to_insert.append((row['user_id'], 'no_checkout', rule['score'],
+                                  f"{row['name']} - 최근 14일 미퇴근 {row['cnt']}회",
+                                  json.dumps({"no_checkout_count": row['cnt']})))
+                detected.append({"user": row['name'], "type": "no_checkout", "count": row['cnt']})
+
+        if to_insert:
+            cursor.executemany("""
+                INSERT INTO kwv_anomalies (user_id, anomaly_type, score, description, details)
+                VALUES (%s, %s, %s, %s, %s)
+            """, to_insert)
 
         # 감지된 이상에 대해 관리자 알림 생성
         if detected:
-            cursor.execute("SELECT id FROM kwv_users WHERE admin_level >= 5")
-            admins = cursor.fetchall()
-            for admin in admins:
-                cursor.execute("""
-                    INSERT INTO kwv_notifications (user_id, title, message, notification_type, reference_type)
-                    VALUES (%s, %s, %s, 'warning', 'anomaly')
-                """, (admin['id'],
-                      f"이상감지 스캔: {len(detected)}건 발견",
-                      f"스캔 결과 {len(detected)}건의 이상 행동이 감지되었습니다."))
-            conn.commit()
+            _notify_group(cursor, "admins",
+                          f"이상감지 스캔: {len(detected)}건 발견",
+                          f"스캔 결과 {len(detected)}건의 이상 행동이 감지되었습니다.",
+                          "warning", "anomaly")
+        # 이상감지 기록과 관리자 알림을 한 트랜잭션으로 커밋
+        conn.commit()
+        if to_insert:
+            _stats_cache.pop("anomaly_summary")
 
         return {"scanned": True, "detected_count": len(detected), "details": detected}
     finally:
         conn.close()
 
-@router.get("/admin/anomalies")
-async def list_anomalies(
+@router.get("/admin/anomalies", response_class=ORJSONResponse)
+def list_anomalies(
     status: str = None, anomaly_type: str = None,
     page: int = 1, per_page: int = 20,
+    after: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
-    """이상감지 목록"""
+    """이상감지 목록 (after=next_cursor("점수|감지시각|id") 전달 시 OFFSET 없이 다음 페이지 조회)"""
     require_admin(user)
+    after_key = _parse_cursor(after, (int, datetime.fromisoformat, int))
     conn = get_kwv_db_connection()
     if not conn:
         return {"items": [], "total": 0}
@@ -3608,32 +4543,36 @@ async def list_anomalies(
         total = cursor.fetchone()['cnt']
 
         offset = (page - 1) * per_page
+        if after_key:
+            keyset, keyset_params = _keyset_after("a.score", "a.created_at", "a.id", after_key)
+            w += keyset
+            params += keyset_params
+            offset = 0
         cursor.execute(f"""
-            SELECT a.*, u.name as user_name, u.email as user_email,
+            SELECT a.id, a.user_id, a.anomaly_type, a.score, a.description, a.status,
+                   DATE_FORMAT(a.resolved_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as resolved_at, a.resolve_note,
+                   DATE_FORMAT(a.created_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as created_at,
+                   u.name as user_name, u.email as user_email,
                    r.name as resolver_name
             FROM kwv_anomalies a
             JOIN kwv_users u ON u.id=a.user_id
             LEFT JOIN kwv_users r ON r.id=a.resolved_by
             WHERE {w}
-            ORDER BY a.score DESC, a.created_at DESC
+            ORDER BY a.score DESC, a.created_at DESC, a.id DESC
             LIMIT %s OFFSET %s
         """, params + [per_page, offset])
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-                if k == 'details' and isinstance(v, str):
-                    try:
-                        item[k] = json.loads(v)
-                    except:
-                        pass
-        return {"items": items, "total": total, "page": page, "per_page": per_page}
+        next_cursor = None
+        if len(items) == per_page and items[-1]["created_at"]:
+            last = items[-1]
+            next_cursor = f"{last['score']}|{last['created_at']}|{last['id']}"
+        return ORJSONResponse({"items": items, "total": total, "page": page, "per_page": per_page,
+                               "next_cursor": next_cursor})
     finally:
         conn.close()
 
 @router.put("/admin/anomalies/{anomaly_id}/resolve")
-async def resolve_anomaly(anomaly_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
+def resolve_anomaly(anomaly_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """이상감지 해결 처리"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3648,14 +4587,18 @@ async def resolve_anomaly(anomaly_id: int, body: dict = Body(...), user: dict =
             WHERE id=%s
         """, (new_status, int(user['sub']), note, anomaly_id))
         conn.commit()
+        _stats_cache.pop("anomaly_summary")
         return {"success": True}
     finally:
         conn.close()
 
 @router.get("/admin/anomalies/summary")
-async def anomaly_summary(user: dict = Depends(get_current_user)):
+def anomaly_summary(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
     """이상감지 요약"""
     require_admin(user)
+    cached = _stats_cache.get("anomaly_summary")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match, _STATS_CACHE_CONTROL)
     conn = get_kwv_db_connection()
     if not conn:
         return {}
@@ -3673,14 +4616,47 @@ async def anomaly_summary(user: dict = Depends(get_current_user)):
         by_type = {r['anomaly_type']: r['cnt'] for r in cursor.fetchall()}
         cursor.execute("SELECT COUNT(*) as cnt FROM kwv_anomalies WHERE status='resolved'")
         resolved = cursor.fetchone()['cnt']
-        return {"active": active, "high_risk": high_risk, "resolved": resolved, "by_type": by_type}
+        payload = json_payload({"active": active, "high_risk": high_risk, "resolved": resolved, "by_type": by_type})
+        _stats_cache.set("anomaly_summary", payload, ttl=30)
+        return json_payload_response(payload, if_none_match, _STATS_CACHE_CONTROL)
+    finally:
+        conn.close()
+
+@router.get("/admin/anomalies/{anomaly_id}", response_class=ORJSONResponse)
+def get_anomaly(anomaly_id: int, user: dict = Depends(get_current_user)):
+    """이상감지 상세 (목록에서 제외한 details 포함)"""
+    require_admin(user)
+    conn = get_kwv_db_connection()
+    if not conn:
+        raise HTTPException(500, "DB 연결 실패")
+    try:
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        cursor.execute("""
+            SELECT a.*, u.name as user_name, u.email as user_email,
+                   r.name as resolver_name
+            FROM kwv_anomalies a
+            JOIN kwv_users u ON u.id=a.user_id
+            LEFT JOIN kwv_users r ON r.id=a.resolved_by
+            WHERE a.id=%s
+        """, (anomaly_id,))
+        item = cursor.fetchone()
+        if not item:
+            raise HTTPException(404, "이상감지 기록을 찾을 수 없습니다")
+        if isinstance(item.get('details'), str):
+            try:
+                item['details'] = json_loads(item['details'])
+            except ValueError:
+                pass
+        return ORJSONResponse(item)
     finally:
         conn.close()
 
 # --- 알림 ---
-@router.get("/notifications/my")
-async def my_notifications(page: int = 1, per_page: int = 20, user: dict = Depends(get_current_user)):
-    """내 알림 목록"""
+@router.get("/notifications/my", response_class=ORJSONResponse)
+def my_notifications(page: int = 1, per_page: int = 20, after: Optional[str] = None,
+                           user: dict = Depends(get_current_user)):
+    """내 알림 목록 (after=next_cursor("생성시각|id") 전달 시 OFFSET 없이 다음 페이지 조회)"""
+    after_key = _parse_cursor(after, (datetime.fromisoformat, int))
     conn = get_kwv_db_connection()
     if not conn:
         return {"items": [], "total": 0}
@@ -3689,21 +4665,30 @@ async def my_notifications(page: int = 1, per_page: int = 20, user: dict = Depen
         cursor.execute("SELECT COUNT(*) as cnt FROM kwv_notifications WHERE user_id=%s", (int(user['sub']),))
         total = cursor.fetchone()['cnt']
         offset = (page - 1) * per_page
-        cursor.execute("""
-            SELECT * FROM kwv_notifications WHERE user_id=%s
-            ORDER BY created_at DESC LIMIT %s OFFSET %s
-        """, (int(user['sub']), per_page, offset))
+        keyset, keyset_params = "", []
+        if after_key:
+            c, i = after_key
+            keyset = " AND (n.created_at < %s OR (n.created_at = %s AND n.id < %s))"
+            keyset_params = [c, c, i]
+            offset = 0
+        cursor.execute(f"""
+            SELECT n.id, n.user_id, n.title, n.message, n.notification_type,
+                   n.reference_type, n.reference_id, n.is_read,
+                   DATE_FORMAT(n.read_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as read_at,
+                   DATE_FORMAT(n.created_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as created_at
+            FROM kwv_notifications n WHERE n.user_id=%s{keyset}
+            ORDER BY n.created_at DESC, n.id DESC LIMIT %s OFFSET %s
+        """, [int(user['sub'])] + keyset_params + [per_page, offset])
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items, "total": total}
+        next_cursor = None
+        if len(items) == per_page and items[-1]["created_at"]:
+            next_cursor = f"{items[-1]['created_at']}|{items[-1]['id']}"
+        return ORJSONResponse({"items": items, "total": total, "next_cursor": next_cursor})
     finally:
         conn.close()
 
-@router.get("/notifications/my/unread-count")
-async def unread_count(user: dict = Depends(get_current_user)):
+@router.get("/notifications/my/unread-count", response_class=ORJSONResponse)
+def unread_count(user: dict = Depends(get_current_user)):
     """안읽은 알림 수"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -3711,12 +4696,12 @@ async def unread_count(user: dict = Depends(get_current_user)):
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("SELECT COUNT(*) as cnt FROM kwv_notifications WHERE user_id=%s AND is_read=0", (int(user['sub']),))
-        return {"count": cursor.fetchone()['cnt']}
+        return ORJSONResponse({"count": cursor.fetchone()['cnt']})
     finally:
         conn.close()
 
 @router.put("/notifications/{noti_id}/read")
-async def mark_notification_read(noti_id: int, user: dict = Depends(get_current_user)):
+def mark_notification_read(noti_id: int, user: dict = Depends(get_current_user)):
     """알림 읽음 처리"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -3730,7 +4715,7 @@ async def mark_notification_read(noti_id: int, user: dict = Depends(get_current_
         conn.close()
 
 @router.put("/notifications/read-all")
-async def mark_all_read(user: dict = Depends(get_current_user)):
+def mark_all_read(user: dict = Depends(get_current_user)):
     """모든 알림 읽음 처리"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -3744,7 +4729,7 @@ async def mark_all_read(user: dict = Depends(get_current_user)):
         conn.close()
 
 @router.post("/admin/notifications/send")
-async def send_notification(body: dict = Body(...), user: dict = Depends(get_current_user)):
+def send_notification(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """관리자 알림 전송"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3760,29 +4745,19 @@ async def send_notification(body: dict = Body(...), user: dict = Depends(get_cur
         if not title:
             raise HTTPException(400, "제목을 입력하세요")
 
-        user_ids = []
-        if target == "all":
-            cursor.execute("SELECT id FROM kwv_users WHERE is_active=1")
-            user_ids = [r[0] for r in cursor.fetchall()]
-        elif target == "admins":
-            cursor.execute("SELECT id FROM kwv_users WHERE admin_level >= 5")
-            user_ids = [r[0] for r in cursor.fetchall()]
-        elif target == "workers":
-            cursor.execute("SELECT id FROM kwv_users WHERE user_type='applicant' AND is_active=1")
-            user_ids = [r[0] for r in cursor.fetchall()]
+        if target in _NOTIFY_TARGET_WHERE:
+            _notify_group(cursor, target, title, message, ntype)
         else:
             try:
-                user_ids = [int(target)]
+                uid = int(target)
             except:
                 raise HTTPException(400, "유효하지 않은 대상")
-
-        for uid in user_ids:
             cursor.execute("""
                 INSERT INTO kwv_notifications (user_id, title, message, notification_type)
                 VALUES (%s, %s, %s, %s)
             """, (uid, title, message, ntype))
         conn.commit()
-        return {"success": True, "sent_count": len(user_ids)}
+        return {"success": True, "sent_count": cursor.rowcount}
     finally:
         conn.close()
 
@@ -3801,7 +4776,7 @@ class InsuranceCreate(BaseModel):
     note: Optional[str] = None
 
 @router.post("/admin/insurance")
-async def create_insurance(ins: InsuranceCreate, user: dict = Depends(get_current_user)):
+def create_insurance(ins: InsuranceCreate, user: dict = Depends(get_current_user)):
     """보험 등록"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3822,7 +4797,7 @@ async def create_insurance(ins: InsuranceCreate, user: dict = Depends(get_curren
         conn.close()
 
 @router.put("/admin/insurance/{ins_id}")
-async def update_insurance(ins_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
+def update_insurance(ins_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """보험 수정"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3846,7 +4821,7 @@ async def update_insurance(ins_id: int, body: dict = Body(...), user: dict = Dep
         conn.close()
 
 @router.delete("/admin/insurance/{ins_id}")
-async def delete_insurance(ins_id: int, user: dict = Depends(get_current_user)):
+def delete_insurance(ins_id: int, user: dict = Depends(get_current_user)):
     """보험 삭제"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3860,14 +4835,16 @@ async def delete_insurance(ins_id: int, user: dict = Depends(get_current_user)):
     finally:
         conn.close()
 
-@router.get("/admin/insurance")
-async def list_insurance(
+@router.get("/admin/insurance", response_class=ORJSONResponse)
+def list_insurance(
     user_id: int = None, insurance_type: str = None, status: str = None,
     page: int = 1, per_page: int = 20,
+    after: Optional[str] = None,
     user: dict = Depends(get_current_user)
 ):
-    """보험 목록 (관리자)"""
+    """보험 목록 (관리자, after=next_cursor("만료일|id") 전달 시 OFFSET 없이 다음 페이지 조회)"""
     require_admin(user)
+    after_key = _parse_cursor(after, (date.fromisoformat, int))
     conn = get_kwv_db_connection()
     if not conn:
         return {"items": [], "total": 0}
@@ -3887,27 +4864,33 @@ async def list_insurance(
         total = cursor.fetchone()['cnt']
 
         offset = (page - 1) * per_page
+        if after_key:
+            d, i = after_key
+            w += " AND (i.end_date > %s OR (i.end_date = %s AND i.id > %s))"
+            params += [d, d, i]
+            offset = 0
         cursor.execute(f"""
-            SELECT i.*, u.name as user_name, u.email as user_email
+            SELECT i.id, i.user_id, i.insurance_type, i.provider, i.policy_number,
+                   DATE_FORMAT(i.start_date, '%%Y-%%m-%%d') as start_date,
+                   DATE_FORMAT(i.end_date, '%%Y-%%m-%%d') as end_date,
+                   i.premium, i.coverage, i.status, i.note,
+                   u.name as user_name, u.email as user_email
             FROM kwv_insurance i
             JOIN kwv_users u ON u.id=i.user_id
             WHERE {w}
-            ORDER BY i.end_date ASC
+            ORDER BY i.end_date ASC, i.id ASC
             LIMIT %s OFFSET %s
         """, params + [per_page, offset])
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-                if isinstance(v, type(None)):
-                    pass
-        return {"items": items, "total": total, "page": page}
+        next_cursor = None
+        if len(items) == per_page:
+            next_cursor = f"{items[-1]['end_date']}|{items[-1]['id']}"
+        return ORJSONResponse({"items": items, "total": total, "page": page, "next_cursor": next_cursor})
     finally:
         conn.close()
 
-@router.get("/admin/insurance/expiring")
-async def expiring_insurance(days: int = 30, user: dict = Depends(get_current_user)):
+@router.get("/admin/insurance/expiring", response_class=ORJSONResponse)
+def expiring_insurance(days: int = 30, user: dict = Depends(get_current_user)):
     """만료 임박 보험"""
     require_admin(user)
     conn = get_kwv_db_connection()
@@ -3916,23 +4899,23 @@ async def expiring_insurance(days: int = 30, user: dict = Depends(get_current_us
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT i.*, u.name as user_name, u.email as user_email
+            SELECT i.id, i.user_id, i.insurance_type, i.provider, i.policy_number,
+                   DATE_FORMAT(i.start_date, '%%Y-%%m-%%d') as start_date,
+                   DATE_FORMAT(i.end_date, '%%Y-%%m-%%d') as end_date,
+                   i.premium, i.status,
+                   u.name as user_name, u.email as user_email
             FROM kwv_insurance i
             JOIN kwv_users u ON u.id=i.user_id
             WHERE i.status='active' AND i.end_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL %s DAY)
             ORDER BY i.end_date ASC
         """, (days,))
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items, "total": len(items)}
+        return ORJSONResponse({"items": items, "total": len(items)})
     finally:
         conn.close()
 
-@router.get("/insurance/my")
-async def my_insurance(user: dict = Depends(get_current_user)):
+@router.get("/insurance/my", response_class=ORJSONResponse)
+def my_insurance(user: dict = Depends(get_current_user)):
     """내 보험 목록"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -3940,21 +4923,21 @@ async def my_insurance(user: dict = Depends(get_current_user)):
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("""
-            SELECT * FROM kwv_insurance WHERE user_id=%s ORDER BY end_date DESC
+            SELECT i.id, i.insurance_type, i.provider, i.policy_number,
+                   DATE_FORMAT(i.start_date, '%%Y-%%m-%%d') as start_date,
+                   DATE_FORMAT(i.end_date, '%%Y-%%m-%%d') as end_date,
+                   i.premium, i.coverage, i.status, i.document_url, i.note
+            FROM kwv_insurance i WHERE i.user_id=%s ORDER BY i.end_date DESC
         """, (int(user['sub']),))
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items}
+        return ORJSONResponse({"items": items})
     finally:
         conn.close()
 
 # ==================== 공지사항 (Notices) ====================
 
-@router.get("/notices")
-async def list_notices(
+@router.get("/notices", response_class=ORJSONResponse)
+def list_notices(
     target_type: Optional[str] = None,
     local_government_id: Optional[int] = None,
     important_only: Optional[int] = 0
@@ -3966,7 +4949,11 @@ async def list_notices(
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
         sql = """
-            SELECT n.*, u.name as created_by_name,
+            SELECT n.id, n.title, n.content, n.target_type, n.local_government_id,
+                   n.is_important, n.is_active, n.view_count, n.created_by,
+                   DATE_FORMAT(n.created_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as created_at,
+                   DATE_FORMAT(n.updated_at, '%%Y-%%m-%%dT%%H:%%i:%%s') as updated_at,
+                   u.name as created_by_name,
                    lg.name as lg_name
             FROM kwv_notices n
             LEFT JOIN kwv_users u ON n.created_by = u.id
@@ -3985,25 +4972,80 @@ async def list_notices(
         sql += " ORDER BY n.is_important DESC, n.created_at DESC"
         cursor.execute(sql, params)
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items, "total": len(items)}
+        return ORJSONResponse({"items": items, "total": len(items)})
     finally:
         conn.close()
 
-@router.get("/notices/{notice_id}")
-async def get_notice(notice_id: int):
+class _NoticeViewCounter:
+    """공지 조회수 write-behind - 요청마다 UPDATE/COMMIT 하지 않고 모아서 주기적으로 한 문장으로 반영
+
+    마지막 주기의 증가분은 shutdown 시 반영 (비정상 종료 시 최대 FLUSH_INTERVAL초 분량 유실 허용)
+    """
+
+    FLUSH_INTERVAL = 5
+
+    def __init__(self):
+        self._counts = collections.Counter()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def hit(self, notice_id: int) -> int:
+        """조회 1회 기록 후 아직 DB에 반영되지 않은 증가분 반환"""
+        with self._lock:
+            self._counts[notice_id] += 1
+            pending = self._counts[notice_id]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="kwv-notice-views", daemon=True)
+                self._thread.start()
+        return pending
+
+    def _run(self):
+        while True:
+            time.sleep(self.FLUSH_INTERVAL)
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            counts, self._counts = self._counts, collections.Counter()
+        if not counts:
+            return
+        conn = get_kwv_db_connection()
+        if not conn:
+            self._restore(counts)
+            return
+        try:
+            cursor = conn.cursor()
+            cases = " ".join(["WHEN %s THEN %s"] * len(counts))
+            ids = ",".join(["%s"] * len(counts))
+            cursor.execute(
+                f"UPDATE kwv_notices SET view_count = view_count + CASE id {cases} ELSE 0 END WHERE id IN ({ids})",
+                [v for item in counts.items() for v in item] + list(counts))
+            conn.commit()
+        except Exception:
+            logger.exception("notice view count flush failed (notices=%d)", len(counts))
+            self._restore(counts)
+        finally:
+            conn.close()
+
+    def _restore(self, counts: collections.Counter):
+        """반영 실패분을 다음 주기로 되돌림"""
+        with self._lock:
+            self._counts.update(counts)
+
+_notice_views = _NoticeViewCounter()
+
+@router.on_event("shutdown")
+def _flush_notice_views():
+    _notice_views.flush()
+
+@router.get("/notices/{notice_id}", response_class=ORJSONResponse)
+def get_notice(notice_id: int):
     """공지사항 상세"""
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        # 조회수 증가
-        cursor.execute("UPDATE kwv_notices SET view_count = view_count + 1 WHERE id = %s", (notice_id,))
-        conn.commit()
         cursor.execute("""
             SELECT n.*, u.name as created_by_name, lg.name as lg_name
             FROM kwv_notices n
@@ -4014,17 +5056,15 @@ async def get_notice(notice_id: int):
         item = cursor.fetchone()
         if not item:
             raise HTTPException(status_code=404, detail="공지를 찾을 수 없습니다")
-        for k, v in item.items():
-            if isinstance(v, (datetime, date)):
-                item[k] = v.isoformat()
-        return item
+        # 조회수 증가는 모아서 반영 - 응답에는 미반영분까지 더해 표시
+        item['view_count'] = (item['view_count'] or 0) + _notice_views.hit(notice_id)
+        return ORJSONResponse(item)
     finally:
         conn.close()
 
 @router.post("/admin/notices")
-async def create_notice(request: Request, user: dict = Depends(get_current_user)):
+def create_notice(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """공지사항 작성 (관리자)"""
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
@@ -4046,9 +5086,8 @@ async def create_notice(request: Request, user: dict = Depends(get_current_user)
         conn.close()
 
 @router.put("/admin/notices/{notice_id}")
-async def update_notice(notice_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_notice(notice_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """공지사항 수정 (관리자)"""
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
@@ -4070,7 +5109,7 @@ async def update_notice(notice_id: int, request: Request, user: dict = Depends(g
         conn.close()
 
 @router.delete("/admin/notices/{notice_id}")
-async def delete_notice(notice_id: int, user: dict = Depends(get_current_user)):
+def delete_notice(notice_id: int, user: dict = Depends(get_current_user)):
     """공지사항 삭제 (관리자)"""
     conn = get_kwv_db_connection()
     if not conn:
@@ -4085,53 +5124,66 @@ async def delete_notice(notice_id: int, user: dict = Depends(get_current_user)):
 
 # ==================== 구인 관리 API (Jobs) ====================
 
-@router.get("/jobs")
-async def list_jobs(
+# 목록 필터 → 조건 (status는 항상 바인딩, 미지정 시 'active')
+_JOB_LIST_CONDITIONS = {
+    "visa_type": " AND EXISTS (SELECT 1 FROM kwv_job_visas v WHERE v.visa_code = %s AND v.job_id = j.id)",
+    "local_government_id": " AND j.local_government_id = %s",
+    "search": " AND CONCAT_WS(' ', j.title, j.location) LIKE %s",
+}
+
+# 필터 조합 → (목록 SQL, COUNT SQL) - 조합이 8가지뿐이라 크기 제한 없음
+_job_list_sql_cache = {}
+
+def _job_list_sql(filters: tuple) -> tuple:
+    sqls = _job_list_sql_cache.get(filters)
+    if sqls is None:
+        where = "WHERE j.deleted_at IS NULL AND j.status = %s" + "".join(_JOB_LIST_CONDITIONS[f] for f in filters)
+        # 목록 카드에 쓰는 컬럼만 (자격요건/복리후생/작성자/이미지는 상세 API)
+        sqls = (f"""
+            SELECT j.id, j.title, j.description, j.local_government_id, j.visa_types,
+                   j.positions, j.salary, j.period, j.location, j.contact_name,
+                   j.contact_phone, j.status, j.created_at, lg.name as lg_name,
+                   COUNT(*) OVER() AS total
+            FROM kwv_jobs j
+            LEFT JOIN kwv_local_governments lg ON j.local_government_id = lg.id
+            {where}
+            ORDER BY j.created_at DESC
+            LIMIT %s OFFSET %s
+        """, f"SELECT COUNT(*) AS total FROM kwv_jobs j {where}")
+        _job_list_sql_cache[filters] = sqls
+    return sqls
+
+@router.get("/jobs", response_class=ORJSONResponse)
+def list_jobs(
     visa_type: Optional[str] = None,
     local_government_id: Optional[int] = None,
-    status: Optional[str] = None
+    status: Optional[str] = None,
+    search: Optional[str] = Query(None, max_length=100),
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0)
 ):
-    """구인 목록 (공개)"""
-    conn = get_kwv_db_connection()
+    """구인 목록 (공개) - 제목/근무지 검색은 페이지 단위가 아닌 전체 대상"""
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         return {"items": []}
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        sql = """
-            SELECT j.*, u.name as created_by_name,
-                   lg.name as lg_name
-            FROM kwv_jobs j
-            LEFT JOIN kwv_users u ON j.created_by = u.id
-            LEFT JOIN kwv_local_governments lg ON j.local_government_id = lg.id
-            WHERE 1=1
-        """
-        params = []
-        if status:
-            sql += " AND j.status = %s"
-            params.append(status)
-        else:
-            sql += " AND j.status = 'active'"
-        if visa_type:
-            sql += " AND j.visa_types LIKE %s"
-            params.append(f"%{visa_type}%")
-        if local_government_id:
-            sql += " AND j.local_government_id = %s"
-            params.append(local_government_id)
-        sql += " ORDER BY j.created_at DESC"
-        cursor.execute(sql, params)
+        filter_values = {"visa_type": visa_type, "local_government_id": local_government_id,
+                         "search": f"%{search}%" if search else None}
+        filters = tuple(f for f in _JOB_LIST_CONDITIONS if filter_values[f])
+        list_sql, count_sql = _job_list_sql(filters)
+        params = [status or 'active'] + [filter_values[f] for f in filters]
+        cursor.execute(list_sql, params + [limit, offset])
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items, "total": len(items)}
+        total = _window_total(cursor, items, offset, count_sql, params)
+        return ORJSONResponse({"items": items, "total": total, "limit": limit, "offset": offset})
     finally:
         conn.close()
 
-@router.get("/jobs/{job_id}")
-async def get_job(job_id: int):
+@router.get("/jobs/{job_id}", response_class=ORJSONResponse)
+def get_job(job_id: int):
     """구인 상세"""
-    conn = get_kwv_db_connection()
+    conn = get_kwv_db_connection(readonly=True)
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
@@ -4141,23 +5193,27 @@ async def get_job(job_id: int):
             FROM kwv_jobs j
             LEFT JOIN kwv_users u ON j.created_by = u.id
             LEFT JOIN kwv_local_governments lg ON j.local_government_id = lg.id
-            WHERE j.id = %s
+            WHERE j.id = %s AND j.deleted_at IS NULL
         """, (job_id,))
         item = cursor.fetchone()
         if not item:
             raise HTTPException(status_code=404, detail="구인 공고를 찾을 수 없습니다")
-        for k, v in item.items():
-            if isinstance(v, (datetime, date)):
-                item[k] = v.isoformat()
-        return item
+        return ORJSONResponse(item)
     finally:
         conn.close()
 
+def _set_job_visas(cursor, job_id: int, visa_types: Optional[str]):
+    """콤마 구분 visa_types를 kwv_job_visas(필터용)에 반영 - 호출 측 트랜잭션에서 실행"""
+    codes = sorted({v.strip() for v in (visa_types or '').split(',') if v.strip()})
+    cursor.execute("DELETE FROM kwv_job_visas WHERE job_id = %s", (job_id,))
+    if codes:
+        cursor.executemany("INSERT INTO kwv_job_visas (visa_code, job_id) VALUES (%s, %s)",
+                           [(code, job_id) for code in codes])
+
 @router.post("/admin/jobs")
-async def create_job(request: Request, user: dict = Depends(get_current_user)):
+def create_job(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """구인 등록 (admin≥2)"""
     require_admin_level(user, 2)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
@@ -4185,16 +5241,17 @@ async def create_job(request: Request, user: dict = Depends(get_current_user)):
             body.get('image_url', ''),
             int(user['sub'])
         ))
+        job_id = cursor.lastrowid
+        _set_job_visas(cursor, job_id, body.get('visa_types', ''))
         conn.commit()
-        return {"message": "구인 공고가 등록되었습니다", "id": cursor.lastrowid}
+        return {"message": "구인 공고가 등록되었습니다", "id": job_id}
     finally:
         conn.close()
 
 @router.put("/admin/jobs/{job_id}")
-async def update_job(job_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_job(job_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """구인 수정 (admin≥2)"""
     require_admin_level(user, 2)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
@@ -4205,7 +5262,7 @@ async def update_job(job_id: int, request: Request, user: dict = Depends(get_cur
                 visa_types=%s, positions=%s, salary=%s, period=%s, location=%s,
                 requirements=%s, benefits=%s, contact_name=%s, contact_phone=%s,
                 contact_email=%s, status=%s, image_url=%s
-            WHERE id=%s
+            WHERE id=%s AND deleted_at IS NULL
         """, (
             body['title'], body.get('description', ''),
             body.get('local_government_id') or None,
@@ -4223,55 +5280,124 @@ async def update_job(job_id: int, request: Request, user: dict = Depends(get_cur
             body.get('image_url', ''),
             job_id
         ))
+        if cursor.rowcount == 0:
+            cursor.execute("SELECT 1 FROM kwv_jobs WHERE id = %s AND deleted_at IS NULL", (job_id,))
+            if not cursor.fetchone():
+                raise HTTPException(status_code=404, detail="구인 공고를 찾을 수 없습니다")
+        _set_job_visas(cursor, job_id, body.get('visa_types', ''))
         conn.commit()
         return {"message": "구인 공고가 수정되었습니다"}
     finally:
         conn.close()
 
 @router.delete("/admin/jobs/{job_id}")
-async def delete_job(job_id: int, user: dict = Depends(get_current_user)):
-    """구인 삭제 (admin≥3)"""
+def delete_job(job_id: int, user: dict = Depends(get_current_user)):
+    """구인 삭제 (admin≥3) - soft delete, 30일 후 백그라운드에서 영구 삭제"""
     require_admin_level(user, 3)
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        cursor.execute("DELETE FROM kwv_jobs WHERE id = %s", (job_id,))
+        cursor.execute("UPDATE kwv_jobs SET deleted_at = NOW() WHERE id = %s AND deleted_at IS NULL", (job_id,))
         conn.commit()
         return {"message": "구인 공고가 삭제되었습니다"}
     finally:
         conn.close()
 
+# 삭제된 공고 영구 삭제 (보관 30일, 1000건씩 나눠 잠금 시간 제한)
+_JOB_PURGE_DAYS = 30
+_JOB_PURGE_BATCH = 1000
+_JOB_PURGE_HOUR = 4  # 매일 새벽 4시 (재시작 시 즉시 실행하지 않음)
+_JOB_PURGE_CHECK_INTERVAL = 3600
+_JOB_PURGE_LOCK = "kwv_job_purge"
+
+def _purge_deleted_jobs():
+    """보관 기간이 지난 soft delete 공고를 배치 단위로 삭제 (kwv_job_visas는 FK CASCADE)"""
+    conn = get_kwv_db_connection()
+    if not conn:
+        return
+    try:
+        cursor = conn.cursor()
+        while True:
+            cursor.execute(
+                "DELETE FROM kwv_jobs WHERE deleted_at < NOW() - INTERVAL %s DAY LIMIT %s",
+                (_JOB_PURGE_DAYS, _JOB_PURGE_BATCH))
+            conn.commit()
+            if cursor.rowcount < _JOB_PURGE_BATCH:
+                break
+    except pymysql.MySQLError:
+        logger.exception("deleted job purge failed")
+    finally:
+        conn.close()
+
+def _job_purge_loop():
+    """워커마다 시작되지만 MySQL 이름 잠금(GET_LOCK)을 쥔 프로세스 하나만 삭제 실행
+    잠금 연결은 풀과 별도로 유지하고 매시간 확인(연결이 끊기면 다른 워커가 이어받음)"""
+    lock_conn = None
+    last_purge = None
+    while True:
+        time.sleep(_JOB_PURGE_CHECK_INTERVAL)
+        try:
+            if lock_conn is None:
+                _get_db_pool()  # .env 로드
+                lock_conn = _create_autocommit_connection()
+                cursor = lock_conn.cursor()
+                cursor.execute("SELECT GET_LOCK(%s, 0)", (_JOB_PURGE_LOCK,))
+            else:
+                cursor = lock_conn.cursor()
+                cursor.execute("SELECT IS_USED_LOCK(%s) = CONNECTION_ID()", (_JOB_PURGE_LOCK,))
+            if not cursor.fetchone()[0]:
+                lock_conn.close()
+                lock_conn = None
+        except pymysql.MySQLError:
+            if lock_conn is not None:
+                try:
+                    lock_conn.close()
+                except pymysql.MySQLError:
+                    pass
+            lock_conn = None
+        now = datetime.now()
+        if lock_conn is not None and now.hour == _JOB_PURGE_HOUR and last_purge != now.date():
+            last_purge = now.date()
+            _purge_deleted_jobs()
+
+@router.on_event("startup")
+def _start_job_purger():
+    if MOCK_MODE:
+        return
+    threading.Thread(target=_job_purge_loop, name="kwv-job-purge", daemon=True).start()
+
 @router.post("/jobs/{job_id}/apply")
-async def apply_for_job(job_id: int, request: Request, user: dict = Depends(get_current_user)):
+def apply_for_job(job_id: int, body: dict = Body(default={}), user: dict = Depends(get_current_user)):
     """구인에 지원"""
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        # 구인 공고 확인
-        cursor.execute("SELECT id, title, status FROM kwv_jobs WHERE id = %s", (job_id,))
-        job = cursor.fetchone()
-        if not job:
-            raise HTTPException(status_code=404, detail="구인 공고를 찾을 수 없습니다")
-        if job['status'] != 'active':
-            raise HTTPException(status_code=400, detail="현재 지원 가능한 공고가 아닙니다")
-        body = await request.json()
-        user_id = int(user['sub'])
-        # 알림 생성 (관리자에게)
+        user_name = user.get('name', user.get('email', ''))
+        # 활성 공고일 때만 관리자 알림 생성 (공고 확인 + INSERT 한 문장)
         try:
-            user_name = user.get('name', user.get('email', ''))
             cursor.execute("""
-                INSERT INTO kwv_notifications (user_id, type, title, message)
-                SELECT id, 'info', %s, %s FROM kwv_users WHERE user_type = 'admin' AND admin_level >= 2 AND is_active = TRUE
-            """, (
-                f"구직 지원: {job['title']}",
-                f"{user_name}님이 '{job['title']}' 공고에 지원했습니다. 메시지: {body.get('message', '')}"
-            ))
-        except:
-            pass
+                INSERT INTO kwv_notifications (user_id, notification_type, title, message)
+                SELECT u.id, 'info', CONCAT('구직 지원: ', j.title), CONCAT(%s, j.title, %s)
+                FROM kwv_jobs j
+                JOIN kwv_users u ON u.user_type = 'admin' AND u.admin_level >= 2 AND u.is_active = TRUE
+                WHERE j.id = %s AND j.status = 'active' AND j.deleted_at IS NULL
+            """, (f"{user_name}님이 '", f"' 공고에 지원했습니다. 메시지: {body.get('message', '')}", job_id))
+            notified = cursor.rowcount
+        except pymysql.MySQLError:
+            logger.exception("job application notification failed")
+            notified = 0
+        if not notified:
+            # 알림이 없으면 공고 상태 확인 (없는 공고/마감 공고/활성 관리자 없음 구분)
+            cursor.execute("SELECT status FROM kwv_jobs WHERE id = %s AND deleted_at IS NULL", (job_id,))
+            job = cursor.fetchone()
+            if not job:
+                raise HTTPException(status_code=404, detail="구인 공고를 찾을 수 없습니다")
+            if job['status'] != 'active':
+                raise HTTPException(status_code=400, detail="현재 지원 가능한 공고가 아닙니다")
         conn.commit()
         return {"message": "지원이 완료되었습니다"}
     finally:
@@ -4279,11 +5405,17 @@ async def apply_for_job(job_id: int, request: Request, user: dict = Depends(get_
 
 # ==================== 관리자 관리 API ====================
 
+# 관리자 목록 캐시 (관리자 추가/수정/삭제 시 무효화)
+_admin_list_cache = _TTLCache(maxsize=1, ttl=60)
+
 @router.get("/admin/admins")
-async def list_admins(user: dict = Depends(get_current_user)):
-    """관리자 목록 (admin≥3)"""
+def list_admins(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
+    """관리자 목록 (admin≥3) - ETag로 변경 없으면 304"""
     require_admin_level(user, 3)
-    conn = get_kwv_db_connection()
+    cached = _admin_list_cache.get("all")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match)
+    conn = get_kwv_db_connection(autocommit=True)
     if not conn:
         return {"items": []}
     try:
@@ -4296,78 +5428,91 @@ async def list_admins(user: dict = Depends(get_current_user)):
             ORDER BY admin_level DESC, created_at ASC
         """)
         items = cursor.fetchall()
-        for item in items:
-            for k, v in item.items():
-                if isinstance(v, (datetime, date)):
-                    item[k] = v.isoformat()
-        return {"items": items, "total": len(items)}
+        payload = json_payload({"items": items, "total": len(items)})
+        _admin_list_cache.set("all", payload)
+        return json_payload_response(payload, if_none_match)
     finally:
         conn.close()
 
 @router.post("/admin/admins")
-async def create_admin(request: Request, user: dict = Depends(get_current_user)):
+def create_admin(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """관리자 추가 (admin≥9 = super admin only)"""
     require_admin_level(user, 9)
-    body = await request.json()
+    # bcrypt 해시(~100ms)는 DB 연결을 빌리기 전에 계산
+    hashed_pw = hash_password(body.get('password', DEFAULT_PASSWORD))
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        # 이메일 중복 체크
-        cursor.execute("SELECT id FROM kwv_users WHERE email = %s", (body['email'],))
-        if cursor.fetchone():
-            raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
-        hashed_pw = hash_password(body.get('password', DEFAULT_PASSWORD))
-        cursor.execute("""
-            INSERT INTO kwv_users (email, name, password, phone, organization,
-                user_type, admin_level, is_active, is_approved)
-            VALUES (%s, %s, %s, %s, %s, 'admin', %s, 1, 1)
-        """, (
-            body['email'], body['name'], hashed_pw,
-            body.get('phone', ''),
-            body.get('organization', ''),
-            body.get('admin_level', 1)
-        ))
+        # 이메일 중복은 kwv_users.email UNIQUE 제약으로 판별 (사전 SELECT 없음)
+        try:
+            cursor.execute("""
+                INSERT INTO kwv_users (email, name, password, phone, organization,
+                    user_type, admin_level, is_active, is_approved)
+                VALUES (%s, %s, %s, %s, %s, 'admin', %s, 1, 1)
+            """, (
+                body['email'], body['name'], hashed_pw,
+                body.get('phone', ''),
+                body.get('organization', ''),
+                body.get('admin_level', 1)
+            ))
+        except pymysql.err.IntegrityError as e:
+            if e.args and e.args[0] == 1062:
+                conn.rollback()
+                raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
+            raise
         conn.commit()
+        _admin_list_cache.clear()
         return {"message": "관리자가 추가되었습니다", "id": cursor.lastrowid}
     finally:
         conn.close()
 
+_ADMIN_UPDATE_FIELDS = ('name', 'phone', 'organization', 'admin_level', 'is_active', 'is_approved')
+
+# SET 절 조합 → UPDATE SQL (조합 수가 유한하므로 크기 제한 없음)
+_admin_update_sql_cache = {}
+
+def _admin_update_sql(fields: tuple) -> str:
+    sql = _admin_update_sql_cache.get(fields)
+    if sql is None:
+        sql = f"UPDATE kwv_users SET {', '.join(fields)} WHERE id = %s AND user_type = 'admin'"
+        _admin_update_sql_cache[fields] = sql
+    return sql
+
 @router.put("/admin/admins/{admin_id}")
-async def update_admin(admin_id: int, request: Request, user: dict = Depends(get_current_user)):
+def update_admin(admin_id: int, body: dict = Body(...), user: dict = Depends(get_current_user)):
     """관리자 정보/등급 수정 (admin≥9)"""
     require_admin_level(user, 9)
-    body = await request.json()
+    hashed_pw = hash_password(body['password']) if body.get('password') else None
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
         cursor = conn.cursor(pymysql.cursors.DictCursor)
-        fields = []
-        params = []
-        for field in ['name', 'phone', 'organization', 'admin_level', 'is_active', 'is_approved']:
-            if field in body:
-                fields.append(f"{field} = %s")
-                params.append(body[field])
+        present = [f for f in _ADMIN_UPDATE_FIELDS if f in body]
+        fields = [f"{f} = %s" for f in present]
+        params = [body[f] for f in present]
         # 승인 시 approved_at 설정
         if body.get('is_approved') or (body.get('admin_level') and int(body.get('admin_level', 0)) > 0):
             fields.append("is_approved = TRUE")
             fields.append("approved_at = NOW()")
-        if 'password' in body and body['password']:
+        if hashed_pw:
             fields.append("password = %s")
-            params.append(hash_password(body['password']))
+            params.append(hashed_pw)
         if not fields:
             return {"message": "변경할 내용이 없습니다"}
         params.append(admin_id)
-        cursor.execute(f"UPDATE kwv_users SET {', '.join(fields)} WHERE id = %s AND user_type = 'admin'", params)
+        cursor.execute(_admin_update_sql(tuple(fields)), params)
         conn.commit()
+        _admin_list_cache.clear()
+        _user_profile_cache.pop(str(admin_id))
         return {"message": "관리자 정보가 수정되었습니다"}
     finally:
         conn.close()
 
 @router.delete("/admin/admins/{admin_id}")
-async def delete_admin(admin_id: int, user: dict = Depends(get_current_user)):
+def delete_admin(admin_id: int, user: dict = Depends(get_current_user)):
     """관리자 삭제 (admin≥9, 자기 자신 삭제 불가)"""
     require_admin_level(user, 9)
     if int(user['sub']) == admin_id:
@@ -4379,6 +5524,8 @@ async def delete_admin(admin_id: int, user: dict = Depends(get_current_user)):
         cursor = conn.cursor(pymysql.cursors.DictCursor)
         cursor.execute("UPDATE kwv_users SET is_active = 0 WHERE id = %s AND user_type = 'admin'", (admin_id,))
         conn.commit()
+        _admin_list_cache.clear()
+        _user_profile_cache.pop(str(admin_id))
         return {"message": "관리자가 삭제되었습니다"}
     finally:
         conn.close()
@@ -4386,40 +5533,44 @@ async def delete_admin(admin_id: int, user: dict = Depends(get_current_user)):
 # ==================== 테마 설정 API ====================
 
 @router.get("/admin/theme")
-async def get_theme_settings(user: dict = Depends(get_current_user)):
-    """테마 설정 조회"""
-    conn = get_kwv_db_connection()
+def get_theme_settings(user: dict = Depends(get_current_user), if_none_match: Optional[str] = Header(None)):
+    """테마 설정 조회 - ETag로 변경 없으면 304"""
+    cached = _settings_cache.get("theme")
+    if cached is not None:
+        return json_payload_response(cached, if_none_match)
+    conn = get_kwv_db_connection(autocommit=True)
     if not conn:
         return {}
     try:
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        cursor = conn.cursor()
         cursor.execute("SELECT setting_key, setting_value FROM kwv_system_settings WHERE setting_key LIKE 'theme_%'")
-        rows = cursor.fetchall()
-        result = {}
-        for row in rows:
-            result[row['setting_key']] = row['setting_value']
-        return result
+        payload = json_payload(dict(cursor.fetchall()))
+        _settings_cache.set("theme", payload)
+        return json_payload_response(payload, if_none_match)
     finally:
         conn.close()
 
 @router.put("/admin/theme")
-async def update_theme_settings(request: Request, user: dict = Depends(get_current_user)):
+def update_theme_settings(body: dict = Body(...), user: dict = Depends(get_current_user)):
     """테마 설정 저장 (admin≥3)"""
     require_admin_level(user, 3)
-    body = await request.json()
     conn = get_kwv_db_connection()
     if not conn:
         raise HTTPException(status_code=500, detail="DB 연결 실패")
     try:
-        cursor = conn.cursor(pymysql.cursors.DictCursor)
-        for key in ['theme_preset', 'theme_header_bg_start', 'theme_header_bg_end', 'theme_menu_active_color']:
-            if key in body:
-                cursor.execute("""
-                    INSERT INTO kwv_system_settings (setting_key, setting_value, setting_type, description, updated_by)
-                    VALUES (%s, %s, 'string', %s, %s)
-                    ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value), updated_by = VALUES(updated_by)
-                """, (key, body[key], f'테마: {key}', int(user['sub'])))
+        cursor = conn.cursor()
+        params_list = [(key, body[key], 'string', f'테마: {key}', int(user['sub']))
+                       for key in ['theme_preset', 'theme_header_bg_start', 'theme_header_bg_end', 'theme_menu_active_color']
+                       if key in body]
+        if params_list:
+            # 단일 multi-row INSERT로 전송 (VALUES가 모두 %s여야 pymysql이 한 문장으로 묶음)
+            cursor.executemany("""
+                INSERT INTO kwv_system_settings (setting_key, setting_value, setting_type, description, updated_by)
+                VALUES (%s, %s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value), updated_by = VALUES(updated_by)
+            """, params_list)
         conn.commit()
+        _settings_cache.clear()
         return {"message": "테마 설정이 저장되었습니다"}
     finally:
         conn.close()
@@ -7,111 +7,111 @@ KoreaWorkingVisa 독립 서버
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, RedirectResponse
+from dotenv import load_dotenv
+from pathlib import Path
 import os
 
-# FastAPI 앱 생성
+load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
+
+from kwv_api import router as kwv_router, ORJSONResponse
+
+# FastAPI 앱 생성 (기본 응답 직렬화: orjson)
 app = FastAPI(
     title="Korea Working Visa API",
     description="비자 신청자 및 관리자 포털",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# CORS 설정
+# CORS 설정 - 인증은 Authorization 헤더(쿠키 미사용)라 credentials 불필요
+# KWV_CORS_ORIGINS: 허용 출처 (콤마 구분, 미설정 시 전체 허용), preflight는 브라우저가 하루 캐시
+cors_origins = [o.strip() for o in os.getenv("KWV_CORS_ORIGINS", "*").split(",") if o.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=cors_origins,
+    allow_credentials=False,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+    max_age=86400,
 )
 
+# 응답 압축 (1KB 이상, 클라이언트가 gzip 지원 시 - 스트리밍 응답은 청크 단위로 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # KWV API 라우터 추가
-from kwv_api import router as kwv_router
 app.include_router(kwv_router)
 
 # 프론트엔드 디렉토리
 frontend_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "frontend")
 
+# 정적 파일 브라우저 캐시 (만료 후에는 ETag/Last-Modified로 재검증)
+HTML_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=60"
+ASSET_CACHE_CONTROL = "public, max-age=86400"
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles + Cache-Control 헤더 (html은 짧게, 그 외 자산은 하루)"""
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers.setdefault(
+            "Cache-Control",
+            HTML_CACHE_CONTROL if str(full_path).endswith(".html") else ASSET_CACHE_CONTROL
+        )
+        return response
+
 # 정적 파일 서빙
 if os.path.exists(frontend_dir):
     admin_dir = os.path.join(frontend_dir, "admin")
     if os.path.exists(admin_dir):
-        app.mount("/admin", StaticFiles(directory=admin_dir, html=True), name="admin")
+        app.mount("/admin", CachedStaticFiles(directory=admin_dir, html=True), name="admin")
 
     applicant_dir = os.path.join(frontend_dir, "applicant")
     if os.path.exists(applicant_dir):
-        app.mount("/applicant", StaticFiles(directory=applicant_dir, html=True), name="applicant")
+        app.mount("/applicant", CachedStaticFiles(directory=applicant_dir, html=True), name="applicant")
 
     js_dir = os.path.join(frontend_dir, "js")
     if os.path.exists(js_dir):
-        app.mount("/js", StaticFiles(directory=js_dir), name="js")
+        app.mount("/js", CachedStaticFiles(directory=js_dir), name="js")
 
     videos_dir = os.path.join(frontend_dir, "videos")
     if os.path.exists(videos_dir):
-        app.mount("/videos", StaticFiles(directory=videos_dir), name="videos")
+        app.mount("/videos", CachedStaticFiles(directory=videos_dir), name="videos")
 
 # 루트 페이지 -> 랜딩 페이지로 리다이렉트
 @app.get("/")
 async def root():
     return RedirectResponse(url="/kwv-landing.html")
 
-# 랜딩 페이지
-@app.get("/kwv-landing.html")
-async def serve_landing():
-    landing_path = os.path.join(frontend_dir, "kwv-landing.html")
-    if os.path.exists(landing_path):
-        return FileResponse(landing_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-login.html")
-
-# 통합 로그인 페이지
-@app.get("/kwv-login.html")
-async def serve_login():
-    login_path = os.path.join(frontend_dir, "kwv-login.html")
-    if os.path.exists(login_path):
-        return FileResponse(login_path, media_type="text/html")
-    return {"error": "Login page not found"}
-
-# 회원가입 페이지
-@app.get("/kwv-register.html")
-async def serve_register():
-    register_path = os.path.join(frontend_dir, "kwv-register.html")
-    if os.path.exists(register_path):
-        return FileResponse(register_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-login.html")
-
-# Google OAuth 콜백 페이지
-@app.get("/kwv-google-callback.html")
-async def serve_google_callback():
-    callback_path = os.path.join(frontend_dir, "kwv-google-callback.html")
-    if os.path.exists(callback_path):
-        return FileResponse(callback_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-login.html")
-
-# MOU 쇼케이스 페이지
-@app.get("/kwv-mou-showcase.html")
-async def serve_mou_showcase():
-    mou_path = os.path.join(frontend_dir, "kwv-mou-showcase.html")
-    if os.path.exists(mou_path):
-        return FileResponse(mou_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-landing.html")
-
-# 개인정보처리방침 페이지
-@app.get("/kwv-privacy.html")
-async def serve_privacy():
-    privacy_path = os.path.join(frontend_dir, "kwv-privacy.html")
-    if os.path.exists(privacy_path):
-        return FileResponse(privacy_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-landing.html")
-
-# 대시보드 페이지
-@app.get("/kwv-dashboard.html")
-async def serve_dashboard():
-    dashboard_path = os.path.join(frontend_dir, "kwv-dashboard.html")
-    if os.path.exists(dashboard_path):
-        return FileResponse(dashboard_path, media_type="text/html")
-    return RedirectResponse(url="/kwv-login.html")
+# 단독 페이지: 파일명 -> 파일이 없을 때 리다이렉트 경로
+# (frontend 전체를 "/"에 마운트하면 스크립트/구버전 파일까지 노출되므로 목록으로 제한)
+KWV_PAGES = {
+    "kwv-landing.html": "/kwv-login.html",          # 랜딩 페이지
+    "kwv-login.html": None,                         # 통합 로그인 페이지
+    "kwv-register.html": "/kwv-login.html",         # 회원가입 페이지
+    "kwv-google-callback.html": "/kwv-login.html",  # Google OAuth 콜백 페이지
+    "kwv-mou-showcase.html": "/kwv-landing.html",   # MOU 쇼케이스 페이지
+    "kwv-privacy.html": "/kwv-landing.html",        # 개인정보처리방침 페이지
+    "kwv-dashboard.html": "/kwv-login.html",        # 대시보드 페이지
+}
+
+def _page_endpoint(page_path: str, fallback):
+    """페이지 핸들러 생성 - 파일 존재 여부는 시작 시 1회만 확인"""
+    if os.path.exists(page_path):
+        async def serve_page():
+            return FileResponse(page_path, media_type="text/html",
+                                headers={"Cache-Control": HTML_CACHE_CONTROL})
+    elif fallback:
+        async def serve_page():
+            return RedirectResponse(url=fallback)
+    else:
+        async def serve_page():
+            return {"error": "Login page not found"}
+    return serve_page
+
+for page_name, page_fallback in KWV_PAGES.items():
+    app.get(f"/{page_name}")(_page_endpoint(os.path.join(frontend_dir, page_name), page_fallback))
 
 if __name__ == "__main__":
     import uvicorn
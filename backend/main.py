@@ -12,6 +12,7 @@ from fastapi import FastAPI, File, UploadFile, HTTPException, Query, Form, Reque
 from auth import router as auth_router
 from kwv_api import router as kwv_router
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from typing import Optional, List
@@ -105,6 +106,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (1KB 이상, 클라이언트가 gzip 지원 시 - 스트리밍 응답은 청크 단위로 압축)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # 3D 모델 파일 (GLB) 서빙
 from fastapi.responses import FileResponse
 from fastapi import HTTPException
@@ -0,0 +1,7 @@
+-- =====================================================
+-- Migration 0015: 지자체 목록 조회 인덱스
+-- GET /local-governments (is_active 필터 + region, name 정렬)
+-- =====================================================
+
+ALTER TABLE kwv_local_governments
+    ADD INDEX IF NOT EXISTS idx_lg_list (is_active, region, name);
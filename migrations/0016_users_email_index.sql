@@ -0,0 +1,8 @@
+-- =====================================================
+-- Migration 0016: kwv_users 이메일 중복 인덱스 정리
+-- email UNIQUE 키가 로그인 조회(email = %s)를 이미 커버하므로
+-- 같은 컬럼의 보조 인덱스 idx_email은 쓰기 비용만 늘림
+-- =====================================================
+
+ALTER TABLE kwv_users
+    DROP INDEX IF EXISTS idx_email;
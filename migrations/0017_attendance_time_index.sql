@@ -0,0 +1,8 @@
+-- =====================================================
+-- Migration 0017: 출퇴근 기록 사업장+시간 인덱스
+-- 관리자 조회/일별 요약의 workplace_id + check_time 범위 검색
+-- (user_id + check_time은 idx_user_date가 이미 커버)
+-- =====================================================
+
+ALTER TABLE kwv_attendance
+    ADD INDEX IF NOT EXISTS idx_workplace_time (workplace_id, check_time);
@@ -0,0 +1,7 @@
+-- =====================================================
+-- Migration 0018: 사업장별 활성 배정 인원 집계 인덱스
+-- GET /workplaces 의 workplace_id + status = 'active' 집계
+-- =====================================================
+
+ALTER TABLE kwv_worker_assignments
+    ADD INDEX IF NOT EXISTS idx_workplace_status (workplace_id, status);
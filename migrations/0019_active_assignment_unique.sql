@@ -0,0 +1,12 @@
+-- =====================================================
+-- Migration 0019: 근로자-사업장 활성 배정 중복 방지
+-- status = 'active'인 행만 active_key = 1 (그 외 NULL)
+-- → (user_id, workplace_id, active_key) UNIQUE로 활성 배정은 1건만 허용,
+--   종료/취소된 배정 이력은 NULL이라 여러 건 허용
+-- 적용 전 같은 근로자·사업장의 활성 배정이 2건 이상이면 정리 필요
+-- =====================================================
+
+ALTER TABLE kwv_worker_assignments
+    ADD COLUMN IF NOT EXISTS active_key TINYINT
+        GENERATED ALWAYS AS (IF(status = 'active', 1, NULL)) STORED,
+    ADD UNIQUE INDEX IF NOT EXISTS uk_active_assignment (user_id, workplace_id, active_key);
@@ -0,0 +1,7 @@
+-- =====================================================
+-- Migration 0020: 월별 가입 추이 조회 인덱스
+-- GET /admin/statistics/monthly (user_type + 최근 12개월 created_at 범위)
+-- =====================================================
+
+ALTER TABLE kwv_users
+    ADD INDEX IF NOT EXISTS idx_user_type_created (user_type, created_at);
@@ -0,0 +1,11 @@
+-- =====================================================
+-- Migration 0021: 출퇴근 5분 중복 체크를 UNIQUE 제약으로 처리
+-- time_bucket = check_time의 5분(300초) 구간 번호
+-- 같은 근로자·사업장·체크 유형은 구간당 1건만 저장 (중복 시 1062 → API 429)
+-- 적용 전 같은 구간에 중복 기록이 있으면 정리 필요
+-- =====================================================
+
+ALTER TABLE kwv_attendance
+    ADD COLUMN IF NOT EXISTS time_bucket INT
+        GENERATED ALWAYS AS (FLOOR(UNIX_TIMESTAMP(check_time) / 300)) STORED,
+    ADD UNIQUE INDEX IF NOT EXISTS uk_attendance_dedup (user_id, workplace_id, check_type, time_bucket);
@@ -0,0 +1,18 @@
+-- =====================================================
+-- Migration 0022: 근로자별 포인트 합계 요약 테이블
+-- kwv_points 적립 시 같은 트랜잭션에서 total_points를 증감 (API에서 갱신)
+-- 포인트 랭킹은 전체 GROUP BY 대신 이 테이블을 정렬해 조회
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS kwv_user_points_total (
+    user_id INT PRIMARY KEY,
+    total_points INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_total_points (total_points),
+    FOREIGN KEY (user_id) REFERENCES kwv_users(id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- 기존 포인트 내역으로 합계 채우기 (재실행 시 다시 계산)
+INSERT INTO kwv_user_points_total (user_id, total_points)
+SELECT user_id, SUM(points) FROM kwv_points GROUP BY user_id
+ON DUPLICATE KEY UPDATE total_points = VALUES(total_points);
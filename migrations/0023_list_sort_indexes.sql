@@ -0,0 +1,35 @@
+-- =====================================================
+-- Migration 0023: 활동일지/상담일지/포인트 목록용 복합 인덱스
+-- 목록 정렬(날짜 DESC, created_at DESC)과 필터 컬럼을 묶어
+-- 인덱스 역순 스캔으로 filesort 없이 페이지를 읽도록 함
+-- 앞부분이 같은 단일 컬럼 인덱스는 복합 인덱스가 대신함 (FK 포함)
+-- =====================================================
+
+ALTER TABLE kwv_activity_logs
+    ADD INDEX IF NOT EXISTS idx_status_date (status, activity_date, created_at),
+    ADD INDEX IF NOT EXISTS idx_user_date (user_id, activity_date, created_at),
+    ADD INDEX IF NOT EXISTS idx_date_created (activity_date, created_at);
+
+ALTER TABLE kwv_activity_logs
+    DROP INDEX IF EXISTS idx_status,
+    DROP INDEX IF EXISTS idx_user,
+    DROP INDEX IF EXISTS idx_date;
+
+ALTER TABLE kwv_counseling
+    ADD INDEX IF NOT EXISTS idx_status_date (status, counseling_date, created_at),
+    ADD INDEX IF NOT EXISTS idx_user_date (user_id, counseling_date, created_at),
+    ADD INDEX IF NOT EXISTS idx_date_created (counseling_date, created_at);
+
+ALTER TABLE kwv_counseling
+    DROP INDEX IF EXISTS idx_status,
+    DROP INDEX IF EXISTS idx_user,
+    DROP INDEX IF EXISTS idx_date;
+
+ALTER TABLE kwv_points
+    ADD INDEX IF NOT EXISTS idx_user_created (user_id, created_at),
+    ADD INDEX IF NOT EXISTS idx_type_created (point_type, created_at),
+    ADD INDEX IF NOT EXISTS idx_created (created_at);
+
+ALTER TABLE kwv_points
+    DROP INDEX IF EXISTS idx_user,
+    DROP INDEX IF EXISTS idx_type;
@@ -0,0 +1,12 @@
+-- =====================================================
+-- Migration 0024: 출퇴근 기록 시간 범위 커버링 인덱스
+-- 미퇴근 이상감지(최근 14일 user_id·일자별 집계)가
+-- check_time 범위 스캔만으로 user_id/check_type까지 읽도록 함
+-- idx_check_time은 새 인덱스의 앞부분과 같아 제거
+-- =====================================================
+
+ALTER TABLE kwv_attendance
+    ADD INDEX IF NOT EXISTS idx_time_user_type (check_time, user_id, check_type);
+
+ALTER TABLE kwv_attendance
+    DROP INDEX IF EXISTS idx_check_time;
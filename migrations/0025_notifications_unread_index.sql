@@ -0,0 +1,12 @@
+-- =====================================================
+-- Migration 0025: 알림 사용자+읽음 여부 복합 인덱스
+-- 전체 읽음 처리(UPDATE ... WHERE user_id AND is_read=0)와
+-- 안읽은 알림 수 COUNT를 인덱스 범위만 읽도록 함
+-- idx_user는 새 인덱스의 앞부분과 같아 제거 (FK는 새 인덱스 사용)
+-- =====================================================
+
+ALTER TABLE kwv_notifications
+    ADD INDEX IF NOT EXISTS idx_user_read (user_id, is_read);
+
+ALTER TABLE kwv_notifications
+    DROP INDEX IF EXISTS idx_user;
@@ -0,0 +1,15 @@
+-- =====================================================
+-- Migration 0026: 이상감지/알림 목록 keyset 페이지용 인덱스
+-- 이상감지: score DESC, created_at DESC, id DESC 정렬
+-- 알림: user_id 별 created_at DESC, id DESC 정렬
+-- (보험 목록 end_date, id 정렬은 idx_end가 PK 포함으로 커버)
+-- =====================================================
+
+ALTER TABLE kwv_anomalies
+    ADD INDEX IF NOT EXISTS idx_score_created (score, created_at);
+
+ALTER TABLE kwv_anomalies
+    DROP INDEX IF EXISTS idx_score;
+
+ALTER TABLE kwv_notifications
+    ADD INDEX IF NOT EXISTS idx_user_created (user_id, created_at);
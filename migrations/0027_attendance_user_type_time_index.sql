@@ -0,0 +1,9 @@
+-- =====================================================
+-- Migration 0027: 출퇴근 기록 근로자+유형+시간 인덱스
+-- 연속 결근 이상감지의 근로자별 마지막 출근 시각
+-- (WHERE user_id AND check_type='check_in' → MAX(check_time))을
+-- 인덱스 끝 한 건만 읽어 구하도록 함
+-- =====================================================
+
+ALTER TABLE kwv_attendance
+    ADD INDEX IF NOT EXISTS idx_user_type_time (user_id, check_type, check_time);
@@ -0,0 +1,26 @@
+-- =====================================================
+-- Migration 0029: 구인 공고 비자 유형 자식 테이블
+-- kwv_jobs.visa_types(콤마 구분)는 표시용으로 두고,
+-- 비자 유형 필터는 (visa_code, job_id) PK로 조회 (LIKE '%..%' 전체 스캔 제거)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS kwv_job_visas (
+    visa_code VARCHAR(20) NOT NULL COMMENT '비자 유형 (E-9 등)',
+    job_id INT NOT NULL COMMENT '구인 공고 ID',
+    PRIMARY KEY (visa_code, job_id),
+    INDEX idx_job (job_id),
+    FOREIGN KEY (job_id) REFERENCES kwv_jobs(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 기존 공고 visa_types 분해 (공고당 최대 10개)
+INSERT IGNORE INTO kwv_job_visas (visa_code, job_id)
+SELECT code, job_id FROM (
+    SELECT TRIM(SUBSTRING_INDEX(SUBSTRING_INDEX(j.visa_types, ',', n.n), ',', -1)) AS code,
+           j.id AS job_id
+    FROM kwv_jobs j
+    JOIN (SELECT 1 AS n UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 UNION ALL SELECT 5
+          UNION ALL SELECT 6 UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9 UNION ALL SELECT 10) n
+      ON n.n <= 1 + CHAR_LENGTH(j.visa_types) - CHAR_LENGTH(REPLACE(j.visa_types, ',', ''))
+    WHERE j.visa_types IS NOT NULL AND j.visa_types != ''
+) v
+WHERE code != '';
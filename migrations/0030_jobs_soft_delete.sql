@@ -0,0 +1,19 @@
+-- =====================================================
+-- Migration 0030: 구인 공고 soft delete + 목록 인덱스
+-- 삭제 시 deleted_at만 기록하고, 30일 지난 행은 백그라운드에서 배치 삭제
+-- 구인 목록(WHERE status AND deleted_at IS NULL ORDER BY created_at DESC LIMIT)을
+-- 인덱스 순서대로 읽고 정렬(filesort) 없이 페이지만 가져오도록 함
+-- (idx_status는 새 인덱스의 앞부분이라 제거)
+-- =====================================================
+
+ALTER TABLE kwv_jobs
+    ADD COLUMN IF NOT EXISTS deleted_at DATETIME NULL COMMENT '삭제 시각 (NULL = 정상)';
+
+ALTER TABLE kwv_jobs
+    ADD INDEX IF NOT EXISTS idx_status_deleted_created (status, deleted_at, created_at, local_government_id);
+
+ALTER TABLE kwv_jobs
+    DROP INDEX IF EXISTS idx_status;
+
+ALTER TABLE kwv_jobs
+    ADD INDEX IF NOT EXISTS idx_deleted (deleted_at);